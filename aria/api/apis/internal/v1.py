@@ -18,17 +18,7 @@ from aria.api.exception_handlers import (
 from aria.api.exceptions import PageOutOfBoundsError
 from aria.api_auth.authentication import JWTAuthStaffRequired
 from aria.api_auth.exceptions import TokenError
-from aria.categories.endpoints import (
-    internal_endpoints as internal_categories_endpoints,
-)
 from aria.core.exceptions import ApplicationError
-from aria.notes.endpoints import internal_endpoints as internal_notes_endpoints
-from aria.product_attributes.endpoints import (
-    internal_endpoints as internal_product_attributes_endpoints,
-)
-from aria.products.endpoints import internal_endpoints as internal_products_endpoints
-from aria.suppliers.endpoints import internal_endpoints as internal_suppliers_endpoints
-from aria.users.endpoints import internal_endpoints as internal_users_endpoints
 
 #####################
 # API configuration #
@@ -42,12 +32,14 @@ api_internal = AriaAPI(
     auth=JWTAuthStaffRequired(),
 )
 
-api_internal.add_router("/categories/", internal_categories_endpoints)
-api_internal.add_router("/notes/", internal_notes_endpoints)
-api_internal.add_router("/users/", internal_users_endpoints)
-api_internal.add_router("/product-attributes/", internal_product_attributes_endpoints)
-api_internal.add_router("/products/", internal_products_endpoints)
-api_internal.add_router("/suppliers/", internal_suppliers_endpoints)
+api_internal.add_router("/categories/", "aria.categories.endpoints.internal.router")
+api_internal.add_router("/notes/", "aria.notes.endpoints.private.router")
+api_internal.add_router("/users/", "aria.users.endpoints.internal.router")
+api_internal.add_router(
+    "/product-attributes/", "aria.product_attributes.endpoints.internal.router"
+)
+api_internal.add_router("/products/", "aria.products.endpoints.internal.router")
+api_internal.add_router("/suppliers/", "aria.suppliers.endpoints.internal.router")
 
 
 ######################
@@ -15,18 +15,8 @@ from aria.api.exception_handlers import (
     validation_error_exception_handler,
 )
 from aria.api.exceptions import PageOutOfBoundsError
-from aria.api_auth.endpoints import public_endpoints as public_auth_endpoints
 from aria.api_auth.exceptions import TokenError
-from aria.categories.endpoints import public_endpoints as public_categories_endpoints
-from aria.core.endpoints import public_endpoints as public_core_endpoints
 from aria.core.exceptions import ApplicationError
-from aria.discounts.endpoints import public_endpoints as public_discount_endpoints
-from aria.employees.endpoints import public_endpoints as public_employees_endpoints
-from aria.front.endpoints import public_endpoints as public_front_endpoints
-from aria.kitchens.endpoints import public_endpoints as public_kitchens_endpoints
-from aria.products.endpoints import public_endpoints as public_products_endpoints
-from aria.suppliers.endpoints import public_endpoints as public_suppliers_endpoints
-from aria.users.endpoints import public_endpoints as public_users_endpoints
 
 #####################
 # API configuration #
@@ -39,16 +29,16 @@ api = AriaAPI(
     auth=None,
 )
 
-api.add_router("/auth/", public_auth_endpoints)
-api.add_router("/categories/", public_categories_endpoints)
-api.add_router("/core/", public_core_endpoints)
-api.add_router("/discounts/", public_discount_endpoints)
-api.add_router("/employees/", public_employees_endpoints)
-api.add_router("/front/", public_front_endpoints)
-api.add_router("/kitchens/", public_kitchens_endpoints)
-api.add_router("/products/", public_products_endpoints)
-api.add_router("/suppliers/", public_suppliers_endpoints)
-api.add_router("/users/", public_users_endpoints)
+api.add_router("/auth/", "aria.api_auth.endpoints.public.router")
+api.add_router("/categories/", "aria.categories.endpoints.public.router")
+api.add_router("/core/", "aria.core.endpoints.public.router")
+api.add_router("/discounts/", "aria.discounts.endpoints.public.router")
+api.add_router("/employees/", "aria.employees.endpoints.public.router")
+api.add_router("/front/", "aria.front.endpoints.public.router")
+api.add_router("/kitchens/", "aria.kitchens.endpoints.public.router")
+api.add_router("/products/", "aria.products.endpoints.public.router")
+api.add_router("/suppliers/", "aria.suppliers.endpoints.public.router")
+api.add_router("/users/", "aria.users.endpoints.public.router")
 
 
 ######################
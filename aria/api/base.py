@@ -1,18 +1,51 @@
-from typing import Callable, Sequence, Union
+from typing import Any, Callable, Sequence, Union
+
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.urls import URLPattern, URLResolver
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
 
 from ninja import NinjaAPI, Router
 from ninja.constants import NOT_SET, NOT_SET_TYPE
+from ninja.openapi.schema import OpenAPISchema
 from ninja.operation import Operation
 from ninja.types import TCallable
 
+from aria.api.conditional import conditional_response_for_request, etag_for_content
 from aria.api.parsers import CamelCaseParser
 from aria.api.renderers import CamelCaseRenderer
+from aria.core.performance import request_performance_measure_render
+
+
+class LazyURLPatterns:
+    """
+    Url configuration of an API, building its url patterns, and thereby importing
+    its routers, when first resolving or reversing an url within the API.
+    """
+
+    def __init__(self, *, api: "AriaAPI") -> None:
+        self.api = api
+
+    @cached_property
+    def urlpatterns(self) -> list[URLResolver | URLPattern]:
+        """
+        Url patterns of the API, read by Django's URLResolver.
+        """
+
+        self.api.routers_import()
+        self.api._validate()  # pylint: disable=protected-access
+        return self.api._get_urls()  # pylint: disable=protected-access
 
 
 class AriaAPI(NinjaAPI):  # pylint: disable=too-many-instance-attributes
     """
     Base class to create APIs. Inherits Django Ninjas base NinjaAPI, but overrides
     default renders and parsers, as well as how url_namespaces are generated.
+
+    Routers are added by their dotted path, and imported when the url patterns or
+    the OpenAPI schema of the API is first needed, rather than when the url
+    configuration is imported.
     """
 
     def __init__(
@@ -35,6 +68,90 @@ class AriaAPI(NinjaAPI):  # pylint: disable=too-many-instance-attributes
         self.parser = CamelCaseParser()
         self.auth = auth  # type: ignore
         self.docs_decorator = docs_decorator
+        self._lazy_routers: list[tuple[str, str, dict[str, Any]]] = []
+        self._openapi_schemas: dict[str | None, OpenAPISchema] = {}
+
+    def add_router(self, prefix: str, router: Router | str, **kwargs: Any) -> None:
+        """
+        Override to accept the dotted path to a router, e.g.
+        "aria.products.endpoints.public.router", deferring its import.
+        """
+
+        if isinstance(router, str):
+            self._lazy_routers.append((prefix, router, kwargs))
+            return
+
+        super().add_router(prefix, router, **kwargs)
+
+    def routers_import(self) -> None:
+        """
+        Import and add routers added by their dotted path, in the order they were
+        added.
+        """
+
+        while self._lazy_routers:
+            prefix, router_path, kwargs = self._lazy_routers.pop(0)
+            super().add_router(prefix, import_string(router_path), **kwargs)
+
+    @property
+    def urls(self) -> tuple[Any, str, str]:
+        """
+        Override to defer importing routers and building url patterns until the
+        first url within the API is resolved or reversed. The url configuration is
+        a LazyURLPatterns rather than a list of url patterns.
+        """
+
+        return (
+            LazyURLPatterns(api=self),
+            "ninja",
+            self.urls_namespace.split(":")[-1],
+        )
+
+    def get_openapi_schema(self, path_prefix: str | None = None) -> OpenAPISchema:
+        """
+        Override to import routers before generating the schema, and to generate
+        it once, as it's only requested by the docs and by export_schema.
+        """
+
+        if path_prefix not in self._openapi_schemas:
+            self.routers_import()
+            self._openapi_schemas[path_prefix] = super().get_openapi_schema(
+                path_prefix=path_prefix
+            )
+
+        return self._openapi_schemas[path_prefix]
+
+    def create_response(  # type: ignore
+        self,
+        request: HttpRequest,
+        data: Any,
+        *,
+        status: int | None = None,
+        temporal_response: HttpResponse | None = None,
+    ) -> HttpResponseBase:
+        """
+        Override to answer conditional requests for operations decorated with
+        @conditional, either by the version ETag set by the decorator, or by an
+        ETag based on the rendered content.
+        """
+
+        with request_performance_measure_render():
+            response = super().create_response(
+                request, data, status=status, temporal_response=temporal_response  # type: ignore # pylint: disable=line-too-long
+            )
+
+        max_age: int | None = getattr(request, "_conditional_max_age", None)
+
+        if max_age is None or response.status_code != 200:
+            return response
+
+        etag = getattr(request, "_conditional_etag", None) or etag_for_content(
+            response.content
+        )
+
+        return conditional_response_for_request(  # type: ignore
+            request, etag=etag, max_age=max_age, response=response
+        )
 
     def get_operation_url_name(self, operation: Operation, router: Router) -> str:
         """
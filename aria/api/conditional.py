@@ -0,0 +1,68 @@
+import hashlib
+
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+
+def etag_for_version(version: str) -> str:
+    """
+    Get a quoted ETag for a version, e.g. the version of a cached value.
+    """
+
+    return quote_etag(version)
+
+
+def etag_for_content(content: bytes) -> str:
+    """
+    Get a quoted ETag based on a hash of rendered content.
+    """
+
+    return quote_etag(hashlib.md5(content, usedforsecurity=False).hexdigest())
+
+
+def response_patch_conditional_headers(
+    response: HttpResponseBase, *, etag: str, max_age: int
+) -> HttpResponseBase:
+    """
+    Set ETag and Cache-Control headers on a response, allowing clients and CDNs to
+    cache and revalidate it.
+    """
+
+    response.headers["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=max_age)
+
+    return response
+
+
+def conditional_response_for_request(
+    request: HttpRequest,
+    *,
+    etag: str,
+    max_age: int,
+    response: HttpResponse | None = None,
+) -> HttpResponseBase | None:
+    """
+    Get a 304 Not Modified response if the ETag matches the one sent by the client
+    in the If-None-Match header, otherwise None.
+
+    If a response is passed, its headers are patched, and it is returned as is if
+    the client does not have a matching copy already.
+    """
+
+    if response is not None:
+        response_patch_conditional_headers(response, etag=etag, max_age=max_age)
+
+    conditional_response = get_conditional_response(
+        request, etag=etag, response=response
+    )
+
+    if conditional_response is None or conditional_response is response:
+        return conditional_response
+
+    return response_patch_conditional_headers(
+        conditional_response, etag=etag, max_age=max_age
+    )
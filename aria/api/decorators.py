@@ -1,5 +1,9 @@
+import asyncio
+import inspect
 from functools import partial, wraps
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Tuple, cast
+
+from django.http import HttpRequest
 
 from ninja.compatibility.util import get_args as get_collection_args
 from ninja.constants import NOT_SET
@@ -8,6 +12,11 @@ from ninja.operation import Operation
 from ninja.signature.details import is_collection_type
 from ninja.types import DictStrAny
 
+from aria.api.conditional import (
+    CONDITIONAL_METHODS,
+    conditional_response_for_request,
+    etag_for_version,
+)
 from aria.api.pagination import PageNumberSetPagination
 
 SUPPORTED_HTTP_METHODS = ["GET", "POST", "DELETE", "PATCH", "PUT"]
@@ -28,6 +37,126 @@ def paginate(**paginator_params: Any) -> Callable[[Callable[..., Any]], Any]:
     return wrapper
 
 
+def conditional(
+    *, version: Callable[..., str | None] | None = None, max_age: int = 60
+) -> Callable[[Callable[..., Any]], Any]:
+    """
+    Support conditional requests (ETag/If-None-Match) for a GET operation, and
+    mark the response as cacheable for max_age seconds.
+
+    If a version callable is passed, typically the version helper of a @cached
+    selector, it's called with the same arguments as the view (except the
+    request), and used as ETag. When the client already has a matching copy,
+    304 Not Modified is returned without running the view or rendering anything.
+    When no version is available, the ETag is based on the rendered content.
+
+    @api(...)
+    @conditional(version=lambda: my_selector_from_cache.version(), max_age=60)
+    def my_view(request):
+
+    Async views are supported as well, in which case the version callable may be
+    async too, typically the aversion helper of a @cached selector.
+
+    @api(...)
+    @conditional(version=my_selector_from_cache.aversion, max_age=60)
+    async def my_view(request):
+    """
+
+    def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(func):
+            return _conditional_async(func, version=version, max_age=max_age)
+
+        @wraps(func)
+        def view_with_conditional(
+            request: HttpRequest, *args: Any, **kwargs: Any
+        ) -> Any:
+            if request.method not in CONDITIONAL_METHODS:
+                return func(request, *args, **kwargs)
+
+            current_version = version(*args, **kwargs) if version else None
+
+            if current_version is not None:
+                not_modified_response = conditional_response_for_request(
+                    request, etag=etag_for_version(current_version), max_age=max_age
+                )
+
+                if not_modified_response is not None:
+                    return not_modified_response
+
+            result = func(request, *args, **kwargs)
+
+            # The view might have (re)populated the cache, so get the version
+            # again to hand out an ETag we're able to validate without rendering
+            # on subsequent requests.
+            if version is not None:
+                current_version = version(*args, **kwargs)
+
+            # Picked up by the api when creating the response.
+            request._conditional_etag = (  # type: ignore
+                etag_for_version(current_version) if current_version else None
+            )
+            request._conditional_max_age = max_age  # type: ignore
+
+            return result
+
+        return view_with_conditional
+
+    return wrapper
+
+
+def _conditional_async(
+    func: Callable[..., Any],
+    *,
+    version: Callable[..., Any] | None,
+    max_age: int,
+) -> Callable[..., Any]:
+    """
+    Async counterpart of the @conditional decorator.
+    """
+
+    async def get_version(*args: Any, **kwargs: Any) -> str | None:
+        if version is None:
+            return None
+
+        current_version = version(*args, **kwargs)
+
+        if inspect.isawaitable(current_version):
+            current_version = await current_version
+
+        return cast(str | None, current_version)
+
+    @wraps(func)
+    async def view_with_conditional(
+        request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> Any:
+        if request.method not in CONDITIONAL_METHODS:
+            return await func(request, *args, **kwargs)
+
+        current_version = await get_version(*args, **kwargs)
+
+        if current_version is not None:
+            not_modified_response = conditional_response_for_request(
+                request, etag=etag_for_version(current_version), max_age=max_age
+            )
+
+            if not_modified_response is not None:
+                return not_modified_response
+
+        result = await func(request, *args, **kwargs)
+
+        if version is not None:
+            current_version = await get_version(*args, **kwargs)
+
+        request._conditional_etag = (  # type: ignore
+            etag_for_version(current_version) if current_version else None
+        )
+        request._conditional_max_age = max_age  # type: ignore
+
+        return result
+
+    return view_with_conditional
+
+
 def _inject_pagination(
     func: Callable[..., Any],
     **paginator_params: Any,
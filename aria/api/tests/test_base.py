@@ -0,0 +1,105 @@
+import subprocess
+import sys
+
+from django.conf import settings
+
+import ninja.main
+from ninja import Router
+
+from aria.api import base
+from aria.api.base import AriaAPI
+
+# Budget for the number of modules imported by the url configuration, once Django
+# is set up. Counting modules, rather than timing their import, keeps the test
+# independent of the load of the machine running it. Importing every router
+# imported ~160 modules, taking ~300 ms, before routers were imported lazily.
+URLS_IMPORT_MODULES_BUDGET = 75
+
+# A router can only be added to a single api, hence a router per test.
+lazy_router = Router(tags=["Lazy"])
+schema_router = Router(tags=["Schema"])
+
+
+@lazy_router.get("example/")
+@schema_router.get("example/")
+def example_endpoint(request):  # type: ignore
+    """
+    Endpoint for testing routers.
+    """
+
+    return {}
+
+
+class TestAPIBase:
+    def test_add_router_lazy(self, mocker) -> None:
+        """
+        Test that routers added by their dotted path are imported when the url
+        patterns of the api are first built.
+        """
+
+        import_string_spy = mocker.spy(base, "import_string")
+        api = AriaAPI(urls_namespace="test-lazy-routers")
+        api.add_router("/lazy/", "aria.api.tests.test_base.lazy_router")
+
+        urlconf, _app_name, namespace = api.urls
+
+        assert namespace == "test-lazy-routers-1.0.0"
+        assert import_string_spy.call_count == 0
+
+        url_names = [pattern.name for pattern in urlconf.urlpatterns]
+
+        assert import_string_spy.call_count == 1
+        assert "lazy-example" in url_names
+
+        urlconf.urlpatterns  # pylint: disable=pointless-statement
+
+        assert import_string_spy.call_count == 1
+
+    def test_get_openapi_schema(self, mocker) -> None:
+        """
+        Test that the OpenAPI schema includes lazily added routers, and is only
+        generated once.
+        """
+
+        get_schema_spy = mocker.spy(ninja.main, "get_schema")
+        api = AriaAPI(urls_namespace="test-lazy-schema")
+        api.add_router("/schema/", "aria.api.tests.test_base.schema_router")
+
+        schema = api.get_openapi_schema(path_prefix="")
+
+        assert "/schema/example/" in schema["paths"]
+        assert api.get_openapi_schema(path_prefix="") is schema
+        assert get_schema_spy.call_count == 1
+
+    def test_urls_import_time(self) -> None:
+        """
+        Test that importing the url configuration doesn't import any endpoints,
+        and that the modules it imports stay within budget.
+        """
+
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                "import sys, django; django.setup(); print('setup', file=sys.stderr); "
+                "import aria.urls",
+            ],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stderr
+
+        # Lines are formatted as "import time: self [us] | cumulative | package",
+        # only those printed after setting up Django are imported by aria.urls.
+        packages = [
+            line.rsplit("|", 1)[1].strip()
+            for line in output.split("\nsetup\n", 1)[1].splitlines()
+            if line.startswith("import time:")
+        ]
+
+        assert "aria.urls" in packages
+        assert not [package for package in packages if ".endpoints." in package]
+        assert len(packages) < URLS_IMPORT_MODULES_BUDGET
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the table against writes, which can't be
+    # done within a transaction.
+    atomic = False
+
+    dependencies = [
+        ('audit_logs', '0004_rename_date_of_change_logentry_created_at_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='logentry',
+            index=models.Index(fields=['content_type', 'object_id', '-created_at'], name='log_entry_object_created_idx'),
+        ),
+    ]
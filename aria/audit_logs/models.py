@@ -37,6 +37,13 @@ class LogEntry(models.Model):
     class Meta:
         verbose_name = "Audit log entry"
         verbose_name_plural = "Audit log entries"
+        indexes = [
+            # Log of an object, newest first.
+            models.Index(
+                fields=["content_type", "object_id", "-created_at"],
+                name="log_entry_object_created_idx",
+            ),
+        ]
         permissions = (
             ("has_audit_logs_list", "Can view audit logs"),
             ("has_audit_logs_edit", "Can edit a single log instance"),
@@ -1,4 +0,0 @@
-from aria.categories.endpoints.internal import router as internal_endpoints
-from aria.categories.endpoints.public import router as public_endpoints
-
-__all__ = ["public_endpoints", "internal_endpoints"]
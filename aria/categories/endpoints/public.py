@@ -1,8 +1,10 @@
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 
+from asgiref.sync import sync_to_async
 from ninja import Router
 
+from aria.api.decorators import conditional
 from aria.categories.models import Category
 from aria.categories.schemas.outputs import (
     CategoryChildrenListOutput,
@@ -24,13 +26,18 @@ router = Router(tags=["Categories"])
     response={200: list[CategoryListOutput]},
     summary="List all active categories and children",
 )
-def category_list_api(request: HttpRequest) -> list[CategoryListOutput]:
+@conditional(
+    version=category_navigation_active_list_from_cache.aversion  # type: ignore
+)
+async def category_list_api(request: HttpRequest) -> list[CategoryListOutput]:
     """
     Retrieves a list of all primary and secondary categories, primarily
     used for routing in the frontend navbar.
     """
 
-    categories = category_navigation_active_list_from_cache()
+    categories = (
+        await category_navigation_active_list_from_cache.acall()  # type: ignore
+    )
 
     return [CategoryListOutput(**category.dict()) for category in categories]
 
@@ -40,11 +47,14 @@ def category_list_api(request: HttpRequest) -> list[CategoryListOutput]:
     response={200: list[CategoryParentListOutput]},
     summary="List all active primary categories",
 )
-def category_parent_list_api(request: HttpRequest) -> list[CategoryParentListOutput]:
+@conditional()
+async def category_parent_list_api(
+    request: HttpRequest,
+) -> list[CategoryParentListOutput]:
     """
     Retrieves a list of all primary categories.
     """
-    parent_categories = category_parent_active_list()
+    parent_categories = await sync_to_async(category_parent_active_list)()
 
     return [
         CategoryParentListOutput(**category.dict()) for category in parent_categories
@@ -56,16 +66,21 @@ def category_parent_list_api(request: HttpRequest) -> list[CategoryParentListOut
     response={200: CategoryDetailOutput},
     summary="Retrieve a specific category",
 )
-def category_detail_api(
+@conditional()
+async def category_detail_api(
     request: HttpRequest, category_slug: str
 ) -> tuple[int, CategoryDetailOutput]:
     """
     Retrieve details of a specific category, parent
     or child.
     """
-    category = get_object_or_404(Category, slug=category_slug)
 
-    return 200, CategoryDetailOutput.from_orm(category)
+    def get_category_detail() -> CategoryDetailOutput:
+        # Images are resolved when serializing, which might touch storage.
+        category = get_object_or_404(Category, slug=category_slug)
+        return CategoryDetailOutput.from_orm(category)
+
+    return 200, await sync_to_async(get_category_detail)()
 
 
 @router.get(
@@ -73,16 +88,26 @@ def category_detail_api(
     response={200: list[CategoryChildrenListOutput]},
     summary="List all active children categories belonging to a parent",
 )
-def category_children_list_api(
+@conditional()
+async def category_children_list_api(
     request: HttpRequest, category_slug: str
 ) -> list[CategoryChildrenListOutput]:
     """
     Retrieves a list of all children categories connected to a
     specific parent.
     """
-    parent_category = get_object_or_404(Category, slug=category_slug)
-    children_categories = category_children_active_list_for_category(
-        category=parent_category
-    )
 
-    return [CategoryChildrenListOutput(**child.dict()) for child in children_categories]
+    def get_children_categories() -> list[CategoryChildrenListOutput]:
+        parent_category = get_object_or_404(Category, slug=category_slug)
+        children_categories = category_children_active_list_for_category(
+            category=parent_category
+        )
+        return [
+            CategoryChildrenListOutput(**child.dict()) for child in children_categories
+        ]
+
+    children: list[CategoryChildrenListOutput] = await sync_to_async(
+        get_children_categories
+    )()
+
+    return children
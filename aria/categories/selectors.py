@@ -1,6 +1,11 @@
+from collections import defaultdict
+from operator import attrgetter
+
+from django.db.models import Q
+
 from aria.categories.models import Category
 from aria.categories.records import CategoryDetailRecord, CategoryRecord
-from aria.core.decorators import cached
+from aria.core.decorators import cached, query_budget
 from aria.files.records import BaseCollectionListImageRecord, BaseHeaderImageRecord
 from aria.products.models import Product
 
@@ -23,13 +28,22 @@ def category_record(*, category: Category) -> CategoryRecord:
     )
 
 
-def category_detail_record(*, category: Category) -> CategoryDetailRecord:
+def category_detail_record(
+    *,
+    category: Category,
+    parents: list[CategoryRecord] | None = None,
+    children: list[CategoryRecord] | None = None,
+) -> CategoryDetailRecord:
     """
     Get the detail record representation for a single category instance.
+    Parents and children are queried if not passed.
     """
 
-    parents = category_parents_active_list_for_category(category=category)
-    children = category_children_active_list_for_category(category=category)
+    if parents is None:
+        parents = category_parents_active_list_for_category(category=category)
+
+    if children is None:
+        children = category_children_active_list_for_category(category=category)
 
     return CategoryDetailRecord(
         id=category.id,
@@ -46,6 +60,7 @@ def category_detail_record(*, category: Category) -> CategoryDetailRecord:
     )
 
 
+@query_budget(max_queries=1)
 def category_navigation_active_list() -> list[CategoryDetailRecord]:
     """
     Returns a list of active navigation categories.
@@ -117,8 +132,10 @@ def category_children_active_list_for_category(
 
     # Check if cached children exist. If not cached, filter
     # children to get active, as it gets all children by default.
+    # Cached children are sorted in python, as chaining the queryset discards the
+    # cache, making a query per category.
     if hasattr(category, "_cached_children"):
-        children = category.get_children().select_related("parent").order_by("ordering")
+        children = sorted(category.get_children(), key=attrgetter("ordering"))
     else:
         children = (
             category.get_children()
@@ -146,11 +163,117 @@ def category_tree_active_list_for_product(
     prefetched_active_categories = getattr(product, "active_categories", None)
 
     if prefetched_active_categories is not None:
-        active_categories = prefetched_active_categories
+        active_categories = list(prefetched_active_categories)
     else:
         # If prefetched value does not exist, fall back to a queryset.
-        active_categories = (
-            product.categories.active().select_related("parent").order_by("-mptt_level")
+        active_categories = list(
+            product.categories.active()
+            .select_related("parent__parent")
+            .order_by("-mptt_level")
+        )
+
+    if not active_categories:
+        return []
+
+    # Parents and children of all categories are queried at once, instead of
+    # once per category.
+    parents_by_category_id = _category_parents_active_map_for_categories(
+        categories=active_categories
+    )
+    children_by_category_id = _category_children_active_map_for_categories(
+        categories=active_categories
+    )
+
+    return [
+        category_detail_record(
+            category=category,
+            parents=parents_by_category_id[category.id],
+            children=children_by_category_id[category.id],
+        )
+        for category in active_categories
+    ]
+
+
+def _category_parents_active_map_for_categories(
+    *, categories: list[Category]
+) -> dict[int, list[CategoryRecord]]:
+    """
+    Get active parents of each of the given categories, keyed by category id,
+    being the same as category_parents_active_list_for_category returns.
+    """
+
+    ancestors_filter = Q()
+
+    for category in categories:
+        ancestors_filter |= Q(
+            mptt_tree_id=category.mptt_tree_id,
+            mptt_left__lt=category.mptt_left,
+            mptt_right__gt=category.mptt_right,
+        )
+
+    ancestors = list(
+        Category.objects.filter(ancestors_filter)
+        .select_related("parent")
+        .active()
+        .order_by("mptt_tree_id", "mptt_left")
+    )
+    parents_by_category_id = {}
+
+    for category in categories:
+        category_ancestors = [
+            ancestor
+            for ancestor in ancestors
+            if ancestor.mptt_tree_id == category.mptt_tree_id
+            and ancestor.mptt_left < category.mptt_left
+            and ancestor.mptt_right > category.mptt_right
+        ]
+        # As with get_cached_trees(), only the ancestors of the highest level
+        # are considered parents.
+        parents_by_category_id[category.id] = [
+            category_record(category=ancestor)
+            for ancestor in category_ancestors
+            if ancestor.mptt_level == category_ancestors[0].mptt_level
+        ]
+
+    return parents_by_category_id
+
+
+def _category_children_active_map_for_categories(
+    *, categories: list[Category]
+) -> dict[int, list[CategoryRecord]]:
+    """
+    Get active children of each of the given categories, keyed by category id.
+    Children prefetched to the active_children attribute are used if they exist,
+    children of the remaining categories are fetched in a single query.
+    """
+
+    children_by_category_id: dict[int, list[Category]] = defaultdict(list)
+    categories_without_prefetched_children = []
+
+    for category in categories:
+        prefetched_children = getattr(category, "active_children", None)
+
+        if prefetched_children is not None:
+            children_by_category_id[category.id] = list(prefetched_children)
+        else:
+            categories_without_prefetched_children.append(category)
+
+    if categories_without_prefetched_children:
+        children = (
+            Category.objects.filter(parent__in=categories_without_prefetched_children)
+            .select_related("parent__parent")
+            .active()
         )
 
-    return [category_detail_record(category=category) for category in active_categories]
+        for child in children:
+            children_by_category_id[child.parent_id].append(child)
+
+    return {
+        category.id: [
+            category_record(category=child)
+            for child in sorted(
+                children_by_category_id[category.id], key=attrgetter("ordering")
+            )
+        ]
+        for category in categories
+    }
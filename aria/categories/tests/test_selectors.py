@@ -35,9 +35,9 @@ class TestCategoriesSelectors:
         main_cat_2 = create_category(name="Main cat 2")
         main_cat_2_sub_1 = create_category("Sub cat 2.1", parent=main_cat_2)
 
-        # Uses 3 queries: 1 for getting categories, 1 for getting parents and
-        # 1 for getting children.
-        with django_assert_max_num_queries(3):
+        # Uses 1 query for getting categories, parents and children are taken from
+        # the cached tree.
+        with django_assert_max_num_queries(1):
             categories = category_navigation_active_list()
 
         assert len(categories) == 2
@@ -134,41 +134,65 @@ class TestCategoriesSelectors:
         cat_1 = create_category(name="Category")
         subcat_1 = create_category(name="Subcategory 1", parent=cat_1)
         subcat_2 = create_category(name="Subcategory 2", parent=cat_1)
+        subcat_2_child_1 = create_category(name="Sub subcategory 1", parent=subcat_2)
+        subcat_2_child_2 = create_category(name="Sub subcategory 2", parent=subcat_2)
+        cat_2 = create_category(name="Category 2")
+        subcat_3 = create_category(name="Subcategory 3", parent=cat_2)
+        subcat_3_child_1 = create_category(name="Sub subcategory 3", parent=subcat_3)
 
         product = create_product()
-        product.categories.set([subcat_1, subcat_2])
+        product.categories.set([subcat_1, subcat_2, subcat_3, subcat_3_child_1])
 
         # Test without prefetching first.
-        # Uses 3 queries: 1 for getting product category, 1 for getting parents,
-        # and 1 for getting children.
+        # Uses 3 queries, regardless of the number of categories: 1 for getting
+        # product categories, 1 for getting parents, and 1 for getting children.
         with django_assert_max_num_queries(3):
             category_tree = category_tree_active_list_for_product(product=product)
 
         sorted_category_tree = sorted(category_tree, key=lambda c: c.id)
 
-        assert len(sorted_category_tree) == 2  # The two subcategories.
+        assert len(sorted_category_tree) == 4
         assert sorted_category_tree[0].id == subcat_1.id
+        assert sorted_category_tree[0].parents[0].id == cat_1.id
+        assert sorted_category_tree[0].children == []
         assert sorted_category_tree[1].id == subcat_2.id
+        assert [child.id for child in sorted_category_tree[1].children] == [
+            subcat_2_child_1.id,
+            subcat_2_child_2.id,
+        ]
+        assert sorted_category_tree[2].id == subcat_3.id
+        assert sorted_category_tree[2].parents[0].id == cat_2.id
+        assert sorted_category_tree[2].children[0].id == subcat_3_child_1.id
+        assert (
+            sorted_category_tree[2].children[0].display_name
+            == "Category 2 > Subcategory 3 > Sub subcategory 3"
+        )
+        assert sorted_category_tree[3].id == subcat_3_child_1.id
+        assert len(sorted_category_tree[3].parents) == 1
+        assert sorted_category_tree[3].parents[0].id == cat_2.id
+
+        for category in sorted_category_tree:
+            assert category.parents == category_parents_active_list_for_category(
+                category=Category.objects.get(id=category.id)
+            )
+            assert category.children == category_children_active_list_for_category(
+                category=Category.objects.get(id=category.id)
+            )
 
         prefetched_product = (
             Product.objects.filter(id=product.id).with_active_categories().first()
         )
 
-        # Test without prefetching first.
-        # Uses 2 queries: 1 for getting parents and 1 for getting children.
-        with django_assert_max_num_queries(2):
+        # Uses 1 query for getting parents, as children are prefetched.
+        with django_assert_max_num_queries(1):
             prefetched_category_tree = category_tree_active_list_for_product(
                 product=prefetched_product
             )
 
-        sorted_prefetched_category_tree = sorted(
-            prefetched_category_tree, key=lambda c: c.id
+        assert sorted(prefetched_category_tree, key=lambda c: c.id) == (
+            sorted_category_tree
         )
 
-        assert len(sorted_prefetched_category_tree) == 2
-        assert sorted_prefetched_category_tree[0].id == subcat_1.id
-        assert sorted_prefetched_category_tree[1].id == subcat_2.id
-
     def test_category_detail_record(self, django_assert_max_num_queries) -> None:
         """
         Test the category_detail_record selector returns expected response
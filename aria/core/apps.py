@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = "aria.core"
+
+    def ready(self) -> None:
+        import aria.core.signals  # noqa: F401 pylint: disable=unused-import
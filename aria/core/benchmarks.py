@@ -0,0 +1,180 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connections
+
+from aria.core.performance import QueryRecorder, RequestPerformance
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Result of benchmarking a single function. Durations are in milliseconds and
+    memory in KiB.
+    """
+
+    name: str
+    rounds: int
+    wall_time_min: float
+    wall_time_median: float
+    num_queries: int
+    peak_memory: float
+
+    def dict(self) -> dict[str, Any]:
+        """
+        Dictionary representation of the result, as stored in baselines.
+        """
+
+        return asdict(self)
+
+
+def benchmark(*, name: str, func: Callable[[], Any], rounds: int) -> BenchmarkResult:
+    """
+    Benchmark a function by calling it a number of rounds, measuring wall time.
+    Queries and peak memory are measured in a separate round, as tracing memory
+    allocations slows down execution considerably.
+    """
+
+    durations = []
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    performance = RequestPerformance()
+
+    with ExitStack() as stack:
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(QueryRecorder(performance)))
+
+        tracemalloc.start()
+
+        try:
+            func()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        wall_time_min=round(min(durations), 2),
+        wall_time_median=round(statistics.median(durations), 2),
+        num_queries=performance.num_queries,
+        peak_memory=round(peak_memory / 1024, 2),
+    )
+
+
+# Run in a new interpreter per round, printing durations in milliseconds, the
+# number of queries made when warming up and the maximum resident memory in KiB.
+_STARTUP_SCRIPT = """
+import json, resource, time
+start = time.perf_counter()
+from {application_module} import application
+import_duration = (time.perf_counter() - start) * 1000
+import_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+from django.db import connections
+from aria.core.performance import QueryRecorder, RequestPerformance
+from aria.core.warmup import warmup
+performance = RequestPerformance()
+start = time.perf_counter()
+with connections["default"].execute_wrapper(QueryRecorder(performance)):
+    warmup()
+print(json.dumps({{
+    "import_duration": import_duration,
+    "import_memory": import_memory,
+    "warmup_duration": (time.perf_counter() - start) * 1000,
+    "warmup_num_queries": performance.num_queries,
+    "warmup_memory": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def benchmark_startup(*, application_module: str, rounds: int) -> list[BenchmarkResult]:
+    """
+    Benchmark starting a server process, by importing the application module,
+    e.g. "aria.asgi", and warming it up as done before forking workers, see
+    aria.gunicorn_config. Each round is run in a new interpreter. Peak memory is
+    the maximum resident memory of the process, rather than memory allocated
+    while measuring.
+    """
+
+    measurements = []
+
+    for _ in range(rounds):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _STARTUP_SCRIPT.format(application_module=application_module),
+            ],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        measurements.append(json.loads(output.splitlines()[-1]))
+
+    return [
+        BenchmarkResult(
+            name=f"{step}:{application_module}",
+            rounds=rounds,
+            wall_time_min=round(min(m[f"{step}_duration"] for m in measurements), 2),
+            wall_time_median=round(
+                statistics.median(m[f"{step}_duration"] for m in measurements), 2
+            ),
+            num_queries=max(m.get(f"{step}_num_queries", 0) for m in measurements),
+            peak_memory=max(m[f"{step}_memory"] for m in measurements),
+        )
+        for step in ("import", "warmup")
+    ]
+
+
+def benchmark_results_compare(
+    *,
+    results: list[BenchmarkResult],
+    baseline: list[dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Compare results against a baseline, returning a description of each
+    regression. Wall time and peak memory regress when exceeding the baseline by
+    more than the tolerance, e.g. 0.2 for 20%, while any additional query is a
+    regression.
+    """
+
+    baseline_by_name = {result["name"]: result for result in baseline}
+    regressions = []
+
+    for result in results:
+        baseline_result = baseline_by_name.get(result.name)
+
+        if baseline_result is None:
+            continue
+
+        for attr in ("wall_time_median", "peak_memory"):
+            value = getattr(result, attr)
+            baseline_value = baseline_result[attr]
+
+            if value > baseline_value * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {attr} regressed from {baseline_value} to "
+                    f"{value}."
+                )
+
+        if result.num_queries > baseline_result["num_queries"]:
+            regressions.append(
+                f"{result.name}: num_queries regressed from "
+                f"{baseline_result['num_queries']} to {result.num_queries}."
+            )
+
+    return regressions
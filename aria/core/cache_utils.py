@@ -1,7 +1,11 @@
 import dataclasses
+import hashlib
+from decimal import Decimal
 from typing import Any, Callable, Optional, Type, Union
 
 import dacite
+import orjson
+from pydantic import BaseModel
 
 
 def get_codec(
@@ -32,6 +36,35 @@ def get_codec(
     return lambda value: value, lambda value: value
 
 
+def get_version(value: Any) -> str:
+    """
+    Get a version of a cached value, being a hash of its content. Used to tell
+    whether the content of a cache entry has changed without having to read
+    (and render) the entry itself, e.g. when generating ETags.
+    """
+
+    content = orjson.dumps(value, default=_version_default, option=orjson.OPT_SORT_KEYS)
+
+    return hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+
+def _version_default(value: Any) -> Any:
+    """
+    Serialize types orjson does not support natively when hashing values.
+    """
+
+    if isinstance(value, BaseModel):
+        return value.dict()
+
+    if isinstance(value, Decimal):
+        return str(value)
+
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+
+    raise TypeError(f"Type is not serializable: {type(value)}")
+
+
 def _is_list_with_dataclass(type_annotation: Type[Any]) -> bool:
 
     origin = getattr(type_annotation, "__origin__", None)
@@ -0,0 +1,83 @@
+import gzip
+from typing import Callable
+
+import brotli
+import zstandard
+
+# Compression levels are moderate, as content is compressed on the request path.
+# Higher levels make responses only marginally smaller, while being several
+# times slower to compress.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTANDARD_LEVEL = 6
+
+
+def _gzip_compress(content: bytes) -> bytes:
+    # Use a fixed mtime, so that identical content compress to identical bytes.
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _brotli_compress(content: bytes) -> bytes:
+    return brotli.compress(  # type: ignore
+        content, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY
+    )
+
+
+def _zstandard_compress(content: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTANDARD_LEVEL).compress(content)
+
+
+# Supported encodings, in the order of preference.
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "br": _brotli_compress,
+    "zstd": _zstandard_compress,
+    "gzip": _gzip_compress,
+}
+
+
+def compression_encoding_for_accept_encoding(accept_encoding: str) -> str | None:
+    """
+    Negotiate which encoding to use based on the value of an Accept-Encoding
+    header. Returns None if none of the supported encodings are accepted.
+
+    E.g. "gzip, deflate, br" returns "br".
+    """
+
+    accepted: dict[str, float] = {}
+
+    for value in accept_encoding.split(","):
+        encoding, _, params = value.strip().partition(";")
+        quality = 1.0
+
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+
+        if encoding:
+            accepted[encoding.strip().lower()] = quality
+
+    wildcard_quality = accepted.get("*", 0.0)
+
+    return next(
+        (
+            encoding
+            for encoding in COMPRESSORS
+            if accepted.get(encoding, wildcard_quality) > 0
+        ),
+        None,
+    )
+
+
+def compress(content: bytes, *, encoding: str) -> bytes:
+    """
+    Compress content with the given encoding.
+    """
+
+    try:
+        compressor = COMPRESSORS[encoding]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported encoding: {encoding}") from exc
+
+    return compressor(content)
@@ -1,12 +1,18 @@
 import functools
 import inspect
 import logging
+from contextlib import ExitStack
 from typing import Any, Callable, Optional, TypeVar, cast
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connections
 
-from aria.core.cache_utils import get_codec
+from asgiref.sync import sync_to_async
+
+from aria.core.cache_utils import get_codec, get_version
+from aria.core.metrics import metrics_record_cache
+from aria.core.performance import request_performance_record_cache
 
 F = TypeVar("F", bound=Callable[..., Any])
 logger = logging.getLogger(__name__)
@@ -16,6 +22,10 @@ class NotAllowedInProductionException(Exception):
     pass
 
 
+class QueryBudgetExceededException(Exception):
+    pass
+
+
 def not_in_production(func: Any) -> Callable[[F], F]:
     """
     Decorator that raises exception if run in production.
@@ -58,6 +68,20 @@ def cached(
     the same arguments as the function.
 
     E.g:    my_function.uncache(arg="hello")
+
+    Whenever a value is written to the cache, a version (hash of the content) is
+    stored alongside it. The version can be retrieved without reading the cached
+    value itself, and is None if the value is not cached. Takes the same
+    arguments as the function.
+
+    E.g:    my_function.version(arg="hello")
+
+    For async views, acall and aversion are async counterparts of calling the
+    function and the version helper. The cache backend is sync, so acall runs
+    the function, including reading and writing the cache, in a single thread,
+    and aversion reads the value and version in a single call.
+
+    E.g:    await my_function.acall(arg="hello")
     """
 
     get_cache_key: Callable[..., str]
@@ -77,7 +101,47 @@ def cached(
         """
 
         cache_key = get_cache_key(*args, **kwargs)
-        cache.delete(cache_key)
+        cache.delete_many([cache_key, _get_version_key(cache_key)])
+
+    def version(*args: Any, **kwargs: Any) -> str | None:
+        """
+        Helper to get the version of the cached value. Takes the same arguments
+        as the function.
+        """
+
+        cache_key = get_cache_key(*args, **kwargs)
+
+        try:
+            cached_version: str | None = cache.get(_get_version_key(cache_key))
+            # The value itself might have been evicted or deleted outside of
+            # the uncache helper, in which case the version is stale.
+            if cached_version is not None and not cache.has_key(cache_key):
+                cached_version = None
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Cache read failed for key %s", cache_key, exc_info=exc)
+            cached_version = None
+
+        return cached_version
+
+    async def aversion(*args: Any, **kwargs: Any) -> str | None:
+        """
+        Async counterpart of the version helper.
+        """
+
+        cache_key = get_cache_key(*args, **kwargs)
+        version_key = _get_version_key(cache_key)
+
+        try:
+            cached_values = await cache.aget_many([version_key, cache_key])
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Cache read failed for key %s", cache_key, exc_info=exc)
+            return None
+
+        # As with the version helper, the version is stale without the value.
+        if cache_key not in cached_values:
+            return None
+
+        return cast(str | None, cached_values.get(version_key))
 
     def decorator(func: F) -> F:
         signature = inspect.signature(func)
@@ -96,26 +160,105 @@ def cached(
                 cached_value = cache.get(cache_key)
             except Exception as exc:  # pylint: disable=broad-except
                 logger.error("Cache read failed for key %s", cache_key, exc_info=exc)
+                metrics_record_cache(key=cache_key, result="error")
                 cached_value = None
 
+            request_performance_record_cache(hit=cached_value is not None)
+            metrics_record_cache(
+                key=cache_key, result="hit" if cached_value is not None else "miss"
+            )
+
             if cached_value is not None:
                 value = decoder(cached_value)
             else:
                 # Value is not in cache, so calculate and update cache
                 value = func(*args, **kwargs)
-                value_for_cache = encoder(value)
-
-                try:
-                    cache.set(cache_key, value_for_cache, timeout=timeout)
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.error(
-                        "Cache write failed for key: %s", cache_key, exc_info=exc
-                    )
+                _cache_set_with_version(
+                    cache_key=cache_key, value_for_cache=encoder(value), timeout=timeout
+                )
 
             return value
 
-        # Add the uncache helper as an attribute of the function
+        # Add the helpers as attributes of the function
         inner.uncache = uncache  # type: ignore
+        inner.version = version  # type: ignore
+        inner.acall = sync_to_async(inner)  # type: ignore
+        inner.aversion = aversion  # type: ignore
+
+        return cast(F, inner)
+
+    return decorator
+
+
+def _cache_set_with_version(
+    *, cache_key: str, value_for_cache: Any, timeout: Optional[int]
+) -> None:
+    values_for_cache = {cache_key: value_for_cache}
+
+    try:
+        values_for_cache[_get_version_key(cache_key)] = get_version(value_for_cache)
+    except TypeError:
+        # Values we're unable to hash are cached without a version.
+        pass
+
+    try:
+        cache.set_many(values_for_cache, timeout=timeout)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Cache write failed for key: %s", cache_key, exc_info=exc)
+        metrics_record_cache(key=cache_key, result="error")
+
+
+def _get_version_key(cache_key: str) -> str:
+    return f"{cache_key}.version"
+
+
+def query_budget(*, max_queries: int) -> Callable[[F], F]:
+    """
+    Limits the number of database queries a selector can make. The number of
+    queries a selector makes should not grow with the number of rows returned,
+    exceeding the budget is usually a sign of a missing prefetch.
+
+    E.g:  @query_budget(max_queries=8)
+
+    Exceeding the budget raises QueryBudgetExceededException if the
+    QUERY_BUDGET_RAISE setting is true, e.g. in tests. Otherwise, a warning is
+    logged.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            num_queries = 0
+
+            def count_queries(
+                execute: Callable[..., Any],
+                sql: str,
+                params: Any,
+                many: bool,
+                context: dict[str, Any],
+            ) -> Any:
+                nonlocal num_queries
+                num_queries += 1
+                return execute(sql, params, many, context)
+
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(count_queries))
+
+                value = func(*args, **kwargs)
+
+            if num_queries > max_queries:
+                message = (
+                    f"{func.__qualname__} made {num_queries} queries, exceeding its "
+                    f"budget of {max_queries}."
+                )
+
+                if settings.QUERY_BUDGET_RAISE:
+                    raise QueryBudgetExceededException(message)
+
+                logger.warning(message)
+
+            return value
 
         return cast(F, inner)
 
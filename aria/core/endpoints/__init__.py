@@ -1,3 +0,0 @@
-from aria.core.endpoints.public import router as public_endpoints
-
-__all__ = ["public_endpoints"]
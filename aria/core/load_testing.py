@@ -0,0 +1,295 @@
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+import requests
+
+
+@dataclass
+class LoadTestSession:
+    """
+    State of a single simulated client. Each client keeps its own token pair, as
+    tokens are rotated when refreshed.
+    """
+
+    base_url: str
+    http: requests.Session = field(default_factory=requests.Session)
+    access_token: str | None = None
+    refresh_token: str | None = None
+    product_slugs: list[str] = field(default_factory=list)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """
+        Make a request against the API, authenticated if a token is obtained.
+        """
+
+        headers = kwargs.pop("headers", {})
+
+        if self.access_token is not None:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        return self.http.request(
+            method, f"{self.base_url}{path}", headers=headers, timeout=30, **kwargs
+        )
+
+
+@dataclass
+class LoadTestScenario:
+    """
+    A single endpoint to put load on, picked at random proportionally to its
+    weight. The scenario makes a request, and returns the response.
+    """
+
+    name: str
+    weight: int
+    run: Callable[[LoadTestSession], requests.Response]
+    requires_auth: bool = False
+
+
+@dataclass
+class LoadTestResult:  # pylint: disable=too-many-instance-attributes
+    """
+    Result of putting load on a single scenario. Durations are in milliseconds.
+    """
+
+    name: str
+    requests: int
+    errors: int
+    error_rate: float
+    rps: float
+    p50: float
+    p95: float
+    p99: float
+
+    def dict(self) -> dict[str, Any]:
+        """
+        Dictionary representation of the result, as stored in baselines.
+        """
+
+        return asdict(self)
+
+
+def _product_detail(session: LoadTestSession) -> requests.Response:
+    slug = random.choice(session.product_slugs) if session.product_slugs else "-"
+    return session.request("GET", f"/api/v1/products/{slug}/")
+
+
+def _auth_tokens_refresh(session: LoadTestSession) -> requests.Response:
+    response = session.request(
+        "POST",
+        "/api/v1/auth/tokens/refresh/",
+        json={"refreshToken": session.refresh_token},
+    )
+
+    if response.ok:
+        tokens = response.json()
+        session.access_token = tokens["accessToken"]
+        session.refresh_token = tokens["refreshToken"]
+
+    return response
+
+
+SCENARIOS = [
+    LoadTestScenario(
+        name="product_list",
+        weight=10,
+        run=lambda session: session.request("GET", "/api/v1/products/"),
+    ),
+    LoadTestScenario(name="product_detail", weight=10, run=_product_detail),
+    LoadTestScenario(
+        name="category_list",
+        weight=5,
+        run=lambda session: session.request("GET", "/api/v1/categories/"),
+    ),
+    LoadTestScenario(
+        name="discount_list",
+        weight=5,
+        run=lambda session: session.request("GET", "/api/v1/discounts/"),
+    ),
+    LoadTestScenario(
+        name="auth_tokens_refresh",
+        weight=1,
+        run=_auth_tokens_refresh,
+        requires_auth=True,
+    ),
+    LoadTestScenario(
+        name="internal_product_list",
+        weight=2,
+        run=lambda session: session.request(
+            "GET",
+            "/api/v1/internal/products/",
+            params={"page": random.randint(1, 3)},
+        ),
+        requires_auth=True,
+    ),
+    LoadTestScenario(
+        name="internal_user_list",
+        weight=2,
+        run=lambda session: session.request(
+            "GET",
+            "/api/v1/internal/users/",
+            params={"page": random.randint(1, 3)},
+        ),
+        requires_auth=True,
+    ),
+]
+
+
+def load_test_session_create(
+    *, base_url: str, email: str | None = None, password: str | None = None
+) -> LoadTestSession:
+    """
+    Create a client session, fetching product slugs used for detail requests, and
+    obtaining a token pair if credentials are given.
+    """
+
+    session = LoadTestSession(base_url=base_url.rstrip("/"))
+
+    response = session.request("GET", "/api/v1/products/")
+    response.raise_for_status()
+    session.product_slugs = [product["slug"] for product in response.json()]
+
+    if email is not None and password is not None:
+        response = session.request(
+            "POST",
+            "/api/v1/auth/tokens/obtain/",
+            json={"email": email, "password": password},
+        )
+        response.raise_for_status()
+        tokens = response.json()
+        session.access_token = tokens["accessToken"]
+        session.refresh_token = tokens["refreshToken"]
+
+    return session
+
+
+def load_test_run(
+    *,
+    sessions: list[LoadTestSession],
+    scenarios: list[LoadTestScenario],
+    duration: float,
+) -> list[LoadTestResult]:
+    """
+    Put load on scenarios for a duration in seconds, with one concurrent client
+    per session. Responses with status codes of 400 or above, and failing
+    requests, are counted as errors.
+    """
+
+    durations: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def run_client(session: LoadTestSession) -> None:
+        available_scenarios = [
+            scenario
+            for scenario in scenarios
+            if not scenario.requires_auth or session.access_token is not None
+        ]
+        weights = [scenario.weight for scenario in available_scenarios]
+
+        while time.monotonic() < deadline:
+            scenario = random.choices(available_scenarios, weights=weights)[0]
+            start = time.perf_counter()
+
+            try:
+                failed = not scenario.run(session).ok
+            except requests.RequestException:
+                failed = True
+
+            request_duration = (time.perf_counter() - start) * 1000
+
+            with lock:
+                durations[scenario.name].append(request_duration)
+                errors[scenario.name] += failed
+
+    start = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+        for future in [executor.submit(run_client, session) for session in sessions]:
+            future.result()
+
+    elapsed = time.monotonic() - start
+
+    return [
+        _load_test_result(
+            name=name,
+            durations=scenario_durations,
+            errors=errors[name],
+            elapsed=elapsed,
+        )
+        for name, scenario_durations in sorted(durations.items())
+    ]
+
+
+def load_test_results_compare(
+    *,
+    results: list[LoadTestResult],
+    baseline: list[dict[str, Any]],
+    tolerance: float,
+    error_rate_tolerance: float,
+) -> list[str]:
+    """
+    Compare results against a baseline, returning a description of each
+    regression. Latency and throughput regress when worse than the baseline by
+    more than the tolerance, e.g. 0.2 for 20%, while the error rate regresses
+    when increased by more than the error rate tolerance, e.g. 0.01 for one
+    percentage point.
+    """
+
+    baseline_by_name = {result["name"]: result for result in baseline}
+    regressions = []
+
+    for result in results:
+        baseline_result = baseline_by_name.get(result.name)
+
+        if baseline_result is None:
+            continue
+
+        for attr in ("p50", "p95", "p99"):
+            if getattr(result, attr) > baseline_result[attr] * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {attr} regressed from {baseline_result[attr]} "
+                    f"to {getattr(result, attr)} ms."
+                )
+
+        if result.rps < baseline_result["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: rps regressed from {baseline_result['rps']} to "
+                f"{result.rps}."
+            )
+
+        if result.error_rate > baseline_result["error_rate"] + error_rate_tolerance:
+            regressions.append(
+                f"{result.name}: error_rate regressed from "
+                f"{baseline_result['error_rate']} to {result.error_rate}."
+            )
+
+    return regressions
+
+
+def _load_test_result(
+    *, name: str, durations: list[float], errors: int, elapsed: float
+) -> LoadTestResult:
+    # Quantiles need at least two data points.
+    percentiles = (
+        statistics.quantiles(durations, n=100, method="inclusive")
+        if len(durations) > 1
+        else durations * 99
+    )
+
+    return LoadTestResult(
+        name=name,
+        requests=len(durations),
+        errors=errors,
+        error_rate=round(errors / len(durations), 4),
+        rps=round(len(durations) / elapsed, 2),
+        p50=round(percentiles[49], 2),
+        p95=round(percentiles[94], 2),
+        p99=round(percentiles[98], 2),
+    )
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from aria.categories.selectors import category_navigation_active_list
+from aria.core.benchmarks import benchmark, benchmark_results_compare
+from aria.discounts.selectors import discount_active_list
+from aria.products.models import Product
+from aria.products.selectors.core import product_detail, product_list_for_sale
+from aria.users.selectors import user_list
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks selectors for wall time, number of queries and peak memory, "
+        "optionally comparing against a baseline. Selectors are called without "
+        "cache. Run against a catalogue of realistic size, e.g. one seeded with "
+        "the seed_benchmark_catalogue command. To check a change for "
+        "regressions, write a baseline with --output on the revision before the "
+        "change, and compare against it with --baseline on the revision after, "
+        "using the same catalogue and machine. Wall times vary between "
+        "machines, so no baseline is kept in the repository."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=5,
+            help="Number of times to call each selector",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="Path to write results to as JSON, e.g. to be used as a baseline",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=None,
+            help="Path to JSON results to compare against",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed regression in wall time and memory, e.g. 0.2 for 20%%",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        product_id = (
+            Product.objects.available()
+            .order_by("id")
+            .values_list("id", flat=True)
+            .first()
+        )
+
+        selectors: dict[str, Callable[[], Any]] = {
+            "product_list_for_sale": lambda: product_list_for_sale(filters=None),
+            "discount_active_list": discount_active_list,
+            "category_navigation_active_list": category_navigation_active_list,
+            "user_list": lambda: user_list(filters=None),
+        }
+
+        if product_id is not None:
+            selectors["product_detail"] = lambda: product_detail(product_id=product_id)
+
+        results = []
+
+        for name, func in selectors.items():
+            result = benchmark(name=name, func=func, rounds=options["rounds"])
+            results.append(result)
+
+            self.stdout.write(
+                f"{name}: median {result.wall_time_median} ms, "
+                f"min {result.wall_time_min} ms, {result.num_queries} queries, "
+                f"peak memory {result.peak_memory} KiB"
+            )
+
+        if options["output"] is not None:
+            options["output"].write_text(
+                json.dumps([result.dict() for result in results], indent=2)
+            )
+
+        if options["baseline"] is None:
+            return
+
+        regressions = benchmark_results_compare(
+            results=results,
+            baseline=json.loads(options["baseline"].read_text()),
+            tolerance=options["tolerance"],
+        )
+
+        for regression in regressions:
+            self.stderr.write(regression)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)} regression(s) found.")
+
+        self.stdout.write(self.style.SUCCESS("No regressions found."))
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from aria.core.benchmarks import benchmark_results_compare, benchmark_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks server startup, importing the application and warming it up "
+        "as the gunicorn master process does before forking workers. Reports wall "
+        "time, queries and peak resident memory, optionally comparing against a "
+        "baseline written with --output."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=5,
+            help="Number of times to start the application",
+        )
+        parser.add_argument(
+            "--application",
+            type=str,
+            default="aria.asgi",
+            choices=["aria.asgi", "aria.wsgi"],
+            help="Module of the application to start",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="Path to write results to as JSON, e.g. to be used as a baseline",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=None,
+            help="Path to JSON results to compare against",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed regression in wall time and memory, e.g. 0.2 for 20%%",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        results = benchmark_startup(
+            application_module=options["application"], rounds=options["rounds"]
+        )
+
+        for result in results:
+            self.stdout.write(
+                f"{result.name}: median {result.wall_time_median} ms, "
+                f"min {result.wall_time_min} ms, {result.num_queries} queries, "
+                f"peak memory {result.peak_memory} KiB"
+            )
+
+        if options["output"] is not None:
+            options["output"].write_text(
+                json.dumps([result.dict() for result in results], indent=2)
+            )
+
+        if options["baseline"] is None:
+            return
+
+        regressions = benchmark_results_compare(
+            results=results,
+            baseline=json.loads(options["baseline"].read_text()),
+            tolerance=options["tolerance"],
+        )
+
+        for regression in regressions:
+            self.stderr.write(regression)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)} regression(s) found.")
+
+        self.stdout.write(self.style.SUCCESS("No regressions found."))
@@ -0,0 +1,127 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from aria.core.load_testing import (
+    SCENARIOS,
+    load_test_results_compare,
+    load_test_run,
+    load_test_session_create,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Puts load on the API of a running server, reporting requests per second, "
+        "latency percentiles and error rates per endpoint, optionally comparing "
+        "against a baseline. Run against a server with a seeded database, e.g. "
+        "one seeded with the seed_benchmark_catalogue command. Internal endpoints "
+        "are only included if credentials of a staff user are given."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--base_url",
+            type=str,
+            default="http://localhost:8000",
+            help="URL of the server to put load on",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=30,
+            help="Number of seconds to put load on the server",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=10,
+            help="Number of concurrent clients",
+        )
+        parser.add_argument(
+            "--email",
+            type=str,
+            default=None,
+            help="Email of the staff user to authenticate as",
+        )
+        parser.add_argument(
+            "--password",
+            type=str,
+            default=None,
+            help="Password of the staff user to authenticate as",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="Path to write results to as JSON, e.g. to be used as a baseline",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=None,
+            help="Path to JSON results to compare against",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed regression in latency and throughput, e.g. 0.2 for 20%%",
+        )
+        parser.add_argument(
+            "--error_rate_tolerance",
+            type=float,
+            default=0.01,
+            help="Allowed increase in error rate, e.g. 0.01 for 1 percentage point",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        sessions = [
+            load_test_session_create(
+                base_url=options["base_url"],
+                email=options["email"],
+                password=options["password"],
+            )
+            for _ in range(options["concurrency"])
+        ]
+
+        self.stdout.write(
+            f"Putting load on {options['base_url']} for {options['duration']} "
+            f"seconds with {options['concurrency']} concurrent clients..."
+        )
+
+        results = load_test_run(
+            sessions=sessions, scenarios=SCENARIOS, duration=options["duration"]
+        )
+
+        for result in results:
+            self.stdout.write(
+                f"{result.name}: {result.requests} requests, {result.rps} rps, "
+                f"p50 {result.p50} ms, p95 {result.p95} ms, p99 {result.p99} ms, "
+                f"error rate {result.error_rate:.2%}"
+            )
+
+        if options["output"] is not None:
+            options["output"].write_text(
+                json.dumps([result.dict() for result in results], indent=2)
+            )
+
+        if options["baseline"] is None:
+            return
+
+        regressions = load_test_results_compare(
+            results=results,
+            baseline=json.loads(options["baseline"].read_text()),
+            tolerance=options["tolerance"],
+            error_rate_tolerance=options["error_rate_tolerance"],
+        )
+
+        for regression in regressions:
+            self.stderr.write(regression)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)} regression(s) found.")
+
+        self.stdout.write(self.style.SUCCESS("No regressions found."))
@@ -0,0 +1,348 @@
+import random
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, TypeVar
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import models, transaction
+from django.utils import timezone
+
+from aria.categories.models import Category
+from aria.core.decorators import not_in_production
+from aria.discounts.models import Discount
+from aria.product_attributes.models import Color, Material, Room, Shape, Size, Variant
+from aria.products.enums import ProductStatus, ProductUnit
+from aria.products.models import Product, ProductOption
+from aria.products.services.pricing import product_prices_update
+from aria.suppliers.models import Supplier
+from aria.users.models import User
+
+M = TypeVar("M", bound=models.Model)
+
+NAME_PREFIX = "Benchmark"
+
+
+@not_in_production
+class Command(BaseCommand):
+    help = (
+        "Seeds the database with a synthetic catalogue of realistic size, used to "
+        "benchmark selectors. See the benchmark_selectors command. Products, "
+        "options, variants, categories and discounts from previous runs are "
+        "deleted first, so the command can be re-run."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=20000,
+            help="Number of products to create",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=5000,
+            help="Number of users to create",
+        )
+        parser.add_argument(
+            "--discounts",
+            type=int,
+            default=40,
+            help="Number of active discounts to create",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed for the random generator, making catalogues reproducible",
+        )
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=2000,
+            help="Number of rows to insert per query",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rng = random.Random(options["seed"])
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            self.stdout.write("Deleting previous benchmark catalogue...")
+
+            self._delete_catalogue()
+
+            self.stdout.write("Creating attributes...")
+
+            suppliers = _get_or_bulk_create(
+                Supplier,
+                [
+                    Supplier(
+                        name=f"{NAME_PREFIX} supplier {i}",
+                        contact_first_name="Benchmark",
+                        contact_last_name="Supplier",
+                        contact_email=f"supplier-{i}@example.com",
+                        origin_country="NO",
+                        website_link="https://example.com",
+                    )
+                    for i in range(25)
+                ],
+            )
+            colors = _get_or_bulk_create(
+                Color,
+                [
+                    Color(name=f"{NAME_PREFIX} color {i}", color_hex=f"#BE{i:04X}")
+                    for i in range(20)
+                ],
+            )
+            materials = _get_or_bulk_create(
+                Material,
+                [Material(name=f"{NAME_PREFIX} material {i}") for i in range(15)],
+            )
+            rooms = _get_or_bulk_create(
+                Room, [Room(name=f"{NAME_PREFIX} room {i}") for i in range(10)]
+            )
+            shapes = _get_or_bulk_create(
+                Shape,
+                [
+                    Shape(
+                        name=f"{NAME_PREFIX} shape {i}",
+                        image=f"media/benchmark/shapes/shape-{i}.png",
+                    )
+                    for i in range(10)
+                ],
+            )
+            sizes = [
+                Size.objects.get_or_create(
+                    width=Decimal(width), height=Decimal(height), depth=None
+                )[0]
+                for width in range(10, 130, 20)
+                for height in range(10, 210, 20)
+            ]
+            variants = Variant.objects.bulk_create(
+                [Variant(name=f"{NAME_PREFIX} variant {i}") for i in range(150)]
+            )
+            categories = self._create_categories()
+
+            self.stdout.write(f"Creating {options['products']} products...")
+
+            products = Product.objects.bulk_create(
+                [
+                    Product(
+                        name=f"{NAME_PREFIX} product {i}",
+                        slug=f"benchmark-product-{i}",
+                        supplier=rng.choice(suppliers),
+                        status=ProductStatus.AVAILABLE
+                        if rng.random() < 0.9
+                        else ProductStatus.HIDDEN,
+                        unit=rng.choice(ProductUnit.values),
+                        description="Lorem ipsum dolor sit amet. " * 20,
+                        search_keywords=f"benchmark {i}",
+                    )
+                    for i in range(options["products"])
+                ],
+                batch_size=batch_size,
+            )
+
+            product_options = ProductOption.objects.bulk_create(
+                [
+                    ProductOption(
+                        product=product,
+                        variant=variant,
+                        size=size,
+                        gross_price=Decimal(rng.randint(100, 20000)),
+                    )
+                    for product in products
+                    for variant, size in zip(
+                        rng.sample(variants, k=rng.randint(1, 3)),
+                        rng.sample(sizes, k=3),
+                    )
+                ],
+                batch_size=batch_size,
+            )
+
+            relations: list[tuple[Any, list[Any], int]] = [
+                (Product.categories, categories, 2),
+                (Product.colors, colors, 3),
+                (Product.materials, materials, 2),
+                (Product.rooms, rooms, 3),
+                (Product.shapes, shapes, 1),
+            ]
+
+            for field, values, max_values in relations:
+                _bulk_create_relations(
+                    field=field,
+                    instances=products,
+                    values=values,
+                    min_values=1,
+                    max_values=max_values,
+                    rng=rng,
+                    batch_size=batch_size,
+                )
+
+            self.stdout.write(f"Creating {options['discounts']} discounts...")
+
+            self._create_discounts(
+                num_discounts=options["discounts"],
+                products=products,
+                product_options=product_options,
+                rng=rng,
+            )
+
+            # Bulk creating doesn't send the signals updating products' prices.
+            self.stdout.write("Computing product prices...")
+
+            for start in range(0, len(products), batch_size):
+                product_prices_update(
+                    product_ids=[
+                        product.id for product in products[start : start + batch_size]
+                    ]
+                )
+
+            self.stdout.write(f"Creating {options['users']} users...")
+
+            User.objects.bulk_create(
+                [
+                    User(
+                        email=f"benchmark-{i}@example.com",
+                        first_name="Benchmark",
+                        last_name=f"User {i}",
+                        password="!",
+                    )
+                    for i in range(options["users"])
+                ],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+
+        self.stdout.write(self.style.SUCCESS("Benchmark catalogue seeded."))
+
+    @staticmethod
+    def _delete_catalogue() -> None:
+        # Options and relations of products are deleted along with them.
+        # Suppliers, attributes, sizes and users are reused instead.
+        Discount.objects.filter(slug__startswith="benchmark-discount-").delete()
+        Product.objects.filter(slug__startswith="benchmark-product-").delete()
+        Variant.objects.filter(name__startswith=f"{NAME_PREFIX} variant ").delete()
+        # Parents are protected, so children are deleted first. Whole trees are
+        # deleted, leaving the tree fields of other categories intact.
+        categories = Category.objects.filter(slug__startswith="benchmark-category-")
+        categories.filter(mptt_level__gt=0).delete()
+        categories.delete()
+
+    @staticmethod
+    def _create_categories() -> list[Category]:
+        # Categories are created one by one, as the tree is not maintained when
+        # bulk creating.
+        categories = []
+
+        for i in range(8):
+            parent = Category.objects.create(
+                name=f"{NAME_PREFIX} category {i}", slug=f"benchmark-category-{i}"
+            )
+
+            for j in range(6):
+                categories.append(
+                    Category.objects.create(
+                        name=f"{NAME_PREFIX} category {i}.{j}",
+                        slug=f"benchmark-category-{i}-{j}",
+                        parent=parent,
+                    )
+                )
+
+        return categories
+
+    @staticmethod
+    def _create_discounts(
+        *,
+        num_discounts: int,
+        products: list[Product],
+        product_options: list[ProductOption],
+        rng: random.Random,
+    ) -> None:
+        now = timezone.now()
+        discounts = Discount.objects.bulk_create(
+            [
+                Discount(
+                    name=f"{NAME_PREFIX} discount {i}",
+                    slug=f"benchmark-discount-{i}",
+                    discount_gross_percentage=Decimal("0.20"),
+                    active_at=now - timedelta(days=1),
+                    active_to=now + timedelta(days=365),
+                    ordering=i,
+                )
+                for i in range(num_discounts)
+            ]
+        )
+
+        _bulk_create_relations(
+            field=Discount.products,
+            instances=discounts,
+            values=products,
+            min_values=25,
+            max_values=25,
+            rng=rng,
+        )
+        _bulk_create_relations(
+            field=Discount.product_options,
+            instances=discounts,
+            values=product_options,
+            min_values=25,
+            max_values=25,
+            rng=rng,
+        )
+
+
+def _get_or_bulk_create(model: type[M], instances: list[M]) -> list[M]:
+    """
+    Bulk create instances of models with unique names, reusing rows created in
+    previous runs.
+    """
+
+    model._default_manager.bulk_create(instances, ignore_conflicts=True)
+
+    return list(
+        model._default_manager.filter(
+            name__in=[instance.name for instance in instances]  # type: ignore
+        )
+    )
+
+
+def _get_through_field_names(field: Any) -> tuple[str, str]:
+    # Names of the id columns of the through model of a many-to-many relation,
+    # e.g. ("product_id", "color_id").
+    return (
+        f"{field.rel.field.m2m_field_name()}_id",
+        f"{field.rel.field.m2m_reverse_field_name()}_id",
+    )
+
+
+def _bulk_create_relations(
+    *,
+    field: Any,
+    instances: list[Any],
+    values: list[Any],
+    min_values: int,
+    max_values: int,
+    rng: random.Random,
+    batch_size: int | None = None,
+) -> None:
+    """
+    Bulk create many-to-many relations, relating each instance to between
+    min_values and max_values random values.
+    """
+
+    through = field.through
+    source_field, target_field = _get_through_field_names(field)
+
+    through.objects.bulk_create(
+        [
+            through(**{source_field: instance.pk, target_field: value.pk})
+            for instance in instances
+            for value in rng.sample(
+                values, k=min(len(values), rng.randint(min_values, max_values))
+            )
+        ],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
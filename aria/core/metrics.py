@@ -0,0 +1,171 @@
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.exposition import choose_encoder
+
+# Latency buckets (in seconds) fitting both cached reads and slow writes.
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+TASK_DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+REQUEST_DURATION = Histogram(
+    "aria_request_duration_seconds",
+    "Time spent handling requests.",
+    ["operation", "method", "status"],
+    buckets=DURATION_BUCKETS,
+)
+REQUEST_DB_DURATION = Histogram(
+    "aria_request_db_duration_seconds",
+    "Time spent in the database while handling requests.",
+    ["operation"],
+    buckets=DURATION_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    "aria_request_queries",
+    "Number of database queries made while handling requests.",
+    ["operation"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_CONNECTIONS_OPENED = Counter(
+    "aria_db_connections_opened",
+    "Database connections opened, compared to requests handled to tell whether "
+    "connections are reused.",
+    ["alias"],
+)
+CACHE_REQUESTS = Counter(
+    "aria_cache_requests",
+    "Reads of values cached with the cached decorator.",
+    ["prefix", "result"],
+)
+TASK_DURATION = Histogram(
+    "aria_celery_task_duration_seconds",
+    "Time spent running Celery tasks.",
+    ["task", "state"],
+    buckets=TASK_DURATION_BUCKETS,
+)
+
+
+def metrics_observe_request(
+    *,
+    operation: str | None,
+    method: str,
+    status_code: int,
+    duration: float,
+    num_queries: int,
+    db_duration: float,
+) -> None:
+    """
+    Record metrics of a handled request. Durations are in milliseconds.
+    """
+
+    operation = operation or "unknown"
+
+    REQUEST_DURATION.labels(operation, method, str(status_code)).observe(
+        duration / 1000
+    )
+    REQUEST_DB_DURATION.labels(operation).observe(db_duration / 1000)
+    REQUEST_QUERIES.labels(operation).observe(num_queries)
+
+
+def metrics_record_db_connection(*, alias: str) -> None:
+    """
+    Record a database connection being opened.
+    """
+
+    DB_CONNECTIONS_OPENED.labels(alias).inc()
+
+
+def metrics_record_cache(*, key: str, result: str) -> None:
+    """
+    Record a cache read, result being either "hit", "miss" or "error". Counted per
+    key prefix, as keys often contain ids or filters.
+    """
+
+    CACHE_REQUESTS.labels(_get_key_prefix(key), result).inc()
+
+
+def metrics_observe_task(*, task: str, state: str | None, duration: float) -> None:
+    """
+    Record the duration, in seconds, of a finished Celery task.
+    """
+
+    TASK_DURATION.labels(task, state or "UNKNOWN").observe(duration)
+
+
+def metrics_render(*, accept: str | None = None) -> tuple[bytes, str]:
+    """
+    Render collected metrics in the Prometheus text format, or OpenMetrics if
+    accepted by the client. Returns the content along with its content type.
+
+    When running multiple processes, e.g. gunicorn workers, the
+    PROMETHEUS_MULTIPROC_DIR environment variable must point to a directory
+    shared by all processes, and emptied between restarts, as done by
+    docker-entrypoint.sh. Metrics from all processes are then aggregated.
+    """
+
+    encoder, content_type = choose_encoder(accept or "")
+
+    return encoder(_get_registry()), content_type
+
+
+def metrics_start_http_server(*, port: int) -> None:
+    """
+    Serve metrics in a background thread on the given port, for processes not
+    serving requests themselves, e.g. Celery workers. When running multiple
+    processes, metrics from all processes are served, see metrics_render.
+    """
+
+    start_http_server(port, registry=_get_registry())
+
+
+def metrics_mark_process_dead(*, pid: int) -> None:
+    """
+    Clean up metrics of a process that exited, e.g. a gunicorn or Celery worker
+    being replaced, when running multiple processes. Values of counters and
+    histograms written by the process are still aggregated.
+    """
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)  # type: ignore
+
+
+def _get_registry() -> CollectorRegistry:
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore
+
+    return registry
+
+
+def _get_key_prefix(key: str) -> str:
+    # E.g. "products.for_sale.filters={...}" -> "products.for_sale".
+    parts: list[str] = []
+
+    for part in key.split("."):
+        if "=" in part or len(parts) == 2:
+            break
+
+        parts.append(part)
+
+    return ".".join(parts) or key
@@ -1,67 +1,423 @@
-from typing import Callable
+import asyncio
+import random
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, cast
 
 from django.conf import settings
-from django.db import connection
+from django.core.cache import cache
+from django.db import connections
 from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
 
 import structlog
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from ninja.operation import PathView
+
+from aria.core.compression import compress, compression_encoding_for_accept_encoding
+from aria.core.metrics import metrics_observe_request
+from aria.core.performance import (
+    QueryRecorder,
+    RequestPerformance,
+    request_performance_measure,
+    request_performance_record_cache,
+)
+from aria.core.replicas import REPLICA_DATABASE, replica_pinning
 
 logger = structlog.get_logger(__name__)
 
+# Set on responses to requests writing to the database, pinning reads of the
+# client's following requests to the primary, see ReplicaPinningMiddleware.
+REPLICA_PINNING_COOKIE = "aria_replica_pinned"
+
 
-class QueryCountWarningMiddleware(MiddlewareMixin):
+class RequestPerformanceMiddleware:
     """
-    Add message in console if number of queries on page load is above threshold.
-    Thresholds are set in settings.
+    Measure number of queries, time spent in the database, cache hits/misses and
+    time spent rendering for a sample of requests, tagged with the name of the
+    operation handling the request.
+
+    The result is logged, with a warning if above thresholds set in settings,
+    recorded as metrics and added to the response as a Server-Timing header.
+    Queries repeated within the same request are logged as possible N+1s.
     """
 
-    @staticmethod
-    def process_response(request: HttpRequest, response: HttpResponse) -> HttpResponse:
-        """
-        Process response by logging query details.
-        """
-        if request.path.startswith(settings.STATIC_URL):
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not _request_is_measured(request):
+            return self.get_response(request)
+
+        performance = RequestPerformance()
+        start = time.perf_counter()
+
+        with request_performance_measure(performance), _query_recorders_enter(
+            performance
+        ):
+            response = self.get_response(request)
+
+        _request_performance_report(
+            request=request,
+            response=response,
+            performance=performance,
+            duration=(time.perf_counter() - start) * 1000,
+        )
+
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        response: HttpResponse
+
+        if not _request_is_measured(request):
+            response = await self.get_response(request)
             return response
 
-        # Get some debug data from the connection object
-        query_count = len(connection.queries)
-        query_duration = round(
-            sum(float(q.get("time")) for q in connection.queries) * 1000  # type: ignore
+        performance = RequestPerformance()
+        start = time.perf_counter()
+
+        with request_performance_measure(performance):
+            # When running async, queries are made from a thread dedicated to the
+            # request, each thread having its own connections. Recorders are
+            # therefore added to the connections of that thread.
+            query_recorders = await sync_to_async(_query_recorders_enter)(performance)
+
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(query_recorders.close)()
+
+        _request_performance_report(
+            request=request,
+            response=response,
+            performance=performance,
+            duration=(time.perf_counter() - start) * 1000,
         )
 
-        if settings.DEBUG:
-            logger.info("Query info", num_queries=query_count, duration=query_duration)
+        return response
 
-        if settings.LOG_SQL:
-            for query in connection.queries:
-                print(query["sql"])
-                print()
 
-        # Check if we've gone above the threshold, and log that's the case
-        if (
-            query_count > settings.QUERY_COUNT_WARNING_THRESHOLD
-            or query_duration > settings.QUERY_DURATION_WARNING_THRESHOLD
-        ):
-            logger.warning("Query exceeding thresholds!")
+def _request_is_measured(request: HttpRequest) -> bool:
+    return not request.path.startswith(settings.STATIC_URL) and (
+        random.random() < settings.REQUEST_PERFORMANCE_SAMPLE_RATE
+    )
+
+
+def _query_recorders_enter(performance: RequestPerformance) -> ExitStack:
+    stack = ExitStack()
+
+    for conn in connections.all():
+        stack.enter_context(conn.execute_wrapper(QueryRecorder(performance)))
+
+    return stack
+
+
+def _request_performance_report(
+    *,
+    request: HttpRequest,
+    response: HttpResponse,
+    performance: RequestPerformance,
+    duration: float,
+) -> None:
+    performance.operation = _get_operation_name(request)
+
+    log_values = {
+        "operation": performance.operation,
+        "status_code": response.status_code,
+        "num_queries": performance.num_queries,
+        "db_duration": round(performance.db_duration, 2),
+        "db_connections_opened": performance.db_connections_opened,
+        "cache_hits": performance.cache_hits,
+        "cache_misses": performance.cache_misses,
+        "render_duration": round(performance.render_duration, 2),
+        "duration": round(duration, 2),
+    }
+
+    if (
+        performance.num_queries > settings.QUERY_COUNT_WARNING_THRESHOLD
+        or performance.db_duration > settings.QUERY_DURATION_WARNING_THRESHOLD
+    ):
+        logger.warning("Request exceeding query thresholds", **log_values)
+    else:
+        logger.info("Request performance", **log_values)
+
+    # The same query made many times for a single request is most likely
+    # caused by a missing select_related or prefetch_related.
+    for sql, count in performance.query_shapes.items():
+        if count >= settings.QUERY_REPEAT_WARNING_THRESHOLD:
             logger.warning(
-                "Query warning", num_queries=query_count, duration=query_duration
+                "Repeated query, possible N+1",
+                operation=performance.operation,
+                count=count,
+                sql=sql,
             )
 
+    metrics_observe_request(
+        operation=performance.operation,
+        method=request.method or "",
+        status_code=response.status_code,
+        duration=duration,
+        num_queries=performance.num_queries,
+        db_duration=performance.db_duration,
+    )
+
+    if settings.REQUEST_PERFORMANCE_SERVER_TIMING:
+        response.headers["Server-Timing"] = _server_timing_header(
+            performance=performance, duration=duration
+        )
+
+
+def _get_operation_name(request: HttpRequest) -> str | None:
+    if request.resolver_match is None:
+        return None
+
+    # Ninja routes all methods of a path to the same view, bound to the
+    # PathView. Find the operation matching the request method.
+    path_view = getattr(request.resolver_match.func, "__self__", None)
+
+    if isinstance(path_view, PathView):
+        operation = path_view._find_operation(  # pylint: disable=protected-access
+            request
+        )
+        return operation.view_func.__name__ if operation else None
+
+    return request.resolver_match.view_name
+
+
+def _server_timing_header(*, performance: RequestPerformance, duration: float) -> str:
+    return ", ".join(
+        [
+            f'db;dur={performance.db_duration:.2f};desc="{performance.num_queries} '
+            f'queries"',
+            f'cache;desc="{performance.cache_hits} hits, '
+            f'{performance.cache_misses} misses"',
+            f"render;dur={performance.render_duration:.2f}",
+            f"total;dur={duration:.2f}",
+        ]
+    )
+
+
+class ReplicaPinningMiddleware:
+    """
+    Let selectors decorated with use_replica read from the replica while handling
+    the request, see aria.core.replicas.
+
+    Reads are pinned to the primary for requests of unsafe methods, which are
+    likely to write, and once the request writes. To let a client read its own
+    writes, reads are also pinned for REPLICA_PINNING_SECONDS following a write,
+    by setting a cookie.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with replica_pinning(pinned=_request_is_pinned(request)) as pinning:
+            response = self.get_response(request)
+
+        if pinning.wrote:
+            _replica_pinning_cookie_set(request=request, response=response)
+
         return response
 
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        response: HttpResponse
+
+        with replica_pinning(pinned=_request_is_pinned(request)) as pinning:
+            response = await self.get_response(request)
+
+        if pinning.wrote:
+            _replica_pinning_cookie_set(request=request, response=response)
+
+        return response
+
+
+def _request_is_pinned(request: HttpRequest) -> bool:
+    return (
+        request.method not in ("GET", "HEAD", "OPTIONS")
+        or REPLICA_PINNING_COOKIE in request.COOKIES
+    )
+
+
+def _replica_pinning_cookie_set(
+    *, request: HttpRequest, response: HttpResponse
+) -> None:
+    # Without a replica, every read is already from the primary.
+    if REPLICA_DATABASE not in settings.DATABASES:
+        return
+
+    response.set_cookie(
+        REPLICA_PINNING_COOKIE,
+        "1",
+        max_age=settings.REPLICA_PINNING_SECONDS,
+        secure=request.is_secure(),
+        httponly=True,
+        samesite="Lax",
+    )
+
 
 class GenericLoggingMiddleware:
-    def __init__(self, get_response: Callable[[HttpRequest], None]) -> None:
+    """
+    Bind the path, method and user of the request to the log context, included in
+    everything logged while handling the request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
         self.get_response = get_response
 
-    def __call__(self, request: HttpRequest) -> None:
-        logger.new(path=request.path, method=request.method)
+        if asyncio.iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
 
-        if hasattr(request, "user"):
-            logger.bind(user_id=request.user.id)
+    def __call__(self, request: HttpRequest) -> Any:
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
 
-        if hasattr(request, "auth"):
-            logger.bind(user_id=request.auth.id)  # type: ignore
+        _log_context_bind(request, user_id=_get_user_id(request))
 
         return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # Resolving the user might query the database, which is not allowed from
+        # async code.
+        user_id = await sync_to_async(_get_user_id)(request)
+        _log_context_bind(request, user_id=user_id)
+
+        response: HttpResponse = await self.get_response(request)
+
+        return response
+
+
+def _get_user_id(request: HttpRequest) -> int | None:
+    user_id: int | None = None
+
+    if hasattr(request, "user"):
+        user_id = cast(int | None, request.user.id)
+
+    if hasattr(request, "auth"):
+        user_id = request.auth.id  # type: ignore
+
+    return user_id
+
+
+def _log_context_bind(request: HttpRequest, *, user_id: int | None) -> None:
+    # The log context is stored in context variables, so that requests handled
+    # concurrently on the same thread, e.g. when running async, are kept apart.
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(path=request.path, method=request.method)
+
+    if user_id is not None:
+        structlog.contextvars.bind_contextvars(user_id=user_id)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with the best encoding supported by the client, being
+    brotli, zstandard or gzip in the order of preference. Bodies smaller than
+    COMPRESSION_MIN_SIZE are left as is, as compressing them rarely pays off.
+
+    Responses carrying an ETag have content uniquely identified by it, so these are
+    compressed once and the compressed bytes are stored in the cache, to not
+    recompress identical responses on every hit.
+    """
+
+    @staticmethod
+    def process_response(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """
+        Process response by compressing the content if applicable.
+        """
+
+        if (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header("Content-Encoding")
+        ):
+            return response
+
+        content_type = response.headers.get("Content-Type", "").split(";")[0]
+
+        if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        encoding = compression_encoding_for_accept_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", "")
+        )
+
+        if encoding is None:
+            return response
+
+        etag = response.headers.get("ETag")
+
+        if etag:
+            compressed_content = _compressed_content_from_cache(
+                content=response.content,
+                encoding=encoding,
+                cache_key=f"compression.{encoding}.{request.path}.{etag}",
+            )
+            # The representation is no longer byte-for-byte the same as the
+            # ETag was computed from.
+            if etag.startswith('"'):
+                response.headers["ETag"] = f"W/{etag}"
+        else:
+            compressed_content = compress(response.content, encoding=encoding)
+
+        if len(compressed_content) >= len(response.content):
+            return response
+
+        response.content = compressed_content
+        response.headers["Content-Length"] = str(len(compressed_content))
+        response.headers["Content-Encoding"] = encoding
+
+        return response
+
+
+def _compressed_content_from_cache(
+    *, content: bytes, encoding: str, cache_key: str
+) -> bytes:
+    try:
+        compressed_content: bytes | None = cache.get(cache_key)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Cache read failed for key %s", cache_key, exc_info=exc)
+        compressed_content = None
+
+    request_performance_record_cache(hit=compressed_content is not None)
+
+    if compressed_content is not None:
+        return compressed_content
+
+    compressed_content = compress(content, encoding=encoding)
+
+    try:
+        cache.set(
+            cache_key, compressed_content, timeout=settings.COMPRESSION_CACHE_TIMEOUT
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Cache write failed for key: %s", cache_key, exc_info=exc)
+
+    return compressed_content
@@ -0,0 +1,148 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from django.conf import settings
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Matches lists of placeholders, e.g. in "IN (%s, %s, %s)".
+_PLACEHOLDER_LIST_RE = re.compile(r"\((?:%s, )*%s\)")
+
+
+@dataclass
+class RequestPerformance:  # pylint: disable=too-many-instance-attributes
+    """
+    Performance details collected while handling a single request. Durations are
+    in milliseconds.
+    """
+
+    operation: str | None = None
+    num_queries: int = 0
+    db_duration: float = 0.0
+    db_connections_opened: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    render_duration: float = 0.0
+    query_shapes: Counter[str] = field(default_factory=Counter)
+
+
+_request_performance: ContextVar[RequestPerformance | None] = ContextVar(
+    "request_performance", default=None
+)
+
+
+def request_performance_get() -> RequestPerformance | None:
+    """
+    Get performance details of the request currently being handled, if it's
+    being measured.
+    """
+
+    return _request_performance.get()
+
+
+@contextmanager
+def request_performance_measure(
+    performance: RequestPerformance,
+) -> Iterator[RequestPerformance]:
+    """
+    Make performance the one being recorded to for the duration of the block.
+    """
+
+    token = _request_performance.set(performance)
+
+    try:
+        yield performance
+    finally:
+        _request_performance.reset(token)
+
+
+def request_performance_record_cache(*, hit: bool) -> None:
+    """
+    Record a cache hit or miss for the request currently being handled.
+    """
+
+    performance = _request_performance.get()
+
+    if performance is None:
+        return
+
+    if hit:
+        performance.cache_hits += 1
+    else:
+        performance.cache_misses += 1
+
+
+def request_performance_record_db_connection() -> None:
+    """
+    Record a database connection being opened for the request currently being
+    handled, rather than reusing one kept open.
+    """
+
+    performance = _request_performance.get()
+
+    if performance is not None:
+        performance.db_connections_opened += 1
+
+
+@contextmanager
+def request_performance_measure_render() -> Iterator[None]:
+    """
+    Record time spent rendering a response for the request currently being
+    handled.
+    """
+
+    performance = _request_performance.get()
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        if performance is not None:
+            performance.render_duration += (time.perf_counter() - start) * 1000
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording number of queries and time spent in the
+    database, see:
+    https://docs.djangoproject.com/en/4.1/topics/db/instrumentation/
+    """
+
+    def __init__(self, performance: RequestPerformance) -> None:
+        self.performance = performance
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.performance.num_queries += 1
+            self.performance.query_shapes[get_query_shape(sql)] += 1
+            self.performance.db_duration += (time.perf_counter() - start) * 1000
+
+            if settings.LOG_SQL:
+                logger.info("SQL", sql=sql)
+
+
+def get_query_shape(sql: str) -> str:
+    """
+    Get the shape of a query, being the SQL with lists of placeholders collapsed,
+    so that the same query made for different rows share the same shape.
+    """
+
+    return _PLACEHOLDER_LIST_RE.sub("(...)", sql)
@@ -0,0 +1,219 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, TypeVar, cast
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model, QuerySet
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+Q = TypeVar("Q", bound=QuerySet[Any])
+
+# Alias of the read replica in settings.DATABASES, only configured when
+# DATABASE_REPLICA_URL is set.
+REPLICA_DATABASE = "replica"
+
+# Seconds the replica is behind the primary, 0 when it has replayed everything it
+# has received, as the replay timestamp doesn't advance while the primary is idle.
+# NULL when not connected to a replica.
+_REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+@dataclass
+class ReplicaPinning:
+    """
+    Whether reads within a request are pinned to the primary, either because
+    the request writes, or because the client recently did, see
+    aria.core.middleware.ReplicaPinningMiddleware.
+    """
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+@dataclass
+class _ReplicaLagCheck:
+    checked_at: float = float("-inf")
+    available: bool = False
+
+
+_replica_pinning: ContextVar[ReplicaPinning | None] = ContextVar(
+    "replica_pinning", default=None
+)
+_use_replica: ContextVar[bool] = ContextVar("use_replica", default=False)
+_replica_lag_check = _ReplicaLagCheck()
+
+
+@contextmanager
+def replica_pinning(*, pinned: bool) -> Iterator[ReplicaPinning]:
+    """
+    Allow reads to go to the replica for the duration of the block, typically a
+    request, unless pinned to the primary. Writes made within the block pin
+    following reads to the primary. Outside of the block, e.g. in Celery tasks,
+    all reads go to the primary.
+    """
+
+    pinning = ReplicaPinning(pinned=pinned)
+    token = _replica_pinning.set(pinning)
+
+    try:
+        yield pinning
+    finally:
+        _replica_pinning.reset(token)
+
+
+def use_replica(func: F) -> F:
+    """
+    Read from the replica within the decorated selector, if the replica is
+    configured, not lagging, and the request isn't pinned to the primary.
+
+    Querysets returned by the selector and evaluated after it returns are read
+    from the primary, use replica_queryset for those.
+    """
+
+    @functools.wraps(func)
+    def inner(*args: Any, **kwargs: Any) -> Any:
+        token = _use_replica.set(True)
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _use_replica.reset(token)
+
+    return cast(F, inner)
+
+
+def replica_queryset(queryset: Q) -> Q:
+    """
+    Read the queryset from the replica if usable, see use_replica, regardless of
+    where it's evaluated.
+    """
+
+    token = _use_replica.set(True)
+
+    try:
+        database = replica_database_for_read()
+    finally:
+        _use_replica.reset(token)
+
+    return queryset.using(database)
+
+
+def replica_database_for_read() -> str:
+    """
+    Get the alias of the database to read from in the current context.
+    """
+
+    pinning = _replica_pinning.get()
+
+    if not _use_replica.get() or pinning is None or pinning.pinned:
+        return DEFAULT_DB_ALIAS
+
+    if not _replica_available():
+        return DEFAULT_DB_ALIAS
+
+    return REPLICA_DATABASE
+
+
+def replica_lag(*, database: str = REPLICA_DATABASE) -> float | None:
+    """
+    Get the number of seconds the replica is behind the primary, None if the
+    database is not a replica.
+    """
+
+    with connections[database].cursor() as cursor:
+        cursor.execute(_REPLICA_LAG_SQL)
+        lag = cursor.fetchone()[0]
+
+    return float(lag) if lag is not None else None
+
+
+def _replica_available() -> bool:
+    # The lag is checked at most every REPLICA_LAG_CHECK_INTERVAL seconds per
+    # process, to not add a query to every read.
+    if REPLICA_DATABASE not in settings.DATABASES:
+        return False
+
+    now = time.monotonic()
+
+    if now - _replica_lag_check.checked_at < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return _replica_lag_check.available
+
+    _replica_lag_check.checked_at = now
+
+    try:
+        lag = replica_lag()
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning("Checking replica lag failed", exc_info=exc)
+        _replica_lag_check.available = False
+        return False
+
+    _replica_lag_check.available = (lag or 0) <= settings.REPLICA_MAX_LAG
+
+    if not _replica_lag_check.available:
+        logger.warning("Replica lagging %.2f seconds, reading from primary", lag)
+
+    return _replica_lag_check.available
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads of selectors decorated with use_replica to the
+    replica, and everything else to the primary, see:
+    https://docs.djangoproject.com/en/4.1/topics/db/multi-db/#database-routers
+    """
+
+    def db_for_read(
+        self, model: type[Model], **hints: Any  # pylint: disable=unused-argument
+    ) -> str:
+        """
+        Read from the replica within selectors decorated with use_replica.
+        """
+
+        return replica_database_for_read()
+
+    def db_for_write(
+        self, model: type[Model], **hints: Any  # pylint: disable=unused-argument
+    ) -> str:
+        """
+        Write to the primary, pinning following reads within the request to the
+        primary, as the write might not yet be replicated.
+        """
+
+        pinning = _replica_pinning.get()
+
+        if pinning is not None:
+            pinning.pinned = True
+            pinning.wrote = True
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(
+        self, obj1: Model, obj2: Model, **hints: Any  # pylint: disable=unused-argument
+    ) -> bool:
+        """
+        Allow relations between objects read from the primary and the replica,
+        as they hold the same data.
+        """
+
+        return True
+
+    def allow_migrate(  # pylint: disable=unused-argument
+        self, db: str, app_label: str, model_name: str | None = None, **hints: Any
+    ) -> bool:
+        """
+        Only migrate the primary, the replica is migrated by replicating it.
+        """
+
+        return db != REPLICA_DATABASE
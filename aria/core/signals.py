@@ -0,0 +1,89 @@
+import os
+import time
+from typing import Any
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from celery import Task
+from celery.signals import (
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_shutdown,
+)
+
+from aria.core.metrics import (
+    metrics_mark_process_dead,
+    metrics_observe_task,
+    metrics_record_db_connection,
+    metrics_start_http_server,
+)
+from aria.core.performance import request_performance_record_db_connection
+
+_task_start_times: dict[str, float] = {}
+
+
+@task_prerun.connect  # type: ignore
+def record_task_start_time(
+    task_id: str, task: Task, **kwargs: Any  # pylint: disable=unused-argument
+) -> None:
+    """
+    Record when a task started running, used to measure its duration.
+    """
+
+    _task_start_times[task_id] = time.perf_counter()
+
+
+@task_postrun.connect  # type: ignore
+def record_task_duration(
+    task_id: str, task: Task, state: str | None = None, **kwargs: Any
+) -> None:
+    """
+    Record the duration of a finished task as a metric.
+    """
+
+    start = _task_start_times.pop(task_id, None)
+
+    if start is None:
+        return
+
+    metrics_observe_task(
+        task=task.name, state=state, duration=time.perf_counter() - start
+    )
+
+
+@worker_init.connect  # type: ignore
+def start_worker_metrics_server(**kwargs: Any) -> None:
+    """
+    Serve metrics of the Celery worker, as tasks run in a separate service
+    from the one serving requests, if CELERY_METRICS_PORT is set.
+    """
+
+    if settings.CELERY_METRICS_PORT is None:
+        return
+
+    metrics_start_http_server(port=settings.CELERY_METRICS_PORT)
+
+
+@worker_process_shutdown.connect  # type: ignore
+def mark_worker_process_dead(**kwargs: Any) -> None:
+    """
+    Clean up metrics of worker processes exiting, e.g. when replaced after
+    running a maximum number of tasks.
+    """
+
+    metrics_mark_process_dead(pid=os.getpid())
+
+
+@receiver(connection_created)
+def record_db_connection(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Record database connections being opened, as a metric and for the request
+    being handled, to tell how often connections are reused.
+    """
+
+    metrics_record_db_connection(alias=connection.alias)
+    request_performance_record_db_connection()
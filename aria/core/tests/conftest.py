@@ -0,0 +1,16 @@
+import pytest
+
+from aria.core import replicas
+
+
+@pytest.fixture
+def replica(mocker, monkeypatch, settings):
+    """
+    Configure a replica, not lagging behind the primary. Queries aren't made
+    against it, only the database reads are routed to is checked.
+    """
+
+    monkeypatch.setitem(settings.DATABASES, "replica", settings.DATABASES["default"])
+    monkeypatch.setattr(replicas, "_replica_lag_check", replicas._ReplicaLagCheck())
+
+    return mocker.patch("aria.core.replicas.replica_lag", return_value=0.0)
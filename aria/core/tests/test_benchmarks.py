@@ -0,0 +1,125 @@
+import json
+
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from aria.categories.models import Category
+from aria.core.benchmarks import BenchmarkResult, benchmark_results_compare
+from aria.discounts.models import Discount
+from aria.product_attributes.models import Variant
+from aria.products.models import Product, ProductOption
+from aria.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+class TestCoreBenchmarks:
+    def test_benchmark_results_compare(self) -> None:
+        """
+        Test that results exceeding the baseline by more than the tolerance, or
+        making more queries, are reported as regressions.
+        """
+
+        baseline = [
+            BenchmarkResult(
+                name="selector",
+                rounds=5,
+                wall_time_min=8.0,
+                wall_time_median=10.0,
+                num_queries=4,
+                peak_memory=100.0,
+            ).dict()
+        ]
+
+        result = BenchmarkResult(
+            name="selector",
+            rounds=5,
+            wall_time_min=9.0,
+            wall_time_median=11.0,
+            num_queries=4,
+            peak_memory=100.0,
+        )
+
+        assert not benchmark_results_compare(
+            results=[result], baseline=baseline, tolerance=0.2
+        )
+
+        result.wall_time_median = 13.0
+        result.num_queries = 5
+
+        assert benchmark_results_compare(
+            results=[result], baseline=baseline, tolerance=0.2
+        ) == [
+            "selector: wall_time_median regressed from 10.0 to 13.0.",
+            "selector: num_queries regressed from 4 to 5.",
+        ]
+
+    def test_seed_benchmark_catalogue_and_benchmark_selectors(self, tmp_path) -> None:
+        """
+        Test that a catalogue is seeded, and that selectors are benchmarked and
+        compared against a baseline.
+        """
+
+        call_command("seed_benchmark_catalogue", products=50, users=10, discounts=2)
+
+        assert Product.objects.filter(name__startswith="Benchmark").count() == 50
+        assert ProductOption.objects.filter(product__name__startswith="Benchmark")
+        assert Discount.objects.filter(name__startswith="Benchmark").count() == 2
+        assert User.objects.filter(email__startswith="benchmark-").count() == 10
+
+        output = tmp_path / "baseline.json"
+
+        call_command("benchmark_selectors", rounds=1, output=output)
+
+        results = json.loads(output.read_text())
+
+        assert {result["name"] for result in results} == {
+            "product_list_for_sale",
+            "product_detail",
+            "discount_active_list",
+            "category_navigation_active_list",
+            "user_list",
+        }
+
+        # Comparing against a baseline making fewer queries is a regression.
+        for result in results:
+            result["num_queries"] = 0
+
+        output.write_text(json.dumps(results))
+
+        with pytest.raises(CommandError):
+            call_command("benchmark_selectors", rounds=1, baseline=output)
+
+    def test_benchmark_startup(self, tmp_path) -> None:
+        """
+        Test that importing and warming up the application is benchmarked.
+        """
+
+        output = tmp_path / "startup.json"
+
+        call_command("benchmark_startup", rounds=1, output=output)
+
+        results = json.loads(output.read_text())
+
+        assert [result["name"] for result in results] == [
+            "import:aria.asgi",
+            "warmup:aria.asgi",
+        ]
+        assert all(result["wall_time_median"] > 0 for result in results)
+        assert all(result["peak_memory"] > 0 for result in results)
+
+    def test_seed_benchmark_catalogue_rerun(self) -> None:
+        """
+        Test that seeding a catalogue again replaces the previous catalogue
+        instead of failing or duplicating rows.
+        """
+
+        call_command("seed_benchmark_catalogue", products=20, users=5, discounts=2)
+        call_command("seed_benchmark_catalogue", products=10, users=5, discounts=1)
+
+        assert Product.objects.filter(name__startswith="Benchmark").count() == 10
+        assert Discount.objects.filter(name__startswith="Benchmark").count() == 1
+        assert Category.objects.filter(name__startswith="Benchmark").count() == 56
+        assert Variant.objects.filter(name__startswith="Benchmark").count() == 150
+        assert User.objects.filter(email__startswith="benchmark-").count() == 5
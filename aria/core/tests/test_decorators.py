@@ -3,12 +3,16 @@ from dataclasses import dataclass
 from django.core.cache import cache
 
 import pytest
+from asgiref.sync import async_to_sync
 
 from aria.core.decorators import (
     NotAllowedInProductionException,
+    QueryBudgetExceededException,
     cached,
     not_in_production,
+    query_budget,
 )
+from aria.users.models import User
 
 
 class TestCoreDecorators:
@@ -87,3 +91,89 @@ class TestCoreDecorators:
 
         func_b.uncache()
         assert "func-b" not in cache
+
+    def test_cached_decorator_version(self) -> None:
+        """
+        Test that the @cached decorator stores a version alongside cached content,
+        which changes with the content and is cleared when uncached.
+        """
+
+        @cached(key="func_c")
+        def func_c() -> list[int]:
+            return func_c.value
+
+        func_c.value = [1, 2]
+
+        assert func_c.version() is None
+        assert func_c() == [1, 2]
+
+        version = func_c.version()
+        assert version is not None
+
+        # Re-caching identical content should produce the same version.
+        func_c.uncache()
+        assert func_c.version() is None
+        assert func_c() == [1, 2]
+        assert func_c.version() == version
+
+        # Changed content should produce a different version.
+        func_c.uncache()
+        func_c.value = [1, 2, 3]
+        assert func_c() == [1, 2, 3]
+        assert func_c.version() != version
+
+        # Version should be considered stale if the cached value is deleted
+        # without using the uncache helper.
+        cache.delete("func_c")
+        assert func_c.version() is None
+
+    def test_cached_decorator_async(self) -> None:
+        """
+        Test that the async helpers of the @cached decorator read and populate
+        the same cache entries as the function itself.
+        """
+
+        @cached(key="func_d")
+        def func_d() -> list[int]:
+            func_d.num_times_called += 1
+            return [1, 2]
+
+        func_d.num_times_called = 0
+
+        assert async_to_sync(func_d.aversion)() is None
+        assert async_to_sync(func_d.acall)() == [1, 2]
+        assert cache.get("func_d") == [1, 2]
+        assert async_to_sync(func_d.aversion)() == func_d.version()
+
+        assert async_to_sync(func_d.acall)() == [1, 2]
+        assert func_d() == [1, 2]
+        assert func_d.num_times_called == 1
+
+        func_d.uncache()
+        assert async_to_sync(func_d.aversion)() is None
+
+    @pytest.mark.django_db
+    def test_query_budget_decorator(self, settings, caplog) -> None:
+        """
+        Test that the @query_budget decorator raises an exception when the
+        budget is exceeded if configured to, and logs a warning if not.
+        """
+
+        @query_budget(max_queries=2)
+        def func_d(*, num_queries: int) -> int:
+            for _ in range(num_queries):
+                User.objects.exists()
+
+            return num_queries
+
+        settings.QUERY_BUDGET_RAISE = True
+
+        assert func_d(num_queries=2) == 2
+
+        with pytest.raises(QueryBudgetExceededException):
+            func_d(num_queries=3)
+
+        settings.QUERY_BUDGET_RAISE = False
+
+        assert func_d(num_queries=3) == 3
+        assert "func_d made 3 queries, exceeding its budget of 2." in caplog.text
@@ -0,0 +1,126 @@
+from typing import Any, Callable
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+import pytest
+
+from aria.api_auth.models import OutstandingToken
+from aria.audit_logs.selectors import log_entry_list_for_instance
+from aria.discounts.selectors import discount_active_list
+from aria.front.selectors import site_message_active_list
+from aria.notes.selectors import note_entry_list_for_instance
+from aria.products.filters import ProductSearchFilter
+from aria.products.models import Product
+from aria.users.models import User
+
+
+def get_query_plans(selector: Callable[..., Any], **kwargs: Any) -> str:
+    """
+    Get the query plans of all queries made by the selector.
+    """
+
+    with CaptureQueriesContext(connection) as context:
+        selector(**kwargs)
+
+    plans = []
+
+    with connection.cursor() as cursor:
+        for query in context.captured_queries:
+            cursor.execute(f"EXPLAIN {query['sql']}")
+            plans.extend(row[0] for row in cursor.fetchall())
+
+    return "\n".join(plans)
+
+
+class TestCoreIndexes:
+    @pytest.fixture(autouse=True)
+    def seeded_catalogue(self, db) -> None:  # pylint: disable=unused-argument
+        """
+        Seed a catalogue, and make the planner prefer indexes wherever usable,
+        as tables in tests are too small for an index scan to be cheaper than
+        a sequential scan.
+        """
+
+        call_command("seed_benchmark_catalogue", products=200, users=10, discounts=5)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            # Only applies to the transaction the test runs in.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_product_list_indexes(self) -> None:
+        """
+        Test that a page of products is scanned by status and creation time, or
+        by status and price when filtered and sorted by price.
+        """
+
+        products = Product.objects.available().with_price().order_by("-created_at")
+
+        assert "product_status_created_idx" in products[:20].explain()
+
+        products = ProductSearchFilter(
+            {"min_price": 100, "ordering": "price"},
+            Product.objects.available().with_price(),
+        ).qs
+
+        assert "product_status_price_idx" in products[:20].explain()
+
+    def test_discount_active_list_indexes(self) -> None:
+        """
+        Test that active discounts are found by their active window.
+        """
+
+        plans = get_query_plans(discount_active_list)
+
+        assert "discount_active_window_idx" in plans
+
+    def test_log_and_note_entry_list_indexes(self) -> None:
+        """
+        Test that log and note entries of an instance are found by content type
+        and object id, ordered by creation time.
+        """
+
+        product = Product.objects.first()
+
+        plans = get_query_plans(
+            log_entry_list_for_instance, model=Product, pk=product.id
+        )
+        assert "log_entry_object_created_idx" in plans
+
+        plans = get_query_plans(
+            note_entry_list_for_instance, model=Product, pk=product.id
+        )
+        assert "note_entry_object_created_idx" in plans
+
+    def test_site_message_active_list_indexes(self) -> None:
+        """
+        Test that active site messages are found by their show window.
+        """
+
+        plans = get_query_plans(site_message_active_list)
+
+        assert "site_message_window_idx" in plans
+
+    def test_outstanding_token_index(self) -> None:
+        """
+        Test that outstanding tokens are found by their unique jti, making a
+        composite index with the user redundant.
+        """
+
+        user = User.objects.first()
+        OutstandingToken.objects.bulk_create(
+            OutstandingToken(
+                user=user, jti=f"jti-{i}", token="token", expires_at=timezone.now()
+            )
+            for i in range(100)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE api_auth_outstandingtoken")
+
+        plan = OutstandingToken.objects.filter(jti="jti-1", user_id=user.id).explain()
+
+        assert "Index Scan using api_auth_outstandingtoken_jti" in plan
@@ -0,0 +1,106 @@
+import json
+
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from aria.core.load_testing import LoadTestResult, load_test_results_compare
+from aria.products.tests.utils import create_product
+
+
+class TestCoreLoadTesting:
+    def test_load_test_results_compare(self) -> None:
+        """
+        Test that latency, throughput and error rates worse than the baseline by
+        more than the tolerance are reported as regressions.
+        """
+
+        baseline = [
+            LoadTestResult(
+                name="product_list",
+                requests=1000,
+                errors=0,
+                error_rate=0.0,
+                rps=100.0,
+                p50=10.0,
+                p95=20.0,
+                p99=40.0,
+            ).dict()
+        ]
+
+        result = LoadTestResult(
+            name="product_list",
+            requests=900,
+            errors=5,
+            error_rate=0.0056,
+            rps=90.0,
+            p50=11.0,
+            p95=22.0,
+            p99=44.0,
+        )
+
+        assert not load_test_results_compare(
+            results=[result],
+            baseline=baseline,
+            tolerance=0.2,
+            error_rate_tolerance=0.01,
+        )
+
+        result.p95 = 30.0
+        result.rps = 50.0
+        result.error_rate = 0.05
+
+        assert load_test_results_compare(
+            results=[result],
+            baseline=baseline,
+            tolerance=0.2,
+            error_rate_tolerance=0.01,
+        ) == [
+            "product_list: p95 regressed from 20.0 to 30.0 ms.",
+            "product_list: rps regressed from 100.0 to 50.0.",
+            "product_list: error_rate regressed from 0.0 to 0.05.",
+        ]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_load_test_command(self, live_server, tmp_path) -> None:
+        """
+        Test that load is put on public endpoints of a running server, and that
+        results are compared against a baseline.
+        """
+
+        create_product(product_name="Load tested product", slug="load-tested")
+
+        output = tmp_path / "baseline.json"
+
+        call_command(
+            "load_test",
+            base_url=live_server.url,
+            duration=1,
+            concurrency=2,
+            output=output,
+        )
+
+        results = json.loads(output.read_text())
+
+        assert {result["name"] for result in results} <= {
+            "product_list",
+            "product_detail",
+            "category_list",
+            "discount_list",
+        }
+        assert all(result["requests"] > 0 for result in results)
+        assert all(result["error_rate"] == 0 for result in results)
+
+        for result in results:
+            result["p99"] = 0
+
+        output.write_text(json.dumps(results))
+
+        with pytest.raises(CommandError):
+            call_command(
+                "load_test",
+                base_url=live_server.url,
+                duration=1,
+                concurrency=2,
+                baseline=output,
+            )
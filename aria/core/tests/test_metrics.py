@@ -0,0 +1,158 @@
+import os
+
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+import pytest
+from prometheus_client import REGISTRY
+
+from aria.core.decorators import cached
+from aria.core.metrics import _get_key_prefix, metrics_mark_process_dead
+from aria.core.performance import RequestPerformance, request_performance_measure
+from aria.core.signals import mark_worker_process_dead, start_worker_metrics_server
+from aria.front.tests.utils import create_opening_hours
+
+
+class TestCoreMetrics:
+    @pytest.mark.parametrize(
+        "key,expected_prefix",
+        [
+            ("categories", "categories"),
+            ("front.opening_hours", "front.opening_hours"),
+            ("products.for_sale.filters={'search': 'a.b'}", "products.for_sale"),
+            ("products.category_id=1.filters={}", "products"),
+        ],
+    )
+    def test_get_key_prefix(self, key, expected_prefix) -> None:
+        """
+        Test that ids and filters are left out of the key prefix used as label.
+        """
+
+        assert _get_key_prefix(key) == expected_prefix
+
+    @pytest.mark.django_db
+    def test_core_metrics_view(self, anonymous_client, settings) -> None:
+        """
+        Test that metrics are only exposed to clients sending the configured
+        token, and that request and cache metrics are recorded.
+        """
+
+        settings.METRICS_AUTH_TOKEN = ""
+
+        response = anonymous_client.get("/metrics/")
+        assert response.status_code == 404
+
+        settings.METRICS_AUTH_TOKEN = "secret"
+
+        response = anonymous_client.get("/metrics/")
+        assert response.status_code == 401
+
+        response = anonymous_client.get(
+            "/metrics/", HTTP_AUTHORIZATION="Bearer not-the-secret"
+        )
+        assert response.status_code == 401
+
+        @cached(key="metrics_test.value")
+        def get_value() -> int:
+            return 1
+
+        get_value.uncache()
+        get_value()
+        get_value()
+
+        create_opening_hours()
+        anonymous_client.get("/api/v1/front/opening-hours/")
+
+        response = anonymous_client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+        content = response.content.decode()
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert (
+            'aria_cache_requests_total{prefix="metrics_test.value",result="hit"}'
+            in content
+        )
+        assert (
+            'aria_cache_requests_total{prefix="metrics_test.value",result="miss"}'
+            in content
+        )
+        assert (
+            "aria_request_duration_seconds_count{"
+            'method="GET",operation="opening_hours_detail_api",status="200"}' in content
+        )
+        assert 'aria_request_queries_bucket{le="0.0",operation=' in content
+
+        response = anonymous_client.get(
+            "/metrics/",
+            HTTP_AUTHORIZATION="Bearer secret",
+            HTTP_ACCEPT="application/openmetrics-text",
+        )
+
+        assert response.headers["Content-Type"].startswith(
+            "application/openmetrics-text"
+        )
+        assert response.content.decode().endswith("# EOF\n")
+
+    def test_db_connection_metrics(self) -> None:
+        """
+        Test that database connections opened are recorded, both as a metric and
+        for the request being handled.
+        """
+
+        def get_connections_opened() -> float:
+            return (
+                REGISTRY.get_sample_value(
+                    "aria_db_connections_opened_total", {"alias": "default"}
+                )
+                or 0.0
+            )
+
+        connections_opened = get_connections_opened()
+
+        with request_performance_measure(RequestPerformance()) as performance:
+            connection_created.send(sender=type(connection), connection=connection)
+
+        assert performance.db_connections_opened == 1
+        assert get_connections_opened() == connections_opened + 1
+
+    def test_metrics_mark_process_dead(self, mocker, monkeypatch, tmp_path) -> None:
+        """
+        Test that metrics of exited processes are only cleaned up when running
+        multiple processes.
+        """
+
+        mark_process_dead_mock = mocker.patch(
+            "aria.core.metrics.multiprocess.mark_process_dead"
+        )
+
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        metrics_mark_process_dead(pid=123)
+        assert mark_process_dead_mock.call_count == 0
+
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        metrics_mark_process_dead(pid=123)
+        mark_process_dead_mock.assert_called_once_with(123)
+
+    def test_celery_worker_metrics(self, mocker, settings) -> None:
+        """
+        Test that Celery workers serve metrics when a port is configured, and
+        clean up metrics of exited worker processes.
+        """
+
+        start_http_server_mock = mocker.patch(
+            "aria.core.signals.metrics_start_http_server"
+        )
+        mark_process_dead_mock = mocker.patch(
+            "aria.core.signals.metrics_mark_process_dead"
+        )
+
+        settings.CELERY_METRICS_PORT = None
+        start_worker_metrics_server()
+        assert start_http_server_mock.call_count == 0
+
+        settings.CELERY_METRICS_PORT = 9100
+        start_worker_metrics_server()
+        start_http_server_mock.assert_called_once_with(port=9100)
+
+        mark_worker_process_dead()
+        mark_process_dead_mock.assert_called_once_with(pid=os.getpid())
@@ -0,0 +1,255 @@
+import gzip
+
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.test import AsyncClient, RequestFactory
+
+import brotli
+import pytest
+import zstandard
+from asgiref.sync import async_to_sync
+from structlog.testing import capture_logs
+
+from aria.core import compression
+from aria.core.compression import compress, compression_encoding_for_accept_encoding
+from aria.core.middleware import CompressionMiddleware, RequestPerformanceMiddleware
+from aria.front.tests.utils import create_opening_hours
+from aria.users.models import User
+
+
+class TestCoreMiddleware:
+    @pytest.mark.parametrize(
+        "accept_encoding,expected_encoding",
+        [
+            ("gzip, deflate", "gzip"),
+            ("deflate;q=1.0, gzip;q=0.5", "gzip"),
+            ("gzip;q=0", None),
+            ("identity", None),
+            ("*", "gzip"),
+            ("", None),
+        ],
+    )
+    def test_compression_encoding_for_accept_encoding(
+        self, mocker, accept_encoding, expected_encoding
+    ) -> None:
+        """
+        Test that the encoding is negotiated based on the Accept-Encoding header.
+        """
+
+        mocker.patch.dict(
+            compression.COMPRESSORS,
+            {"gzip": compression.COMPRESSORS["gzip"]},
+            clear=True,
+        )
+
+        assert (
+            compression_encoding_for_accept_encoding(accept_encoding)
+            == expected_encoding
+        )
+
+    def test_compression_encoding_for_accept_encoding_preference(self) -> None:
+        """
+        Test that brotli is preferred over zstandard, and zstandard over gzip.
+        """
+
+        assert compression_encoding_for_accept_encoding("gzip, zstd, br") == "br"
+        assert compression_encoding_for_accept_encoding("gzip, zstd") == "zstd"
+        assert compression_encoding_for_accept_encoding("gzip, br;q=0") == "gzip"
+
+    @pytest.mark.parametrize(
+        "encoding,decompress",
+        [
+            ("br", brotli.decompress),
+            ("zstd", zstandard.decompress),
+            ("gzip", gzip.decompress),
+        ],
+    )
+    def test_compress(self, encoding, decompress) -> None:
+        """
+        Test that content is compressed with each of the supported encodings.
+        """
+
+        content = b'{"name": "Product"}' * 100
+        compressed_content = compress(content, encoding=encoding)
+
+        assert len(compressed_content) < len(content)
+        assert decompress(compressed_content) == content
+
+    def test_compression_middleware(self, settings) -> None:
+        """
+        Test that JSON responses are compressed when the client accepts it, and
+        that small responses are left as is.
+        """
+
+        settings.COMPRESSION_MIN_SIZE = 100
+
+        data = [{"id": i, "name": f"Product {i}"} for i in range(50)]
+        content = JsonResponse(data, safe=False).content
+        request = RequestFactory().get("/api/v1/products/", HTTP_ACCEPT_ENCODING="gzip")
+        middleware = CompressionMiddleware(lambda request: None)
+
+        response = middleware.process_response(request, JsonResponse(data, safe=False))
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert int(response.headers["Content-Length"]) < len(content)
+        assert gzip.decompress(response.content) == content
+
+        # Small bodies should not be compressed.
+        response = middleware.process_response(request, JsonResponse({"id": 1}))
+
+        assert not response.has_header("Content-Encoding")
+        assert response.content == b'{"id": 1}'
+
+        # Nor should responses to clients not accepting a supported encoding.
+        request = RequestFactory().get("/api/v1/products/")
+        response = middleware.process_response(request, JsonResponse(data, safe=False))
+
+        assert not response.has_header("Content-Encoding")
+        assert response.content == content
+
+    def test_compression_middleware_caches_compressed_content(
+        self, mocker, settings
+    ) -> None:
+        """
+        Test that responses with an ETag are only compressed once, and that the
+        compressed content is reused for subsequent responses.
+        """
+
+        cache.clear()
+        settings.COMPRESSION_MIN_SIZE = 100
+
+        data = [{"id": i, "name": f"Product {i}"} for i in range(50)]
+        content = JsonResponse(data, safe=False).content
+        request = RequestFactory().get("/api/v1/products/", HTTP_ACCEPT_ENCODING="gzip")
+        middleware = CompressionMiddleware(lambda request: None)
+        compress_spy = mocker.spy(compression, "_gzip_compress")
+        mocker.patch.dict(compression.COMPRESSORS, {"gzip": compress_spy}, clear=True)
+
+        for _ in range(3):
+            response = JsonResponse(data, safe=False)
+            response.headers["ETag"] = '"abc"'
+            response = middleware.process_response(request, response)
+
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert response.headers["ETag"] == 'W/"abc"'
+            assert gzip.decompress(response.content) == content
+
+        assert compress_spy.call_count == 1
+
+    @pytest.mark.django_db
+    def test_request_performance_middleware(self, anonymous_client, settings) -> None:
+        """
+        Test that query count, cache hits and misses and the operation name are
+        recorded, and reported in the Server-Timing header.
+        """
+
+        settings.REQUEST_PERFORMANCE_SERVER_TIMING = True
+        cache.clear()
+        create_opening_hours()
+        with capture_logs() as logs:
+            response = anonymous_client.get("/api/v1/front/opening-hours/")
+
+        assert response.status_code == 200
+        server_timing = response.headers["Server-Timing"]
+        assert 'cache;desc="0 hits, 1 misses"' in server_timing
+        assert "render;dur=" in server_timing
+        assert "total;dur=" in server_timing
+
+        log_values = next(log for log in logs if log["event"] == "Request performance")
+        assert log_values["operation"] == "opening_hours_detail_api"
+        assert log_values["num_queries"] > 0
+        assert log_values["cache_misses"] == 1
+
+        response = anonymous_client.get("/api/v1/front/opening-hours/")
+
+        server_timing = response.headers["Server-Timing"]
+        assert 'db;dur=0.00;desc="0 queries"' in server_timing
+        assert 'cache;desc="1 hits, 0 misses"' in server_timing
+
+    @pytest.mark.django_db
+    def test_request_performance_middleware_sampling(
+        self, anonymous_client, settings
+    ) -> None:
+        """
+        Test that requests not sampled are not measured.
+        """
+
+        settings.REQUEST_PERFORMANCE_SAMPLE_RATE = 0.0
+
+        response = anonymous_client.get("/api/v1/front/site-messages/")
+
+        assert not response.has_header("Server-Timing")
+
+    @pytest.mark.django_db
+    def test_request_performance_middleware_server_timing_disabled(
+        self, anonymous_client, settings
+    ) -> None:
+        """
+        Test that measurements are not exposed in a Server-Timing header unless
+        enabled.
+        """
+
+        settings.REQUEST_PERFORMANCE_SERVER_TIMING = False
+
+        with capture_logs() as logs:
+            response = anonymous_client.get("/api/v1/front/site-messages/active/")
+
+        assert not response.has_header("Server-Timing")
+        assert any(log["event"] == "Request performance" for log in logs)
+
+    @pytest.mark.django_db
+    def test_request_performance_middleware_repeated_queries(self, settings) -> None:
+        """
+        Test that the same query made several times within a request is logged
+        as a possible N+1, regardless of the parameters used.
+        """
+
+        settings.QUERY_REPEAT_WARNING_THRESHOLD = 3
+
+        def view(request):
+            for i in range(3):
+                list(User.objects.filter(id__in=list(range(i + 1))))
+
+            User.objects.exists()
+
+            return JsonResponse({})
+
+        with capture_logs() as logs:
+            RequestPerformanceMiddleware(view)(RequestFactory().get("/"))
+
+        repeated_query_logs = [
+            log for log in logs if log["event"] == "Repeated query, possible N+1"
+        ]
+
+        assert len(repeated_query_logs) == 1
+        assert repeated_query_logs[0]["count"] == 3
+        assert "IN (...)" in repeated_query_logs[0]["sql"]
+
+    @pytest.mark.django_db
+    def test_request_performance_middleware_async(self, settings) -> None:
+        """
+        Test that requests handled async are measured as well, including queries
+        made from the thread the sync ORM runs in.
+        """
+
+        settings.REQUEST_PERFORMANCE_SERVER_TIMING = True
+        cache.clear()
+        create_opening_hours()
+        client = AsyncClient()
+
+        with capture_logs() as logs:
+            response = async_to_sync(client.get)("/api/v1/front/opening-hours/")
+
+        assert response.status_code == 200
+
+        log_values = next(log for log in logs if log["event"] == "Request performance")
+        assert log_values["operation"] == "opening_hours_detail_api"
+        assert log_values["num_queries"] > 0
+        assert log_values["cache_misses"] == 1
+
+        response = async_to_sync(client.get)("/api/v1/front/opening-hours/")
+
+        server_timing = response.headers["Server-Timing"]
+        assert 'db;dur=0.00;desc="0 queries"' in server_timing
+        assert 'cache;desc="1 hits, 0 misses"' in server_timing
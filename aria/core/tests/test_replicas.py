@@ -0,0 +1,132 @@
+from django.http import HttpResponse
+
+import pytest
+
+from aria.core.middleware import REPLICA_PINNING_COOKIE, ReplicaPinningMiddleware
+from aria.core.replicas import (
+    ReplicaRouter,
+    replica_lag,
+    replica_pinning,
+    replica_queryset,
+    use_replica,
+)
+from aria.products.models import Product
+
+
+@use_replica
+def get_database_for_read() -> str:
+    """
+    Selector returning the database products are read from.
+    """
+
+    return Product.objects.all().db
+
+
+class TestCoreReplicas:
+    @pytest.mark.usefixtures("replica")
+    def test_use_replica(self) -> None:
+        """
+        Test that selectors decorated with use_replica read from the replica
+        within a request, until the request writes.
+        """
+
+        # Outside of a request, e.g. in Celery tasks.
+        assert get_database_for_read() == "default"
+
+        with replica_pinning(pinned=False) as pinning:
+            assert get_database_for_read() == "replica"
+            assert replica_queryset(Product.objects.all()).db == "replica"
+            assert Product.objects.all().db == "default"
+
+            assert ReplicaRouter().db_for_write(Product) == "default"
+            assert pinning.pinned is True
+            assert pinning.wrote is True
+
+            assert get_database_for_read() == "default"
+            assert replica_queryset(Product.objects.all()).db == "default"
+
+        with replica_pinning(pinned=True):
+            assert get_database_for_read() == "default"
+
+    def test_use_replica_without_replica(self) -> None:
+        """
+        Test that everything is read from the primary if no replica is configured.
+        """
+
+        with replica_pinning(pinned=False):
+            assert get_database_for_read() == "default"
+
+    def test_use_replica_lagging(self, replica, settings) -> None:
+        """
+        Test that reads go to the primary while the replica is lagging, or its
+        lag can't be checked, and that the lag is only checked once per interval.
+        """
+
+        settings.REPLICA_MAX_LAG = 5.0
+        settings.REPLICA_LAG_CHECK_INTERVAL = 10.0
+        replica.return_value = 10.0
+
+        with replica_pinning(pinned=False):
+            assert get_database_for_read() == "default"
+            assert get_database_for_read() == "default"
+            assert replica.call_count == 1
+
+            settings.REPLICA_LAG_CHECK_INTERVAL = 0.0
+            replica.return_value = 1.0
+            assert get_database_for_read() == "replica"
+
+            replica.side_effect = Exception
+            assert get_database_for_read() == "default"
+
+    @pytest.mark.django_db
+    def test_replica_lag(self) -> None:
+        """
+        Test that the lag is None when checked against a database not being a
+        replica.
+        """
+
+        assert replica_lag(database="default") is None
+
+    def test_replica_router_allow_migrate(self) -> None:
+        """
+        Test that only the primary is migrated.
+        """
+
+        router = ReplicaRouter()
+
+        assert router.allow_migrate("default", "products") is True
+        assert router.allow_migrate("replica", "products") is False
+
+    @pytest.mark.usefixtures("replica")
+    def test_replica_pinning_middleware(self, rf) -> None:
+        """
+        Test that requests of unsafe methods, or following a write, are pinned
+        to the primary, and that writes pin following requests of the client.
+        """
+
+        def get_response(request):
+            response = HttpResponse(get_database_for_read())
+
+            if request.GET.get("write"):
+                ReplicaRouter().db_for_write(Product)
+
+            return response
+
+        middleware = ReplicaPinningMiddleware(get_response)
+
+        response = middleware(rf.get("/"))
+        assert response.content == b"replica"
+        assert REPLICA_PINNING_COOKIE not in response.cookies
+
+        response = middleware(rf.post("/"))
+        assert response.content == b"default"
+        assert REPLICA_PINNING_COOKIE not in response.cookies
+
+        response = middleware(rf.get("/?write=1"))
+        assert response.content == b"replica"
+        assert response.cookies[REPLICA_PINNING_COOKIE]["max-age"] == 15
+
+        request = rf.get("/")
+        request.COOKIES[REPLICA_PINNING_COOKIE] = "1"
+        response = middleware(request)
+        assert response.content == b"default"
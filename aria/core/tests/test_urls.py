@@ -11,4 +11,9 @@ class TestPublicCoreEndpoints:
 
 
 class TestPrivateCoreEndpoints:
-    pass
+    def test_url_core_metrics_view(self) -> None:
+        """
+        Test reverse match of core_metrics_view endpoint.
+        """
+        url = reverse("core-metrics")
+        assert url == "/metrics/"
@@ -0,0 +1,110 @@
+import importlib
+import os
+from types import SimpleNamespace
+
+from django.core.cache import cache
+
+import pytest
+
+from aria import gunicorn_config
+from aria.categories.selectors import category_navigation_active_list_from_cache
+from aria.core.warmup import warmup
+from aria.front.selectors import opening_hours_detail_from_cache
+from aria.front.tests.utils import create_opening_hours
+
+
+class TestCoreWarmup:
+    @pytest.mark.django_db
+    def test_warmup(self, mocker) -> None:
+        """
+        Test that warming up primes the caches of selectors used on every page,
+        and closes connections to not share them with forked workers.
+        """
+
+        close_all_mock = mocker.patch("aria.core.warmup.connections.close_all")
+        cache.clear()
+        create_opening_hours()
+
+        warmup()
+
+        assert category_navigation_active_list_from_cache.version() is not None
+        assert opening_hours_detail_from_cache.version() is not None
+        assert close_all_mock.call_count == 1
+
+    def test_warmup_failing_selector(self, mocker) -> None:
+        """
+        Test that a failing selector, e.g. when the database is not yet available,
+        doesn't stop startup.
+        """
+
+        mocker.patch("aria.core.warmup.connections.close_all")
+        failing_selector = mocker.Mock(side_effect=Exception, __qualname__="failing")
+        mocker.patch("aria.core.warmup.WARMUP_SELECTORS", [failing_selector])
+
+        warmup()
+
+        assert failing_selector.call_count == 1
+
+    @pytest.mark.parametrize(
+        "worker_class,expected_worker_class,expected_wsgi_app,expected_conn_max_age",
+        [
+            (None, "uvicorn.workers.UvicornWorker", "aria.asgi:application", None),
+            (
+                "uvicorn",
+                "uvicorn.workers.UvicornWorker",
+                "aria.asgi:application",
+                None,
+            ),
+            ("gthread", "gthread", "aria.wsgi:application", "600"),
+        ],
+    )
+    def test_gunicorn_config_worker_class(  # pylint: disable=too-many-arguments
+        self,
+        monkeypatch,
+        worker_class,
+        expected_worker_class,
+        expected_wsgi_app,
+        expected_conn_max_age,
+    ) -> None:
+        """
+        Test that the worker class, and the application it serves, is selected
+        from the environment, and that only threaded workers keep database
+        connections open by default.
+        """
+
+        monkeypatch.delenv("DATABASE_CONN_MAX_AGE", raising=False)
+
+        if worker_class is None:
+            monkeypatch.delenv("GUNICORN_WORKER_CLASS", raising=False)
+        else:
+            monkeypatch.setenv("GUNICORN_WORKER_CLASS", worker_class)
+
+        config = importlib.reload(gunicorn_config)
+
+        assert config.worker_class == expected_worker_class
+        assert config.wsgi_app == expected_wsgi_app
+        assert config.preload_app is True
+        assert config.max_requests_jitter > 0
+        assert os.environ.get("DATABASE_CONN_MAX_AGE") == expected_conn_max_age
+
+    def test_gunicorn_config_when_ready(self, mocker) -> None:
+        """
+        Test that the preloaded application is warmed up before workers are
+        forked, and that objects created so far are frozen.
+        """
+
+        warmup_mock = mocker.patch("aria.core.warmup.warmup")
+        freeze_mock = mocker.patch("aria.gunicorn_config.gc.freeze")
+
+        gunicorn_config.when_ready(
+            SimpleNamespace(cfg=SimpleNamespace(preload_app=False))
+        )
+
+        assert warmup_mock.call_count == 0
+
+        gunicorn_config.when_ready(
+            SimpleNamespace(cfg=SimpleNamespace(preload_app=True))
+        )
+
+        assert warmup_mock.call_count == 1
+        assert freeze_mock.call_count == 1
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+from aria.core.metrics import metrics_render
+
+
+@require_GET
+def core_metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Expose metrics to be scraped by Prometheus. Requires the METRICS_AUTH_TOKEN
+    setting sent as a bearer token, and is not available if the token is not set.
+    """
+
+    if not settings.METRICS_AUTH_TOKEN:
+        raise Http404
+
+    if not constant_time_compare(
+        request.headers.get("Authorization", ""),
+        f"Bearer {settings.METRICS_AUTH_TOKEN}",
+    ):
+        return HttpResponse(status=401)
+
+    content, content_type = metrics_render(accept=request.headers.get("Accept"))
+
+    return HttpResponse(content, content_type=content_type)
@@ -0,0 +1,48 @@
+import logging
+import time
+
+from django.db import connections
+from django.urls import URLResolver, get_resolver
+
+from aria.categories.selectors import category_navigation_active_list_from_cache
+from aria.front.selectors import opening_hours_detail_from_cache
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SELECTORS = [
+    category_navigation_active_list_from_cache,
+    opening_hours_detail_from_cache,
+]
+
+
+def warmup() -> None:
+    """
+    Prepare the application for traffic, typically in the gunicorn master process
+    before forking workers, see aria.gunicorn_config.
+
+    The url configuration is loaded, including the url patterns of each api, which
+    are otherwise built on the first request to the api, importing every router
+    and building the schemas of their operations. The caches of selectors used on
+    every page are primed. Failing to prime a cache, e.g. if the database is not
+    yet available, is logged without stopping startup.
+    """
+
+    start = time.perf_counter()
+
+    # Accessing the url patterns imports the url configuration, and the url
+    # patterns of included configurations, such as those of apis, are built.
+    for pattern in get_resolver().url_patterns:
+        if isinstance(pattern, URLResolver):
+            pattern.url_patterns  # pylint: disable=pointless-statement
+
+    for selector in WARMUP_SELECTORS:
+        try:
+            selector()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Warming up %s failed", selector.__qualname__, exc_info=exc)
+
+    # Connections opened while warming up must not be inherited by forked
+    # workers, as a connection can't be shared between processes.
+    connections.close_all()
+
+    logger.info("Warmed up in %.2f ms", (time.perf_counter() - start) * 1000)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DiscountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "aria.discounts"
+
+    def ready(self) -> None:
+        import aria.discounts.signals  # noqa: F401 pylint: disable=unused-import
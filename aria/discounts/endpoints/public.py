@@ -2,6 +2,7 @@ from django.http import HttpRequest
 
 from ninja import Router
 
+from aria.api.decorators import conditional
 from aria.discounts.schemas.outputs import DiscountsActiveListOutput
 from aria.discounts.selectors import discount_active_list_from_cache
 
@@ -13,12 +14,13 @@ router = Router(tags=["Discounts"])
     response={200: list[DiscountsActiveListOutput]},
     summary="List all active discounts",
 )
-def discount_list_api(request: HttpRequest) -> list[DiscountsActiveListOutput]:
+@conditional(version=discount_active_list_from_cache.aversion)  # type: ignore
+async def discount_list_api(request: HttpRequest) -> list[DiscountsActiveListOutput]:
     """
     Retrieve a list of currently active discounts.
     """
 
-    active_discounts = discount_active_list_from_cache()
+    active_discounts = await discount_active_list_from_cache.acall()  # type: ignore
 
     return [
         DiscountsActiveListOutput(**discount.dict()) for discount in active_discounts
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the table against writes, which can't be
+    # done within a transaction.
+    atomic = False
+
+    dependencies = [
+        ('discounts', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='discount',
+            index=models.Index(fields=['active_at', 'active_to'], name='discount_active_window_idx'),
+        ),
+    ]
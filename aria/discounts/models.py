@@ -114,6 +114,12 @@ class Discount(BaseModel):
     class Meta:
         verbose_name = "Discount"
         verbose_name_plural = "Discounts"
+        indexes = [
+            # Currently active discounts, see DiscountQuerySet.active.
+            models.Index(
+                fields=["active_at", "active_to"], name="discount_active_window_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -2,7 +2,7 @@ from typing import TypedDict
 
 from django.db.models import Prefetch
 
-from aria.core.decorators import cached
+from aria.core.decorators import cached, query_budget
 from aria.discounts.models import Discount
 from aria.discounts.records import DiscountRecord
 from aria.product_attributes.records import (
@@ -68,6 +68,7 @@ class DiscountDataDict(TypedDict):
     products: set[int]
 
 
+@query_budget(max_queries=12)
 def discount_active_list() -> list[DiscountRecord]:
     """
     Get a list of currently active discounts.
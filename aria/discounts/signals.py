@@ -0,0 +1,99 @@
+from typing import Any
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from aria.discounts.models import Discount
+from aria.products.models import Product, ProductOption
+from aria.products.services.pricing import product_prices_update
+
+
+def _discount_product_ids(*, discount: Discount) -> set[int]:
+    """
+    Get ids of products the discount applies to, directly or through options.
+    """
+
+    return set(discount.products.values_list("id", flat=True)) | set(
+        discount.product_options.values_list("product_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=Discount)
+def update_product_prices_on_save(
+    sender: Discount,  # pylint: disable=unused-argument
+    instance: Discount,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Update the stored prices of products the saved discount applies to.
+    """
+
+    product_prices_update(product_ids=_discount_product_ids(discount=instance))
+
+
+@receiver(pre_delete, sender=Discount)
+def collect_discounted_products(
+    sender: Discount,  # pylint: disable=unused-argument
+    instance: Discount,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Collect products the discount applies to, as they're no longer related to it
+    once deleted.
+    """
+
+    instance._discounted_product_ids = _discount_product_ids(  # type: ignore # pylint: disable=protected-access,line-too-long
+        discount=instance
+    )
+
+
+@receiver(post_delete, sender=Discount)
+def update_product_prices_on_delete(
+    sender: Discount,  # pylint: disable=unused-argument
+    instance: Discount,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Update the stored prices of products the deleted discount applied to.
+    """
+
+    product_prices_update(
+        product_ids=getattr(instance, "_discounted_product_ids", set())
+    )
+
+
+@receiver(m2m_changed, sender=Discount.products.through)
+@receiver(m2m_changed, sender=Discount.product_options.through)
+def update_product_prices_on_change(
+    sender: Any,  # pylint: disable=unused-argument
+    instance: Discount | Product | ProductOption,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Update the stored prices of products added to or removed from a discount,
+    either directly or through their options.
+    """
+
+    action = kwargs.get("action", None)
+
+    if isinstance(instance, Product):
+        product_ids = {instance.id}
+    elif isinstance(instance, ProductOption):
+        product_ids = {instance.product_id}
+    elif action in ("pre_add", "pre_remove", "pre_clear"):
+        # Products no longer discounted after the change are collected beforehand.
+        instance._discounted_product_ids = _discount_product_ids(  # type: ignore # pylint: disable=protected-access,line-too-long
+            discount=instance
+        )
+        return
+    else:
+        product_ids = getattr(
+            instance, "_discounted_product_ids", set()
+        ) | _discount_product_ids(discount=instance)
+
+    if action in ("post_add", "post_remove", "post_clear"):
+        product_prices_update(product_ids=product_ids)
@@ -80,6 +80,9 @@ class TestDiscountsSelectors:
         )
 
         def _product_record(product: Product, **kwargs) -> ProductListRecord:
+            # Load the from price stored as options were created.
+            product.refresh_from_db(fields=["from_price"])
+
             return ProductListRecord(
                 id=product.id,
                 name=product.name,
@@ -296,6 +299,9 @@ class TestDiscountsSelectors:
         assert "discounts.active" not in cache
 
         def _product_record(product: Product, **kwargs) -> ProductListRecord:
+            # Load the from price stored as options were created.
+            product.refresh_from_db(fields=["from_price"])
+
             return ProductListRecord(
                 id=product.id,
                 name=product.name,
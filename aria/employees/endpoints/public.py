@@ -11,11 +11,11 @@ router = Router(tags=["Employees"])
 @router.get(
     "/", response={200: list[EmployeeListOutput]}, summary="Get employees for a site"
 )
-def employee_list_api(request: HttpRequest) -> list[EmployeeListOutput]:
+async def employee_list_api(request: HttpRequest) -> list[EmployeeListOutput]:
     """
     Endpoint for listing team employees related to site.
     """
 
-    employees = employees_active_list_from_cache()
+    employees = await employees_active_list_from_cache.acall()  # type: ignore
 
     return [EmployeeListOutput(**employee.dict()) for employee in employees]
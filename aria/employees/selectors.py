@@ -1,8 +1,9 @@
-from aria.core.decorators import cached
+from aria.core.decorators import cached, query_budget
 from aria.employees.models import EmployeeInfo
 from aria.employees.records import EmployeeInfoRecord
 
 
+@query_budget(max_queries=1)
 def employees_active_list() -> list[EmployeeInfoRecord]:
     """
     Get a list of employees associated with a certain site.
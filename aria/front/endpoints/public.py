@@ -2,6 +2,7 @@ from django.http import HttpRequest
 
 from ninja import Router
 
+from aria.api.decorators import conditional
 from aria.front.schemas.outputs import OpeningHoursOutput, SiteMessageOutput
 from aria.front.selectors import (
     opening_hours_detail_from_cache,
@@ -16,14 +17,15 @@ router = Router(tags=["Front"])
     response={200: OpeningHoursOutput},
     summary="Get opening hours for a site",
 )
-def opening_hours_detail_api(
+@conditional(version=opening_hours_detail_from_cache.aversion)  # type: ignore
+async def opening_hours_detail_api(
     request: HttpRequest,
 ) -> tuple[int, OpeningHoursOutput]:
     """
     Retrieve opening hours for a single site instance based on site id.
     """
 
-    opening_hours = opening_hours_detail_from_cache()
+    opening_hours = await opening_hours_detail_from_cache.acall()  # type: ignore
 
     return 200, OpeningHoursOutput(**opening_hours.dict())
 
@@ -33,13 +35,14 @@ def opening_hours_detail_api(
     response={200: list[SiteMessageOutput]},
     summary="Get site messages for a site",
 )
-def site_messages_active_list_api(
+@conditional(version=site_message_active_list_from_cache.aversion)  # type: ignore
+async def site_messages_active_list_api(
     request: HttpRequest,
 ) -> list[SiteMessageOutput]:
     """
     Retrieve a list of active site messages for a specific site.
     """
 
-    site_messages = site_message_active_list_from_cache()
+    site_messages = await site_message_active_list_from_cache.acall()  # type: ignore
 
     return [SiteMessageOutput(**site_message.dict()) for site_message in site_messages]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the table against writes, which can't be
+    # done within a transaction.
+    atomic = False
+
+    dependencies = [
+        ('front', '0001_squashed_0002_remove_openinghours_site_remove_sitemessage_site'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='sitemessage',
+            index=models.Index(fields=['show_message_at', 'show_message_to'], name='site_message_window_idx'),
+        ),
+    ]
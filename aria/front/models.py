@@ -263,6 +263,15 @@ class SiteMessage(BaseModel):
 
     objects = _SiteMessageManager()
 
+    class Meta:
+        indexes = [
+            # Messages currently shown, see site_message_active_list.
+            models.Index(
+                fields=["show_message_at", "show_message_to"],
+                name="site_message_window_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return (
             f"{self.get_message_type_display()} {self.show_message_at} "
@@ -1,6 +1,6 @@
 from django.utils import timezone
 
-from aria.core.decorators import cached
+from aria.core.decorators import cached, query_budget
 from aria.front.enums import OpeningHoursWeekdays, SiteMessageType
 from aria.front.models import OpeningHours, OpeningHoursTimeSlot, SiteMessage
 from aria.front.records import (
@@ -38,6 +38,7 @@ def site_message_record(site_message: SiteMessage) -> SiteMessageRecord:
     )
 
 
+@query_budget(max_queries=2)
 def site_message_active_list() -> list[SiteMessageRecord]:
     """
     Retrieve a list of active site messages.
@@ -274,6 +275,7 @@ def _opening_hours_time_slots_merge_to_human_readable(
     return time_slot_by_weekday
 
 
+@query_budget(max_queries=5)
 def opening_hours_detail() -> OpeningHoursRecord:
     """
     Retrieve opening hours. This selector will at all times return current
@@ -1,6 +1,7 @@
 import json
 from datetime import timedelta
 
+from django.core.cache import cache
 from django.utils import timezone
 
 import pytest
@@ -18,6 +19,48 @@ class TestPublicFrontEndoints:
 
     BASE_ENDPOINT = "/api/v1/front"
 
+    def test_opening_hours_detail_api_conditional_request(
+        self, django_assert_max_num_queries, anonymous_client
+    ) -> None:
+        """
+        Test that a client with a matching ETag gets a 304 Not Modified response
+        without hitting the database, and that the ETag changes with the content.
+        """
+
+        cache.clear()
+        opening_hours = create_opening_hours()
+
+        response = anonymous_client.get(f"{self.BASE_ENDPOINT}/opening-hours/")
+        etag = response.headers["ETag"]
+
+        assert response.status_code == 200
+        assert "max-age=60" in response.headers["Cache-Control"]
+        assert "public" in response.headers["Cache-Control"]
+
+        with django_assert_max_num_queries(0):
+            response = anonymous_client.get(
+                f"{self.BASE_ENDPOINT}/opening-hours/", HTTP_IF_NONE_MATCH=etag
+            )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        # Changing the opening hours uncaches it, so the content should be
+        # rendered again with a new ETag.
+        create_opening_hours_deviation(
+            opening_hours_id=opening_hours.id,
+            active_at=timezone.now(),
+            active_to=timezone.now() + timedelta(minutes=10),
+        )
+
+        response = anonymous_client.get(
+            f"{self.BASE_ENDPOINT}/opening-hours/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     def test_opening_hours_detail_api(
         self, django_assert_max_num_queries, anonymous_client
     ) -> None:
@@ -0,0 +1,72 @@
+"""
+Gunicorn configuration, used by passing "--config python:aria.gunicorn_config".
+
+For more information on this file, see
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import os
+from typing import Any
+
+# Public endpoints are async views, served concurrently by uvicorn workers running
+# the ASGI application. Set GUNICORN_WORKER_CLASS=gthread to serve the WSGI
+# application by threaded workers instead.
+WORKER_CLASSES = {
+    "uvicorn": ("uvicorn.workers.UvicornWorker", "aria.asgi:application"),
+    "gthread": ("gthread", "aria.wsgi:application"),
+}
+
+worker_class, wsgi_app = WORKER_CLASSES[
+    os.environ.get("GUNICORN_WORKER_CLASS", "uvicorn")
+]
+
+# Threaded workers keep database connections open for reuse by later requests,
+# unless configured otherwise. Uvicorn workers don't, see DATABASE_CONN_MAX_AGE in
+# aria.settings.
+if worker_class == "gthread":
+    os.environ.setdefault("DATABASE_CONN_MAX_AGE", "600")
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+# Only used by gthread workers.
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# The application is imported and warmed up once in the master process, see
+# when_ready, and shared with forked workers instead of being imported by each.
+preload_app = True
+
+# Workers are restarted after a number of requests to release memory they have
+# accumulated. The jitter keeps workers from restarting at the same time.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+
+def when_ready(server: Any) -> None:
+    """
+    Warm up the preloaded application before workers are forked.
+    """
+
+    if not server.cfg.preload_app:
+        return
+
+    from aria.core.warmup import warmup  # pylint: disable=import-outside-toplevel
+
+    warmup()
+
+    # Objects created so far are shared with the workers. Freezing them keeps the
+    # garbage collector from writing to, and thereby copying, their memory pages
+    # in each worker.
+    gc.freeze()
+
+
+def child_exit(server: Any, worker: Any) -> None:  # pylint: disable=unused-argument
+    """
+    Clean up metrics of workers exiting, e.g. when restarted after timing out.
+    """
+
+    # Imported here, as the module must be imported after PROMETHEUS_MULTIPROC_DIR
+    # is set in the environment.
+    from aria.core.metrics import (  # pylint: disable=import-outside-toplevel
+        metrics_mark_process_dead,
+    )
+
+    metrics_mark_process_dead(pid=worker.pid)
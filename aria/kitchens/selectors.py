@@ -1,5 +1,6 @@
 from django.db.models import Q
 
+from aria.core.decorators import query_budget
 from aria.files.records import BaseCollectionListImageRecord, BaseHeaderImageRecord
 from aria.kitchens.models import Kitchen
 from aria.kitchens.records import (
@@ -28,6 +29,7 @@ def kitchen_record(*, kitchen: Kitchen) -> KitchenRecord:
     )
 
 
+@query_budget(max_queries=1)
 def kitchen_available_list() -> list[KitchenRecord]:
     """
     Returns a list of active kitchens.
@@ -38,6 +40,7 @@ def kitchen_available_list() -> list[KitchenRecord]:
     return [kitchen_record(kitchen=kitchen) for kitchen in kitchens]
 
 
+@query_budget(max_queries=7)
 def kitchen_detail(
     *, kitchen_id: int | None = None, kitchen_slug: str | None = None
 ) -> KitchenDetailRecord | None:
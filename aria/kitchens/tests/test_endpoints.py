@@ -12,6 +12,37 @@ class TestPublicKitchensEndpoints:
 
     BASE_ENDPOINT = "/api/v1/kitchens"
 
+    def test_anonymous_request_kitchen_list_api_conditional_request(
+        self, anonymous_client
+    ) -> None:
+        """
+        Test that uncached endpoints get an ETag based on the rendered content,
+        and return 304 Not Modified when the client has a matching copy.
+        """
+
+        create_kitchen(name="Kitchen 1")
+
+        response = anonymous_client.get(f"{self.BASE_ENDPOINT}/")
+        etag = response.headers["ETag"]
+
+        assert response.status_code == 200
+
+        response = anonymous_client.get(
+            f"{self.BASE_ENDPOINT}/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+        create_kitchen(name="Kitchen 2")
+
+        response = anonymous_client.get(
+            f"{self.BASE_ENDPOINT}/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     def test_anonymous_request_kitchen_list_api(
         self, anonymous_client, django_assert_max_num_queries
     ) -> None:
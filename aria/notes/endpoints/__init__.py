@@ -1,3 +0,0 @@
-from aria.notes.endpoints.private import router as internal_endpoints
-
-__all__ = ["internal_endpoints"]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the table against writes, which can't be
+    # done within a transaction.
+    atomic = False
+
+    dependencies = [
+        ('notes', '0004_alter_noteentry_author_alter_noteentry_content_type_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='noteentry',
+            index=models.Index(fields=['content_type', 'object_id', '-created_at'], name='note_entry_object_created_idx'),
+        ),
+    ]
@@ -29,6 +29,13 @@ class NoteEntry(BaseModel):
     class Meta:
         verbose_name = "Note"
         verbose_name_plural = "Notes"
+        indexes = [
+            # Notes of an object, newest first.
+            models.Index(
+                fields=["content_type", "object_id", "-created_at"],
+                name="note_entry_object_created_idx",
+            ),
+        ]
         permissions = (
             ("has_notes_list", "Can view notes"),
             ("has_notes_add", "Can add new notes"),
@@ -1,3 +0,0 @@
-from aria.product_attributes.endpoints.internal import router as internal_endpoints
-
-__all__ = ["internal_endpoints"]
@@ -0,0 +1,64 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:56
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+def deduplicate_sizes(apps, schema_editor):
+    """
+    Merge sizes with the same dimensions, which the previous constraint allowed
+    when a dimension is missing, into the oldest of them. Options of a product
+    which then duplicate another option of the same variant and size are deleted.
+    """
+
+    Size = apps.get_model("product_attributes", "Size")
+    ProductOption = apps.get_model("products", "ProductOption")
+
+    canonical_sizes = {}
+
+    for size in Size.objects.order_by("id"):
+        key = (size.width, size.height, size.depth, size.circumference)
+        canonical_size = canonical_sizes.setdefault(key, size)
+
+        if canonical_size.id == size.id:
+            continue
+
+        for option in ProductOption.objects.filter(size_id=size.id):
+            duplicate_exists = (
+                option.variant_id is not None
+                and ProductOption.objects.filter(
+                    product_id=option.product_id,
+                    variant_id=option.variant_id,
+                    size_id=canonical_size.id,
+                ).exists()
+            )
+
+            if duplicate_exists:
+                option.delete()
+            else:
+                ProductOption.objects.filter(id=option.id).update(
+                    size_id=canonical_size.id
+                )
+
+        size.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product_attributes', '0004_material_room'),
+        ('products', '0020_product_product_status_price_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='size',
+            name='size_unique',
+        ),
+        migrations.RunPython(deduplicate_sizes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='size',
+            constraint=models.UniqueConstraint(django.db.models.functions.comparison.Coalesce('width', models.Value(Decimal('0'))), django.db.models.functions.comparison.Coalesce('height', models.Value(Decimal('0'))), django.db.models.functions.comparison.Coalesce('depth', models.Value(Decimal('0'))), django.db.models.functions.comparison.Coalesce('circumference', models.Value(Decimal('0'))), name='size_dimensions_unique'),
+        ),
+    ]
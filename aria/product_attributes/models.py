@@ -1,6 +1,8 @@
 from decimal import Decimal
 
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from django.utils.text import slugify
 
 from aria.core.models import BaseModel
@@ -150,9 +152,15 @@ class Size(BaseModel):
         verbose_name_plural = "Sizes"
         ordering = ["width", "height", "depth", "circumference"]
         constraints = [
-            models.UniqueConstraint(
-                fields=["width", "height", "depth", "circumference"],
-                name="size_unique",
+            # Missing dimensions are NULL, which never conflict with each other, so
+            # they're compared as 0, which cleaned sizes never hold. Sizes are
+            # looked up by the same expressions, see size_list_from_mapped_values.
+            models.UniqueConstraint(  # type: ignore
+                *[
+                    Coalesce(dimension, Value(Decimal("0")))
+                    for dimension in ("width", "height", "depth", "circumference")
+                ],
+                name="size_dimensions_unique",
             )
         ]
 
@@ -1,6 +1,4 @@
-from decimal import Decimal
-
-from django.db.models import Q
+import itertools
 
 from aria.product_attributes.models import Color, Material, Room, Shape, Size, Variant
 from aria.product_attributes.records import (
@@ -12,6 +10,10 @@ from aria.product_attributes.records import (
     SizeRecord,
     VariantDetailRecord,
 )
+from aria.product_attributes.utils import size_key
+
+# Parameters of a row of size dimensions, typed as NULLs can't be inferred.
+_SIZE_VALUES_ROW = "(%s::numeric, %s::numeric, %s::numeric, %s::numeric)"
 
 ###################
 # Color selectors #
@@ -98,29 +100,26 @@ def size_list_from_mapped_values(values: list[SizeRecord]) -> list[SizeDetailRec
     of mapped instances.
     """
 
-    dict_records = [size_record.dict() for size_record in values]
-
-    # Aggregate all values base on key. Will return something like:
-    # [{"width": [30.0, 20.0, 10.0], "height": [11.0, 20.0]...}...].
-    aggregated_values = {
-        k: [Decimal(val.get(k)) for val in dict_records if val.get(k) is not None]  # type: ignore # pylint: disable=line-too-long
-        for k in set().union(*dict_records)
-    }
-
-    widths = aggregated_values.get("width", [])
-    heights = aggregated_values.get("height", [])
-    depths = aggregated_values.get("depth", [])
-    circumferences = aggregated_values.get("circumference", [])
-
-    sizes = (
-        Size.objects.filter(
-            Q(width__in=widths)
-            | Q(height__in=heights)
-            | Q(depth__in=depths)
-            | Q(circumference__in=circumferences)
-        )
-        .distinct("id")
-        .order_by("-id")
+    keys = list(dict.fromkeys(size_key(size=value) for value in values))
+
+    if not keys:
+        return []
+
+    # Joining against the values compares dimensions the way the size_dimensions_unique
+    # constraint does, using its index.
+    sizes = Size.objects.raw(
+        f"""
+        SELECT size.*
+        FROM {Size._meta.db_table} size
+        JOIN (VALUES {", ".join([_SIZE_VALUES_ROW] * len(keys))})
+            AS value (width, height, depth, circumference)
+        ON COALESCE(size.width, 0) = COALESCE(value.width, 0)
+            AND COALESCE(size.height, 0) = COALESCE(value.height, 0)
+            AND COALESCE(size.depth, 0) = COALESCE(value.depth, 0)
+            AND COALESCE(size.circumference, 0) = COALESCE(value.circumference, 0)
+        ORDER BY size.id DESC
+        """,
+        list(itertools.chain.from_iterable(keys)),
     )
 
     return [
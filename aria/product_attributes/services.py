@@ -1,7 +1,10 @@
+import itertools
 from decimal import Decimal
 
 from django.core.files.images import ImageFile
 from django.core.files.uploadedfile import InMemoryUploadedFile, UploadedFile
+from django.db import connection
+from django.utils import timezone
 from django.utils.text import slugify
 
 from aria.files.validators import image_validate
@@ -15,6 +18,7 @@ from aria.product_attributes.selectors import size_list_from_mapped_values
 from aria.product_attributes.utils import (
     size_clean_and_validate_value,
     size_clean_and_validate_values,
+    size_key,
 )
 
 #################
@@ -59,42 +63,35 @@ def size_create(
 def size_bulk_create(*, sizes: list[SizeRecord]) -> list[SizeDetailRecord]:
     """
     Create sizes in bulk based in passed list of dicts, filters out sizes that
-    already exists and creates the rest effectively.
+    already exists and creates the rest effectively. Returns the sizes in the
+    order passed, without duplicates.
     """
 
     cleaned_sizes = size_clean_and_validate_values(sizes=sizes)
-    existing_sizes = Size.objects.all().values(
-        "width", "height", "depth", "circumference"
-    )
-
-    # Convert dicts to hashable tuples in order to check set differences.
-    existing_sizes_tuples = {tuple(size.items()) for size in existing_sizes}
-    cleaned_sizes_tuples = {tuple(size.dict().items()) for size in cleaned_sizes}
-
-    # Convert unique tuples back dict and then back to records.
-    cleaned_sizes_without_duplicates = [
-        SizeRecord(**dict(t))
-        for t in cleaned_sizes_tuples.difference(existing_sizes_tuples)
-    ]
-
-    sizes_to_create = [
-        Size(
-            width=size.width,
-            height=size.height,
-            depth=size.depth,
-            circumference=size.circumference,
+    keys = list(dict.fromkeys(size_key(size=size) for size in cleaned_sizes))
+
+    if not keys:
+        return []
+
+    now = timezone.now()
+
+    # Sizes conflicting with existing ones are skipped by the db, and only created
+    # sizes are returned, without reading the whole table.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {Size._meta.db_table}
+                (width, height, depth, circumference, created_at, updated_at)
+            VALUES {", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(keys))}
+            ON CONFLICT DO NOTHING
+            RETURNING id, width, height, depth, circumference
+            """,
+            list(itertools.chain.from_iterable((*key, now, now) for key in keys)),
         )
-        for size in cleaned_sizes_without_duplicates
-    ]
-
-    Size.objects.bulk_create(sizes_to_create, ignore_conflicts=True)
+        columns = [column.name for column in cursor.description]
+        created_sizes = [Size(**dict(zip(columns, row))) for row in cursor.fetchall()]
 
-    # Since we ignore conflicts, not all values passed in are necessarily created.
-    # Therefore, we re-fetch all relevant objects and return them instead of the
-    # Django's default "all objects that has been created".
-    fetched_sizes = size_list_from_mapped_values(values=cleaned_sizes)
-
-    return [
+    created_records = [
         SizeDetailRecord(
             id=size.id,
             name=size.name,
@@ -103,9 +100,24 @@ def size_bulk_create(*, sizes: list[SizeRecord]) -> list[SizeDetailRecord]:
             depth=size.depth,
             circumference=size.circumference,
         )
-        for size in fetched_sizes
+        for size in created_sizes
+    ]
+    records = {size_key(size=record): record for record in created_records}
+
+    existing_sizes = [
+        SizeRecord(width=key[0], height=key[1], depth=key[2], circumference=key[3])
+        for key in keys
+        if key not in records
     ]
 
+    if existing_sizes:
+        records.update(
+            (size_key(size=record), record)
+            for record in size_list_from_mapped_values(values=existing_sizes)
+        )
+
+    return [records[key] for key in keys if key in records]
+
 
 def size_get_or_create(
     *,
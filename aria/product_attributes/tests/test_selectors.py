@@ -165,8 +165,10 @@ class TestProductAttributesSelectors:
             SizeRecord(width=20.0, height=40.0, depth=10.0),
             SizeRecord(width=30.0, height=40.0, depth=5.0),
             SizeRecord(width=20.0, height=10.0, depth=5.0),
-            SizeRecord(width=25.0, height=35.0, depth=12.0),
-            SizeRecord(width=80.5, height=35.0, depth=12.0),
+            SizeRecord(width=25.0, height=35.0),
+            SizeRecord(width=80.5, height=39.0, depth=12.0),
+            # Shares dimensions with existing sizes, but doesn't exist itself.
+            SizeRecord(width=20.0, height=35.0, depth=12.0),
             SizeRecord(circumference=30.0),
             SizeRecord(circumference=30.0),
             SizeRecord(circumference=40.0),
@@ -244,8 +246,8 @@ class TestProductAttributesSelectors:
             mapped_values = size_list_from_mapped_values(values=size_values_to_map)
 
         # There is 1 duplicate in the list, circumference 30.0, so make sure that this
-        # is not returned twice.
-        assert len(mapped_values) == len(size_values_to_map) - 1
+        # is not returned twice, and 1 size that doesn't exist.
+        assert len(mapped_values) == len(size_values_to_map) - 2
         assert mapped_values == expected_output
 
     def test_selector_variant_list(self, django_assert_max_num_queries):
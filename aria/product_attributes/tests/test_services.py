@@ -21,7 +21,9 @@ class TestProductAttributesServices:
         Test that the size_create service creates a size within query limits.
         """
 
-        with django_assert_max_num_queries(1):
+        # Uses 2 queries; 1 for validating that the size is unique and 1 for
+        # creating it.
+        with django_assert_max_num_queries(2):
             size_record = size_create(
                 width=Decimal("10.0"),
                 height=Decimal("20.0"),
@@ -64,14 +66,32 @@ class TestProductAttributesServices:
             SizeRecord(circumference=30.0),
         ]
 
-        # Uses 2 queries; 1 for bulk creating and 1 for retrieving sizes.
-        with django_assert_max_num_queries(3):
+        # Uses 2 queries; 1 for bulk creating and 1 for retrieving existing sizes.
+        with django_assert_max_num_queries(2):
             sizes = size_bulk_create(sizes=sizes_to_create)
 
         assert len(sizes) == len(sizes_to_create)
         assert (
             Size.objects.count() == sizes_in_db_count + 4
         )  # 4 should've been created.
+        assert [(size.width, size.height, size.depth) for size in sizes] == [
+            (Decimal("10.00"), Decimal("20.00"), None),
+            (Decimal("5.00"), Decimal("10.00"), Decimal("10.00")),
+            (Decimal("25.00"), Decimal("90.00"), None),
+            (Decimal("20.00"), Decimal("45.00"), Decimal("5.00")),
+            (Decimal("18.00"), Decimal("11.00"), Decimal("10.00")),
+            (None, None, None),
+        ]
+
+        # Sizes missing a dimension conflict with existing ones, and duplicates
+        # passed are only created once.
+        with django_assert_max_num_queries(2):
+            sizes = size_bulk_create(
+                sizes=[SizeRecord(circumference=30.0), SizeRecord(circumference=30.0)]
+            )
+
+        assert len(sizes) == 1
+        assert Size.objects.count() == sizes_in_db_count + 4
 
     def test_service_size_get_or_create(self, django_assert_max_num_queries):
         """
@@ -98,7 +118,7 @@ class TestProductAttributesServices:
         assert existing_size_from_get.id == existing_site.id
         assert Size.objects.count() == sizes_in_db_count  # Nothing was created.
 
-        with django_assert_max_num_queries(2):
+        with django_assert_max_num_queries(3):
             non_existent_size = size_get_or_create(
                 width=Decimal("12.0"),
                 height=Decimal("10.0"),
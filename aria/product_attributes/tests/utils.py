@@ -64,7 +64,7 @@ def create_size(
     if all(param is None for param in (width, height, depth, circumference)):
         raise ValueError("All args cannot be None!")
 
-    size = Size.objects.create(
+    size, _created = Size.objects.get_or_create(
         width=width, height=height, depth=depth, circumference=circumference
     )
 
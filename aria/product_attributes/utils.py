@@ -1,9 +1,25 @@
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 
 from django.utils.translation import gettext as _
 
 from aria.core.exceptions import ApplicationError
-from aria.product_attributes.records import SizeRecord
+from aria.product_attributes.records import SizeDetailRecord, SizeRecord
+
+SizeKey = tuple[Decimal | None, Decimal | None, Decimal | None, Decimal | None]
+
+
+def size_key(*, size: SizeRecord | SizeDetailRecord) -> SizeKey:
+    """
+    Get a hashable key of a size's dimensions, rounded the way they're stored, for
+    matching sizes against each other.
+    """
+
+    return tuple(  # type: ignore
+        value.quantize(Decimal(".01"), rounding=ROUND_HALF_UP)
+        if value is not None
+        else None
+        for value in (size.width, size.height, size.depth, size.circumference)
+    )
 
 
 def size_clean_and_validate_value(
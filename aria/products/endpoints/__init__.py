@@ -1,4 +0,0 @@
-from aria.products.endpoints.internal import router as internal_endpoints
-from aria.products.endpoints.public import router as public_endpoints
-
-__all__ = ["public_endpoints", "internal_endpoints"]
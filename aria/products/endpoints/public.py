@@ -1,10 +1,11 @@
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import HttpRequest
-from django.shortcuts import get_object_or_404
+from django.http import Http404, HttpRequest
 from django.utils.translation import gettext_lazy as _
 
+from asgiref.sync import sync_to_async
 from ninja import Query, Router
 
+from aria.api.decorators import conditional
 from aria.categories.models import Category
 from aria.products.schemas.filters import ProductListFilters
 from aria.products.schemas.outputs import ProductDetailOutput, ProductListOutput
@@ -20,14 +21,21 @@ router = Router(tags=["Products"])
 @router.get(
     "/", response={200: list[ProductListOutput]}, summary="List all product for sale."
 )
-def product_list_api(
+@conditional(
+    version=lambda search: product_list_for_sale_from_cache.aversion(  # type: ignore
+        filters=search.dict()
+    )
+)
+async def product_list_api(
     request: HttpRequest, search: ProductListFilters = Query(...)
 ) -> list[ProductListOutput]:
     """
     Get a list of all products for sale.
     """
 
-    products = product_list_for_sale_from_cache(filters=search.dict())
+    products = await product_list_for_sale_from_cache.acall(  # type: ignore
+        filters=search.dict()
+    )
 
     return [ProductListOutput(**product.dict()) for product in products]
 
@@ -37,15 +45,20 @@ def product_list_api(
     response={200: list[ProductListOutput]},
     summary="List all products belonging to a certain category",
 )
-def product_list_by_category_api(
+@conditional()
+async def product_list_by_category_api(
     request: HttpRequest, category_slug: str, search: ProductListFilters = Query(...)
 ) -> list[ProductListOutput]:
     """
     Get a list of products related to a specific category.
     """
 
-    category = get_object_or_404(Category, slug=category_slug)
-    products = product_list_by_category_from_cache(
+    category = await Category.objects.filter(slug=category_slug).afirst()
+
+    if category is None:
+        raise Http404
+
+    products = await product_list_by_category_from_cache.acall(  # type: ignore
         category=category, filters=search.dict()
     )
 
@@ -57,14 +70,15 @@ def product_list_by_category_api(
     response={200: ProductDetailOutput},
     summary="Get information about a single product instance",
 )
-def product_detail_api(
+@conditional()
+async def product_detail_api(
     request: HttpRequest, product_slug: str
 ) -> tuple[int, ProductDetailOutput]:
     """
     Retrieve a single product instance based on product slug.
     """
 
-    product = product_detail(product_slug=product_slug)
+    product = await sync_to_async(product_detail)(product_slug=product_slug)
 
     if product is None:
         raise ObjectDoesNotExist(_("Product does not exist"))
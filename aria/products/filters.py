@@ -14,10 +14,17 @@ class ProductSearchFilter(FilterSet):
     """
 
     search = filters.CharFilter(method="query_products", label="Search")
+    # Price filters and ordering need the queryset annotated with the price, see
+    # ProductQuerySet.with_price.
+    min_price = filters.NumberFilter(field_name="price", lookup_expr="gte")
+    max_price = filters.NumberFilter(field_name="price", lookup_expr="lte")
+    ordering = filters.OrderingFilter(
+        fields=(("price", "price"), ("created_at", "created_at"))
+    )
 
     class Meta:
         model = Product
-        fields = ["search"]
+        fields = ["search", "min_price", "max_price", "ordering"]
 
     @staticmethod
     def query_products(
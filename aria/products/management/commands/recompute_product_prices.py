@@ -0,0 +1,33 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from aria.products.models import Product
+from aria.products.services.pricing import product_prices_update
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the stored from price and discounted from price of all "
+        "products. Prices are updated as options and discounts change, but not as "
+        "discounts start or end, so this should be run periodically, e.g. hourly."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=500,
+            help="Number of products to update per batch",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        product_ids = list(Product.objects.order_by("id").values_list("id", flat=True))
+        batch_size = options["batch_size"]
+
+        for start in range(0, len(product_ids), batch_size):
+            product_prices_update(product_ids=product_ids[start : start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed prices of {len(product_ids)} products.")
+        )
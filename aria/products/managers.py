@@ -1,17 +1,7 @@
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from django.db.models import (
-    Case,
-    DecimalField,
-    Exists,
-    F,
-    Min,
-    OuterRef,
-    Prefetch,
-    Value,
-    When,
-)
+from django.db.models import F, Prefetch
+from django.db.models.functions import Coalesce
 
 from aria.core.managers import BaseQuerySet
 from aria.products.enums import ProductStatus
@@ -40,7 +30,9 @@ class ProductQuerySet(BaseQuerySet["models.Product"]):
 
         from aria.categories.models import Category
 
-        active_categories = Category.objects.active().select_related("parent")
+        # Categories are displayed with their full path, so the grandparent is
+        # selected as well.
+        active_categories = Category.objects.active().select_related("parent__parent")
 
         prefetched_children = Prefetch(
             "children", queryset=active_categories, to_attr="active_children"
@@ -185,31 +177,14 @@ class ProductQuerySet(BaseQuerySet["models.Product"]):
 
         return self.prefetch_related("files")
 
-    def annotate_from_price(self) -> BaseQuerySet["models.Product"]:
+    def with_price(self) -> BaseQuerySet["models.Product"]:
         """
-        Annotate a product's from price based on lowest options price
-        available.
+        Annotate a product's price, being the discounted from price if
+        discounted, otherwise the from price. Filtering and sorting by it is
+        backed by the product_status_price_idx index.
         """
 
-        from aria.products.models import ProductOption
-
-        return self.annotate(
-            annotated_from_price=Case(
-                When(
-                    Exists(
-                        ProductOption.objects.available().filter(
-                            product_id=OuterRef("pk"),
-                            gross_price__isnull=False,
-                            gross_price__gt=0,
-                        )
-                    ),
-                    then=Min(
-                        F("options__gross_price"),
-                    ),
-                ),
-                default=Value(Decimal("0.00"), output_field=DecimalField()),
-            )
-        )
+        return self.alias(price=Coalesce("discounted_from_price", "from_price"))
 
     def preload_for_list(self) -> BaseQuerySet["models.Product"]:
         """
@@ -225,7 +200,7 @@ class ProductQuerySet(BaseQuerySet["models.Product"]):
             .with_available_options_unique_variants()
             .with_active_product_discounts()
             .with_active_options_discounts()
-            .annotate_from_price()
+            .with_price()
         )
 
     def by_category(
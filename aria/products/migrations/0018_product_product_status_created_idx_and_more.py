@@ -0,0 +1,25 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the table against writes, which can't be
+    # done within a transaction.
+    atomic = False
+
+    dependencies = [
+        ('products', '0017_remove_product_materials_remove_product_rooms'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(fields=['status', '-created_at'], name='product_status_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='productoption',
+            index=models.Index(fields=['product', 'status', 'gross_price'], name='product_option_price_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:17
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+# aria.products.enums.ProductStatus.AVAILABLE
+AVAILABLE = 3
+
+
+def backfill_from_price(apps, schema_editor):
+    """
+    Populate the from price of existing products. Discounted from prices are
+    populated by the recompute_product_prices command.
+    """
+
+    Product = apps.get_model("products", "Product")
+    ProductOption = apps.get_model("products", "ProductOption")
+
+    lowest_option_price = (
+        ProductOption.objects.filter(
+            product_id=OuterRef("pk"), status=AVAILABLE, gross_price__gt=0
+        )
+        .values("product_id")
+        .annotate(price=Min("gross_price"))
+        .values("price")
+    )
+
+    Product.objects.update(
+        from_price=Coalesce(
+            Subquery(lowest_option_price),
+            Value(Decimal("0.00"), output_field=models.DecimalField()),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0018_product_product_status_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='discounted_from_price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text="From price with the product's active discount applied, if any.", max_digits=8, null=True, verbose_name='discounted from price'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='from_price',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, help_text="Lowest gross price of the product's available options.", max_digits=8, verbose_name='from price'),
+        ),
+        migrations.RunPython(backfill_from_price, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.1.6 on 2026-10-19 07:17
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the table against writes, which can't be
+    # done within a transaction.
+    atomic = False
+
+    dependencies = [
+        ('products', '0019_product_from_price_product_discounted_from_price'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(models.F('status'), django.db.models.functions.comparison.Coalesce('discounted_from_price', 'from_price'), name='product_status_price_idx'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from decimal import Decimal
 
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Coalesce
 from django.utils.text import slugify
 
 from mptt.models import TreeManyToManyField
@@ -108,11 +110,43 @@ class Product(BaseModel, BaseThumbnailImageModel):
         ),
     )
 
+    # Denormalised from the product's options and discounts, kept up to date by
+    # aria.products.services.pricing.product_prices_update.
+    from_price = models.DecimalField(
+        "from price",
+        decimal_places=2,
+        max_digits=8,
+        default=Decimal("0.00"),
+        editable=False,
+        help_text="Lowest gross price of the product's available options.",
+    )
+    discounted_from_price = models.DecimalField(
+        "discounted from price",
+        decimal_places=2,
+        max_digits=8,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="From price with the product's active discount applied, if any.",
+    )
+
     objects = _ProductManager()
 
     class Meta:
         verbose_name = "Product"
         verbose_name_plural = "Products"
+        indexes = [
+            # Products listed by status, newest first.
+            models.Index(
+                fields=["status", "-created_at"], name="product_status_created_idx"
+            ),
+            # Products filtered and sorted by price, see ProductQuerySet.with_price.
+            models.Index(
+                F("status"),
+                Coalesce("discounted_from_price", "from_price"),
+                name="product_status_price_idx",
+            ),
+        ]
         permissions = [
             (
                 "product.view",
@@ -145,17 +179,6 @@ class Product(BaseModel, BaseThumbnailImageModel):
         """
         return self.get_status_display()
 
-    @property
-    def from_price(self) -> Decimal:
-        """
-        Get a product's from price based on lowest possible price from
-        related options.
-        """
-
-        from aria.products.selectors.pricing import product_get_price_from_options
-
-        return product_get_price_from_options(product=self)
-
 
 _ProductImageManager = models.Manager.from_queryset(ProductImageQuerySet)
 
@@ -264,6 +287,14 @@ class ProductOption(BaseModel):
     class Meta:
         verbose_name = "Product option"
         verbose_name_plural = "Product options"
+        indexes = [
+            # Lowest price of available options of a product, see
+            # aria.products.services.pricing.product_prices_update.
+            models.Index(
+                fields=["product", "status", "gross_price"],
+                name="product_option_price_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["product", "variant", "size"],
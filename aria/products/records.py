@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from aria.categories.records import CategoryDetailRecord
 from aria.files.records import BaseHeaderImageRecord
@@ -115,3 +115,30 @@ class ProductListRecord(BaseModel):
     colors: list[ColorDetailRecord]
     shapes: list[ShapeDetailRecord]
     variants: list[VariantDetailRecord]
+
+
+class ProductImportFileRecord(BaseModel):
+    name: str = Field(min_length=1)
+    file_url: str = Field(min_length=1)
+
+
+class ProductImportVariantRecord(BaseModel):
+    name: str | None = None
+    image_url: str | None = None
+
+
+class ProductImportRecord(BaseModel):
+    collection_name: str = Field(min_length=1)
+    description_nor: str = Field(min_length=1)
+    short_description_nor: str | None = None
+    sizes: str = Field(min_length=1)
+    price: Decimal | None = None
+    categories: str | None = None
+    files: list[ProductImportFileRecord] = []
+    variants: list[ProductImportVariantRecord] = []
+
+
+class ProductImportSummaryRecord(BaseModel):
+    created: int = 0
+    failed: int = 0
+    errors: list[str] = []
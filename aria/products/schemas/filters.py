@@ -1,5 +1,10 @@
+from decimal import Decimal
+
 from ninja import Schema
 
 
 class ProductListFilters(Schema):
     search: str | None = None
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    ordering: str | None = None
@@ -4,8 +4,9 @@ from django.db.models import Q
 
 from aria.categories.models import Category
 from aria.categories.selectors import category_tree_active_list_for_product
-from aria.core.decorators import cached
+from aria.core.decorators import cached, query_budget
 from aria.core.managers import BaseQuerySet
+from aria.core.replicas import use_replica
 from aria.files.records import BaseHeaderImageRecord
 from aria.product_attributes.records import (
     ColorDetailRecord,
@@ -26,6 +27,8 @@ from aria.products.selectors.product_options import product_options_list_for_pro
 from aria.products.selectors.records import product_list_record, product_record
 
 
+@use_replica
+@query_budget(max_queries=14)
 def product_detail(
     *, product_id: int | None = None, product_slug: str | None = None
 ) -> ProductDetailRecord | None:
@@ -48,7 +51,6 @@ def product_detail(
         .with_files()
         .with_available_options_and_option_discounts()
         .with_active_product_discounts()
-        .annotate_from_price()
         .first()
     )
 
@@ -103,6 +105,8 @@ def product_detail(
     return record
 
 
+@use_replica
+@query_budget(max_queries=9)
 def product_list_for_sale_for_qs(
     *,
     products: BaseQuerySet["Product"] | None,
@@ -60,10 +60,6 @@ def product_list_record(product: Product) -> ProductListRecord:
         product, "available_options_unique_variants"
     ), "Please use the product_list_record alongside prefetched values."
 
-    assert hasattr(
-        product, "annotated_from_price"
-    ), "Please use the product_list_record alongside prefetched values."
-
     assert hasattr(
         product, "active_discounts"
     ), "Please use the product_list_record alongside prefetched values."
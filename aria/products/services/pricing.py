@@ -0,0 +1,57 @@
+from decimal import Decimal
+from typing import Iterable
+
+from django.db.models import DecimalField, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from aria.products.models import Product, ProductOption
+from aria.products.selectors.discounts import product_get_active_discount
+
+
+def product_prices_update(*, product_ids: Iterable[int]) -> int:
+    """
+    Recompute the stored from price and discounted from price of the given
+    products. Needs to be called whenever options or discounts of a product
+    change, or a discount starts or ends, see the recompute_product_prices
+    command. Returns the number of products updated.
+    """
+
+    product_ids = list(set(product_ids))
+
+    if not product_ids:
+        return 0
+
+    lowest_option_price = (
+        ProductOption.objects.available()
+        .filter(product_id=OuterRef("pk"), gross_price__gt=0)
+        .values("product_id")
+        .annotate(price=Min("gross_price"))
+        .values("price")
+    )
+
+    Product.objects.filter(id__in=product_ids).update(
+        from_price=Coalesce(
+            Subquery(lowest_option_price),
+            Value(Decimal("0.00"), output_field=DecimalField()),
+        )
+    )
+
+    products = list(
+        Product.objects.filter(id__in=product_ids)
+        .only("id", "from_price", "discounted_from_price")
+        .with_active_product_discounts()
+        .with_active_options_discounts()  # type: ignore
+    )
+    products_to_update = []
+
+    for product in products:
+        discount = product_get_active_discount(product=product)
+        discounted_from_price = discount.discounted_gross_price if discount else None
+
+        if product.discounted_from_price != discounted_from_price:
+            product.discounted_from_price = discounted_from_price
+            products_to_update.append(product)
+
+    Product.objects.bulk_update(products_to_update, ["discounted_from_price"])
+
+    return len(products)
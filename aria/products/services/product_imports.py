@@ -0,0 +1,401 @@
+import itertools
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from django.core.files import File
+from django.db import transaction
+from django.utils.text import slugify
+
+import ijson
+import requests
+from pydantic import ValidationError
+
+from aria.categories.models import Category
+from aria.core.exceptions import ApplicationError
+from aria.product_attributes.models import Variant
+from aria.product_attributes.records import SizeRecord
+from aria.product_attributes.services import size_bulk_create
+from aria.product_attributes.utils import size_clean_and_validate_value, size_key
+from aria.products.enums import ProductStatus
+from aria.products.models import Product, ProductFile, ProductOption
+from aria.products.records import (
+    ProductImportRecord,
+    ProductImportSummaryRecord,
+    ProductImportVariantRecord,
+)
+from aria.products.services.pricing import product_prices_update
+from aria.suppliers.models import Supplier
+
+PRODUCT_IMPORT_BATCH_SIZE = 500
+
+# Gets a remote asset by its url and name.
+AssetGetter = Callable[[str, str], "File[Any]"]
+
+
+@dataclass
+class _ProductImportItem:
+    """
+    A validated record, with its references to existing rows resolved.
+    """
+
+    position: int
+    record: ProductImportRecord
+    sizes: list[SizeRecord]
+    is_special_size: bool
+    categories: list[Category] = field(default_factory=list)
+    variants: list[Variant] = field(default_factory=list)
+    new_variants: list[ProductImportVariantRecord] = field(default_factory=list)
+
+
+@contextmanager
+def _product_import_source_open(*, source: str) -> Iterator[IO[bytes]]:
+    """
+    Open a local file, or an url, as a binary stream without reading it into memory.
+    """
+
+    if source.startswith(("http://", "https://")):
+        with requests.get(source, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # Decompress the stream if served compressed.
+            response.raw.decode_content = True
+            yield response.raw
+    else:
+        with open(source, "rb") as file:
+            yield file
+
+
+def product_import_records_stream(*, source: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream product records from a JSON array in a local file or at an url, parsing
+    them incrementally, one at a time.
+    """
+
+    with _product_import_source_open(source=source) as file:
+        yield from ijson.items(file, "item")
+
+
+def product_import(
+    *,
+    supplier: Supplier,
+    records: Iterable[dict[str, Any]],
+    add_absorption: bool = False,
+    asset_get: AssetGetter | None = None,
+    batch_size: int = PRODUCT_IMPORT_BATCH_SIZE,
+    on_batch: Callable[[ProductImportSummaryRecord], None] | None = None,
+) -> ProductImportSummaryRecord:
+    """
+    Import products of a supplier from records of an external source. Records are
+    validated and bulk created in batches, each in its own transaction, or savepoint
+    if already in one, so memory and queries are bounded by the batch size rather
+    than the number of records. Records failing are skipped, and reported in the
+    summary, without affecting other records.
+
+    Remote assets, e.g. files and variant images, are only fetched if asset_get is
+    given.
+    """
+
+    summary = ProductImportSummaryRecord()
+    positioned_records = enumerate(records, start=1)
+
+    while batch := list(itertools.islice(positioned_records, batch_size)):
+        items = _product_import_prepare(batch=batch, summary=summary)
+
+        _product_import_write_in_savepoint(
+            supplier=supplier,
+            items=items,
+            add_absorption=add_absorption,
+            asset_get=asset_get,
+            summary=summary,
+        )
+
+        if on_batch is not None:
+            on_batch(summary)
+
+    return summary
+
+
+def _product_import_fail(
+    *, summary: ProductImportSummaryRecord, position: int, error: Exception | str
+) -> None:
+    summary.failed += 1
+    summary.errors.append(f"Record {position}: {error}")
+
+
+def _product_import_sizes_parse(*, sizes: str) -> tuple[list[SizeRecord], bool]:
+    """
+    Parse a comma separated list of sizes, formatted as height x width, optionally
+    x depth, or as a circumference. An asterisk marks the product as available in
+    special sizes.
+    """
+
+    values = [value.strip() for value in sizes.split(",") if value.strip()]
+    parsed_sizes = []
+
+    for value in values:
+        if value == "*":
+            continue
+
+        dimensions = [Decimal(dimension.strip()) for dimension in value.split("x")]
+
+        if len(dimensions) == 1:
+            size = size_clean_and_validate_value(circumference=dimensions[0])
+        elif len(dimensions) in (2, 3):
+            size = size_clean_and_validate_value(
+                height=dimensions[0],
+                width=dimensions[1],
+                depth=dimensions[2] if len(dimensions) == 3 else None,
+            )
+        else:
+            raise ValueError(f"Invalid size {value}")
+
+        parsed_sizes.append(size)
+
+    return parsed_sizes, "*" in values
+
+
+def _product_import_prepare(
+    *,
+    batch: list[tuple[int, dict[str, Any]]],
+    summary: ProductImportSummaryRecord,
+) -> list[_ProductImportItem]:
+    """
+    Validate a batch of records, and resolve the categories and existing variants
+    they reference, in a query per batch. Invalid records are reported as failed.
+    """
+
+    items = []
+
+    for position, data in batch:
+        try:
+            record = ProductImportRecord.parse_obj(data)
+            sizes, is_special_size = _product_import_sizes_parse(sizes=record.sizes)
+        except (ValidationError, ValueError, ArithmeticError, ApplicationError) as exc:
+            _product_import_fail(summary=summary, position=position, error=exc)
+            continue
+
+        items.append(
+            _ProductImportItem(
+                position=position,
+                record=record,
+                sizes=sizes,
+                is_special_size=is_special_size,
+            )
+        )
+
+    category_slugs = {
+        item.position: [
+            slug.strip()
+            for slug in (item.record.categories or "").split(",")
+            if slug.strip()
+        ]
+        for item in items
+    }
+    categories = {
+        category.slug: category
+        for category in Category.objects.filter(
+            slug__in=itertools.chain.from_iterable(category_slugs.values())
+        )
+    }
+
+    # Variants without an image refer to existing variants, preferring standard
+    # variants if there are several of the same name.
+    variant_names = {
+        variant.name.title()
+        for item in items
+        for variant in item.record.variants
+        if variant.name is not None and variant.image_url is None
+    }
+    variants: dict[str, Variant] = {}
+
+    for variant in Variant.objects.filter(name__in=variant_names).order_by(
+        "-is_standard", "id"
+    ):
+        variants.setdefault(variant.name, variant)
+
+    prepared_items = []
+
+    for item in items:
+        try:
+            item.categories = [
+                categories[slug] for slug in category_slugs[item.position]
+            ]
+        except KeyError as exc:
+            _product_import_fail(
+                summary=summary,
+                position=item.position,
+                error=f"Category {exc.args[0]} does not exist",
+            )
+            continue
+
+        try:
+            for variant_record in item.record.variants:
+                if variant_record.name is None:
+                    continue
+
+                if variant_record.image_url is None:
+                    item.variants.append(variants[variant_record.name.title()])
+                else:
+                    item.new_variants.append(variant_record)
+        except KeyError as exc:
+            _product_import_fail(
+                summary=summary,
+                position=item.position,
+                error=f"Variant {exc.args[0]} does not exist",
+            )
+            continue
+
+        prepared_items.append(item)
+
+    return prepared_items
+
+
+def _product_import_write_in_savepoint(
+    *,
+    supplier: Supplier,
+    items: list[_ProductImportItem],
+    add_absorption: bool,
+    asset_get: AssetGetter | None,
+    summary: ProductImportSummaryRecord,
+) -> None:
+    """
+    Write items in a savepoint. If writing fails, items are retried one at a time,
+    so a single bad record doesn't fail the whole batch.
+    """
+
+    if not items:
+        return
+
+    try:
+        with transaction.atomic():
+            _product_import_write(
+                supplier=supplier,
+                items=items,
+                add_absorption=add_absorption,
+                asset_get=asset_get,
+            )
+    except Exception as exc:  # pylint: disable=broad-except
+        if len(items) == 1:
+            _product_import_fail(summary=summary, position=items[0].position, error=exc)
+            return
+
+        for item in items:
+            _product_import_write_in_savepoint(
+                supplier=supplier,
+                items=[item],
+                add_absorption=add_absorption,
+                asset_get=asset_get,
+                summary=summary,
+            )
+
+        return
+
+    summary.created += len(items)
+
+
+def _product_import_write(
+    *,
+    supplier: Supplier,
+    items: list[_ProductImportItem],
+    add_absorption: bool,
+    asset_get: AssetGetter | None,
+) -> None:
+    """
+    Bulk create products, along with their sizes, variants, options, files and
+    category relations.
+    """
+
+    sizes = size_bulk_create(sizes=[size for item in items for size in item.sizes])
+    size_ids = {size_key(size=size): size.id for size in sizes}
+
+    products = []
+
+    for item in items:
+        name = item.record.collection_name.title()
+        description = item.record.description_nor
+
+        if item.record.short_description_nor:
+            description = f"{item.record.short_description_nor}\n\n{description}"
+
+        products.append(
+            Product(
+                name=name,
+                supplier=supplier,
+                status=ProductStatus.DRAFT,
+                slug=f"{slugify(supplier.name)}-{slugify(name)}",
+                description=description,
+                available_in_special_sizes=item.is_special_size,
+                is_imported_from_external_source=True,
+                absorption=0.05 if add_absorption else None,
+            )
+        )
+
+    Product.objects.bulk_create(products)
+
+    Product.categories.through.objects.bulk_create(
+        Product.categories.through(product_id=product.id, category_id=category.id)
+        for product, item in zip(products, items)
+        for category in item.categories
+    )
+
+    # Files are uploaded as they're created.
+    ProductFile.objects.bulk_create(
+        ProductFile(
+            product=product,
+            name=file.name,
+            file=asset_get(file.file_url, file.name) if asset_get else None,
+        )
+        for product, item in zip(products, items)
+        for file in item.record.files
+    )
+
+    new_variants = [
+        [
+            (Variant(name=variant.name.title()), variant.image_url)
+            for variant in item.new_variants
+            if variant.name is not None and variant.image_url is not None
+        ]
+        for item in items
+    ]
+    Variant.objects.bulk_create(
+        variant for variants in new_variants for variant, _url in variants
+    )
+
+    # Images are uploaded after creating variants, as their path contains the id.
+    if asset_get is not None:
+        for variant, url in itertools.chain.from_iterable(new_variants):
+            variant.thumbnail.save(slugify(variant.name), asset_get(url, variant.name))
+
+    options = []
+
+    for product, item, item_new_variants in zip(products, items, new_variants):
+        variants: list[Variant | None] = [
+            *item.variants,
+            *(variant for variant, _url in item_new_variants),
+        ]
+        # Duplicate sizes of a record would violate the uniqueness of options.
+        product_size_ids: list[int | None] = list(
+            dict.fromkeys(size_ids[size_key(size=size)] for size in item.sizes)
+        )
+
+        if not product_size_ids and not variants:
+            continue
+
+        for variant, size_id in itertools.product(
+            variants or [None], product_size_ids or [None]
+        ):
+            options.append(
+                ProductOption(
+                    product=product,
+                    variant=variant,
+                    size_id=size_id,
+                    gross_price=item.record.price or Decimal("0.00"),
+                    status=ProductStatus.AVAILABLE,
+                )
+            )
+
+    ProductOption.objects.bulk_create(options)
+
+    # Bulk creating doesn't send the signals updating products' prices.
+    product_prices_update(product_ids=[product.id for product in products])
@@ -6,10 +6,11 @@ from django.utils.translation import gettext as _
 from aria.core.exceptions import ApplicationError
 from aria.product_attributes.models import Size, Variant
 from aria.product_attributes.services import size_bulk_create
-from aria.product_attributes.utils import size_clean_and_validate_value
+from aria.product_attributes.utils import size_clean_and_validate_value, size_key
 from aria.products.enums import ProductStatus
 from aria.products.models import Product, ProductOption
 from aria.products.records import OptionRecord, ProductOptionRecord
+from aria.products.services.pricing import product_prices_update
 
 
 def product_option_create(
@@ -83,6 +84,9 @@ def product_option_bulk_create(
 
     options_created = ProductOption.objects.bulk_create(product_options_to_create)
 
+    # Bulk creating doesn't send the signals updating the product's prices.
+    product_prices_update(product_ids=[product.id])
+
     return [
         ProductOptionRecord(
             id=option.id,
@@ -120,23 +124,16 @@ def product_options_bulk_create_options_and_sizes(
     ]
     sizes = size_bulk_create(sizes=sizes_from_options)
 
+    size_ids = {size_key(size=size): size.id for size in sizes}
+
     options_to_create = [
         {
             "status": option.status,
             "gross_price": option.gross_price,
             "variant_id": option.variant_id,
-            "size_id": next(
-                (
-                    size.id
-                    for size in sizes
-                    if option.size is not None
-                    and option.size.width == size.width
-                    and option.size.height == size.height
-                    and option.size.depth == size.depth
-                    and option.size.circumference == size.circumference
-                ),
-                None,
-            ),
+            "size_id": size_ids.get(size_key(size=option.size))
+            if option.size is not None
+            else None,
         }
         for option in copied_options
     ]
@@ -1,7 +1,7 @@
 from typing import Any
 
 from django.db.models import Model
-from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils.translation import gettext as _
 
@@ -9,6 +9,7 @@ from aria.categories.models import Category
 from aria.core.exceptions import ApplicationError
 from aria.files.s3_utils import s3_assets_cleanup
 from aria.products.models import Product, ProductFile, ProductImage, ProductOption
+from aria.products.services.pricing import product_prices_update
 from aria.products.services.product_options import (
     product_option_delete_related_variants,
 )
@@ -76,3 +77,22 @@ def delete_related_product_variants(
     """
 
     product_option_delete_related_variants(instance=instance)
+
+
+@receiver(post_save, sender=ProductOption)
+@receiver(post_delete, sender=ProductOption)
+def update_product_prices(
+    sender: ProductOption,  # pylint: disable=unused-argument
+    instance: ProductOption,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Update the stored prices of the product the option belongs to.
+    """
+
+    # Options deleted along with their product have no product to update.
+    if isinstance(kwargs.get("origin", None), Product):
+        return
+
+    product_prices_update(product_ids=[instance.product_id])
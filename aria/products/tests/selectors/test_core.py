@@ -5,6 +5,7 @@ from django.core.cache import cache
 import pytest
 
 from aria.categories.tests.utils import create_category
+from aria.discounts.tests.utils import create_discount
 from aria.product_attributes.records import (
     ColorDetailRecord,
     MaterialDetailRecord,
@@ -12,6 +13,13 @@ from aria.product_attributes.records import (
     ShapeDetailRecord,
     VariantDetailRecord,
 )
+from aria.product_attributes.tests.utils import (
+    create_color,
+    create_material,
+    create_room,
+    create_shape,
+    create_variant,
+)
 from aria.products.enums import ProductStatus
 from aria.products.models import Product
 from aria.products.records import ProductListRecord, ProductSupplierRecord
@@ -23,7 +31,11 @@ from aria.products.selectors.core import (
     product_list_for_sale_for_qs,
     product_list_for_sale_from_cache,
 )
-from aria.products.tests.utils import create_product, create_product_option
+from aria.products.tests.utils import (
+    create_product,
+    create_product_image,
+    create_product_option,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -39,7 +51,7 @@ class TestProductCoreSelectors:
         create_product_option(product=product)
         create_product_option(product=product, gross_price=Decimal(300.00))
 
-        # Uses 12 queries:
+        # Uses 14 queries:
         # - 1x for getting product
         # - 1x for prefetching category children
         # - 1x for prefetching categories
@@ -51,7 +63,7 @@ class TestProductCoreSelectors:
         # - 1x for prefetching options
         # - 1x for prefetching options discounts
         # - 1x for prefetching product discounts
-        # - 1x for filtering categories
+        # - 1x for getting category parents
         # - 1x for selecting related supplier
         # - 1x for prefetching images
         with django_assert_max_num_queries(14):
@@ -64,6 +76,59 @@ class TestProductCoreSelectors:
         assert len(fetched_product.shapes) == len(product.shapes.all())
         assert len(fetched_product.colors) == len(product.colors.all())
 
+    def test_selector_product_detail_with_several_categories(
+        self, django_assert_max_num_queries
+    ) -> None:
+        """
+        Test that the number of queries product_detail makes doesn't grow with
+        the number of categories and other related rows of a product.
+        """
+
+        product = create_product()
+
+        for i in range(3):
+            category = create_category(name=f"Category {i}")
+            subcategory = create_category(name=f"Subcategory {i}", parent=category)
+            subcategory_child = create_category(
+                name=f"Sub subcategory {i}", parent=subcategory
+            )
+            product.categories.add(subcategory, subcategory_child)
+            product.colors.add(create_color(name=f"Color {i}", color_hex=f"#00000{i}"))
+            product.materials.add(create_material(name=f"Material {i}"))
+            product.rooms.add(create_room(name=f"Room {i}"))
+            product.shapes.add(create_shape(name=f"Shape {i}"))
+            create_product_image(product=product)
+            create_discount(
+                name=f"Option discount {i}",
+                product_options=[
+                    create_product_option(
+                        product=product,
+                        variant=create_variant(name=f"Variant {i}"),
+                        gross_price=Decimal(100 + i),
+                    )
+                ],
+                discount_gross_percentage=Decimal("0.10"),
+            )
+
+        create_discount(
+            name="Product discount",
+            products=[product],
+            discount_gross_percentage=Decimal("0.20"),
+        )
+
+        # Uses the same 14 queries as with a single row of each, see the test
+        # above. The budget of product_detail raises in tests when exceeded.
+        with django_assert_max_num_queries(14):
+            fetched_product = product_detail(product_id=product.id)
+
+        assert len(fetched_product.categories) == 7
+        assert len(fetched_product.colors) == 3
+        assert len(fetched_product.materials) == 3
+        assert len(fetched_product.rooms) == 3
+        assert len(fetched_product.shapes) == 3
+        assert len(fetched_product.images) == 4
+        assert len(fetched_product.options) == 4
+
     def test_selector_product_list_for_sale_for_qs(
         self, django_assert_max_num_queries
     ) -> None:
@@ -170,6 +235,40 @@ class TestProductCoreSelectors:
         assert len(filtered_available_products) == 1
         assert filtered_available_products[0].id == products[0].id
 
+    def test_selector_product_list_for_sale_by_price(
+        self, django_assert_max_num_queries
+    ):
+        """
+        Test that the product_list_for_sale selector filters and orders products
+        by their discounted price, or price if not discounted, within query
+        limits.
+        """
+
+        product_1 = create_product(product_name="Product 1", options=[])
+        create_product_option(product=product_1, gross_price=Decimal("100.00"))
+        product_2 = create_product(product_name="Product 2", options=[])
+        create_product_option(product=product_2, gross_price=Decimal("400.00"))
+        product_3 = create_product(product_name="Product 3", options=[])
+        create_product_option(product=product_3, gross_price=Decimal("300.00"))
+
+        create_discount(discount_gross_percentage=Decimal("0.50"), products=[product_3])
+
+        with django_assert_max_num_queries(9):
+            products = product_list_for_sale(filters={"ordering": "price"})
+
+        assert [product.id for product in products] == [
+            product_1.id,
+            product_3.id,
+            product_2.id,
+        ]
+
+        with django_assert_max_num_queries(9):
+            products = product_list_for_sale(
+                filters={"min_price": 120, "max_price": 400, "ordering": "-price"}
+            )
+
+        assert [product.id for product in products] == [product_2.id, product_3.id]
+
     def test_selector_product_list_for_sale_from_cache(
         self, django_assert_max_num_queries
     ):
@@ -168,36 +168,37 @@ class TestProductDiscountsSelectors:
             active_to=timezone.now() + timedelta(minutes=10),
         )
 
-        # Uses 4 queries:
+        # Load the from prices stored as options were created.
+        for product in (product_1, product_2, product_3):
+            product.refresh_from_db()
+
+        # Uses 3 queries:
         # - 1x for getting product options in fallback
         # - 1x for prefetching options discounts
         # - 1x for getting product discounts in fallback
-        # - 1x for calculating lowest option price
-        with django_assert_max_num_queries(4):
+        with django_assert_max_num_queries(3):
             product_1_discount = product_get_active_discount(product=product_1)
 
         assert product_1_discount is not None
         assert product_1_discount.is_discounted is True
         assert product_1_discount.discounted_gross_price == Decimal("160.00")
 
-        # Uses 4 queries:
+        # Uses 3 queries:
         # - 1x for getting product options in fallback
         # - 1x for prefetching options discounts
         # - 1x for getting product discounts in fallback
-        # - 1x for calculating lowest option price
-        with django_assert_max_num_queries(4):
+        with django_assert_max_num_queries(3):
             product_2_discount = product_get_active_discount(product=product_2)
 
         assert product_2_discount is not None
         assert product_2_discount.is_discounted is True
         assert product_2_discount.discounted_gross_price == Decimal("80.00")
 
-        # Uses 4 queries:
+        # Uses 3 queries:
         # - 1x for getting product options in fallback
         # - 1x for prefetching options discounts
         # - 1x for getting product discounts in fallback
-        # - 1x for calculating lowest option price
-        with django_assert_max_num_queries(4):
+        with django_assert_max_num_queries(3):
             product_3_discount = product_get_active_discount(product=product_3)
 
         assert product_3_discount is None
@@ -206,7 +207,6 @@ class TestProductDiscountsSelectors:
             Product.objects.all()
             .with_active_product_discounts()
             .with_active_options_discounts()
-            .annotate_from_price()
             .order_by("created_at")
         )
 
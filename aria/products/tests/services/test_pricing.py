@@ -0,0 +1,128 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.utils import timezone
+
+import pytest
+
+from aria.discounts.tests.utils import create_discount
+from aria.products.enums import ProductStatus
+from aria.products.models import Product
+from aria.products.services.pricing import product_prices_update
+from aria.products.tests.utils import create_product, create_product_option
+
+pytestmark = pytest.mark.django_db
+
+
+class TestProductPricingServices:
+    def test_service_product_prices_update(self, django_assert_max_num_queries):
+        """
+        Test that the product_prices_update service stores the lowest price of
+        available options, and the discounted price, within query limits.
+        """
+
+        product = create_product(options=[])
+        create_product_option(product=product, gross_price=Decimal("300.00"))
+        create_product_option(product=product, gross_price=Decimal("0.00"))
+        create_product_option(
+            product=product,
+            gross_price=Decimal("100.00"),
+            status=ProductStatus.HIDDEN,
+        )
+        product_without_options = create_product(
+            product_name="Without options", options=[]
+        )
+        create_discount(
+            discount_gross_percentage=Decimal("0.20"),
+            products=[product],
+            active_at=timezone.now(),
+            active_to=timezone.now() + timedelta(minutes=10),
+        )
+
+        Product.objects.update(from_price=Decimal("1.00"), discounted_from_price=None)
+
+        # Uses 6 queries:
+        # - 1x for updating from prices
+        # - 1x for getting products
+        # - 3x for prefetching active discounts of products and options
+        # - 1x for updating discounted from prices
+        with django_assert_max_num_queries(6):
+            updated = product_prices_update(
+                product_ids=[product.id, product_without_options.id]
+            )
+
+        assert updated == 2
+
+        product.refresh_from_db()
+        product_without_options.refresh_from_db()
+
+        assert product.from_price == Decimal("300.00")
+        assert product.discounted_from_price == Decimal("240.00")
+        assert product_without_options.from_price == Decimal("0.00")
+        assert product_without_options.discounted_from_price is None
+
+        assert product_prices_update(product_ids=[]) == 0
+
+    def test_service_product_prices_update_on_changes(self):
+        """
+        Test that stored prices are updated as options and discounts of a product
+        change.
+        """
+
+        product = create_product(options=[])
+        option = create_product_option(product=product, gross_price=Decimal("200.00"))
+
+        product.refresh_from_db()
+        assert product.from_price == Decimal("200.00")
+        assert product.discounted_from_price is None
+
+        create_product_option(product=product, gross_price=Decimal("150.00"))
+
+        product.refresh_from_db()
+        assert product.from_price == Decimal("150.00")
+
+        discount = create_discount(
+            discount_gross_percentage=Decimal("0.50"),
+            product_options=[option],
+            active_at=timezone.now(),
+            active_to=timezone.now() + timedelta(minutes=10),
+        )
+
+        product.refresh_from_db()
+        assert product.discounted_from_price == Decimal("75.00")
+
+        discount.discount_gross_percentage = Decimal("0.20")
+        discount.save()
+
+        product.refresh_from_db()
+        assert product.discounted_from_price == Decimal("120.00")
+
+        discount.product_options.clear()
+
+        product.refresh_from_db()
+        assert product.discounted_from_price is None
+
+        product.discounts.add(discount)
+
+        product.refresh_from_db()
+        assert product.discounted_from_price == Decimal("120.00")
+
+        discount.delete()
+
+        product.refresh_from_db()
+        assert product.discounted_from_price is None
+
+        option.delete()
+        product.options.update(status=ProductStatus.HIDDEN)
+
+        product.refresh_from_db()
+        assert product.from_price == Decimal("150.00")
+
+        call_command("recompute_product_prices")
+
+        product.refresh_from_db()
+        assert product.from_price == Decimal("0.00")
+
+        # Options deleted along with their product don't update its prices.
+        product.delete()
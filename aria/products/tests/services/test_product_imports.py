@@ -0,0 +1,174 @@
+import json
+from decimal import Decimal
+from typing import Any
+
+from django.core.management import call_command
+
+import pytest
+
+from aria.categories.tests.utils import create_category
+from aria.product_attributes.tests.utils import create_size, create_variant
+from aria.products.models import Product
+from aria.products.services.product_imports import (
+    product_import,
+    product_import_records_stream,
+)
+from aria.suppliers.tests.utils import get_or_create_supplier
+
+pytestmark = pytest.mark.django_db
+
+
+def get_import_record(**kwargs: Any) -> dict[str, Any]:
+    """
+    Get an import record, as it's found in external sources.
+    """
+
+    return {
+        "collection_name": "imported product",
+        "description_nor": "A description.",
+        "sizes": "20x30",
+        **kwargs,
+    }
+
+
+class TestProductImportServices:
+    def test_service_product_import(self):
+        """
+        Test that the product_import service creates products with their options,
+        and skips failing records without affecting the other records of a batch.
+        """
+
+        supplier = get_or_create_supplier()
+        category = create_category(name="Furniture")
+        create_variant(name="Oak")
+        standard_variant = create_variant(name="Oak", is_standard=True)
+
+        records = [
+            get_import_record(
+                collection_name="oak table",
+                short_description_nor="A table.",
+                sizes="20x30, 20x30x10, 15, 20x30, *",
+                price="300.00",
+                categories="furniture",
+                variants=[{"name": "oak"}],
+            ),
+            get_import_record(
+                sizes="*",
+                variants=[{"name": "new", "image_url": "https://example.com/new"}],
+                files=[{"name": "Manual", "file_url": "https://example.com/manual"}],
+            ),
+            get_import_record(description_nor=None),
+            get_import_record(categories="furniture, missing"),
+            get_import_record(collection_name="x" * 300),
+            get_import_record(sizes="20xfoo"),
+        ]
+        batches = []
+
+        summary = product_import(
+            supplier=supplier,
+            records=records,
+            batch_size=4,
+            on_batch=lambda batch_summary: batches.append(batch_summary.created),
+        )
+
+        assert summary.created == 2
+        assert summary.failed == 4
+        assert [error.split(":")[0] for error in summary.errors] == [
+            "Record 3",
+            "Record 4",
+            "Record 6",
+            "Record 5",
+        ]
+        assert batches == [2, 2]
+
+        table = Product.objects.get(name="Oak Table")
+        options = table.options.order_by("id")
+
+        assert table.supplier == supplier
+        assert table.description == "A table.\n\nA description."
+        assert table.available_in_special_sizes is True
+        assert table.is_imported_from_external_source is True
+        assert list(table.categories.all()) == [category]
+        assert table.from_price == Decimal("300.00")
+        assert options.count() == 3
+        assert {option.variant for option in options} == {standard_variant}
+        assert [option.size.name for option in options] == [
+            "B30 x H20",
+            "B30 x H20 x D10",
+            "Ø15",
+        ]
+
+        product = Product.objects.get(name="Imported Product")
+
+        assert product.files.count() == 1
+        assert product.options.get().variant.name == "New"
+        assert product.options.get().size is None
+        assert product.from_price == Decimal("0.00")
+
+    def test_service_product_import_query_count(self, django_assert_max_num_queries):
+        """
+        Test that the number of queries the product_import service makes per batch
+        doesn't grow with the number of records.
+        """
+
+        supplier = get_or_create_supplier()
+        create_category(name="Furniture")
+        create_variant(name="Oak")
+        create_size(width=Decimal("30"), height=Decimal("10"))
+
+        records = [
+            get_import_record(
+                sizes=f"{i + 10}x30, {i + 10}x40",
+                categories="furniture",
+                variants=[{"name": "oak"}],
+            )
+            for i in range(20)
+        ]
+
+        # Uses 14 queries:
+        # - 1x for getting categories
+        # - 1x for getting variants
+        # - 2x for savepoint of the batch
+        # - 1x for creating sizes
+        # - 1x for getting existing sizes
+        # - 1x for creating products
+        # - 1x for linking categories
+        # - 1x for creating options
+        # - 5x for updating the products' stored prices
+        with django_assert_max_num_queries(14):
+            summary = product_import(supplier=supplier, records=records)
+
+        assert summary.created == 20
+        assert Product.objects.count() == 20
+
+    def test_command_import_products_from_external_source(self, tmp_path):
+        """
+        Test that the command streams records from a local file, and only keeps the
+        imported products when confirmed.
+        """
+
+        supplier = get_or_create_supplier()
+        source = tmp_path / "products.json"
+        source.write_text(
+            json.dumps([get_import_record(), get_import_record(sizes="15")])
+        )
+
+        assert len(list(product_import_records_stream(source=str(source)))) == 2
+
+        call_command(
+            "import_products_from_external_source",
+            supplier_id=supplier.id,
+            source=str(source),
+        )
+
+        assert Product.objects.count() == 0
+
+        call_command(
+            "import_products_from_external_source",
+            supplier_id=supplier.id,
+            source=str(source),
+            batch_size=1,
+            confirm=True,
+        )
+
+        assert Product.objects.count() == 2
@@ -29,7 +29,8 @@ class TestProductOptionsServices:
 
         product_options_count = product.options.count()
 
-        with django_assert_max_num_queries(3):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(8):
             option_record = product_option_create(
                 product=product,
                 gross_price=Decimal("100.0"),
@@ -74,7 +75,8 @@ class TestProductOptionsServices:
             },
         ]
 
-        with django_assert_max_num_queries(1):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(6):
             created_options = product_option_bulk_create(
                 product=product, product_options=payload
             )
@@ -150,7 +152,8 @@ class TestProductOptionsServices:
             ),
         ]
 
-        with django_assert_max_num_queries(4):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(9):
             created_options_sizes = product_options_bulk_create_options_and_sizes(
                 product=product, options=payload
             )
@@ -902,7 +902,8 @@ class TestInternalProductsEndpoints:
             expected_status_code=403,
         )
 
-        with django_assert_max_num_queries(8):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(13):
             no_size_privileged_staff_response = (
                 authenticated_privileged_staff_client.post(
                     endpoint,
@@ -978,7 +979,8 @@ class TestInternalProductsEndpoints:
             expected_status_code=403,
         )
 
-        with django_assert_max_num_queries(12):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(17):
             existing_size_privileged_staff_response = (
                 authenticated_privileged_staff_client.post(
                     endpoint,
@@ -1059,7 +1061,9 @@ class TestInternalProductsEndpoints:
             expected_status_code=403,
         )
 
-        with django_assert_max_num_queries(13):
+        # Includes 5 queries updating the product's stored prices, and 1 validating
+        # that the created size is unique.
+        with django_assert_max_num_queries(19):
             create_size_privileged_staff_response = (
                 authenticated_privileged_staff_client.post(
                     endpoint,
@@ -1139,7 +1143,8 @@ class TestInternalProductsEndpoints:
             expected_status_code=403,
         )
 
-        with django_assert_max_num_queries(9):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(14):
             no_variant_existing_size_response = (
                 authenticated_privileged_staff_client.post(
                     endpoint,
@@ -1220,7 +1225,9 @@ class TestInternalProductsEndpoints:
             expected_status_code=403,
         )
 
-        with django_assert_max_num_queries(10):
+        # Includes 5 queries updating the product's stored prices, and 1 validating
+        # that the created size is unique.
+        with django_assert_max_num_queries(16):
             no_variant_create_size_response = (
                 authenticated_privileged_staff_client.post(
                     endpoint,
@@ -1430,7 +1437,8 @@ class TestInternalProductsEndpoints:
             expected_status_code=403,
         )
 
-        with django_assert_max_num_queries(8):
+        # Includes 5 queries updating the product's stored prices.
+        with django_assert_max_num_queries(13):
             response = authenticated_privileged_staff_client.post(
                 endpoint,
                 data=payload,
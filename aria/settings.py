@@ -122,7 +122,10 @@ TEMPLATES = [
 ##############
 
 MIDDLEWARE = [
+    "aria.core.middleware.RequestPerformanceMiddleware",
+    "aria.core.middleware.ReplicaPinningMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "aria.core.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -137,6 +140,16 @@ MIDDLEWARE_CLASSES = [
     "django.middleware.locale.LocaleMiddleware",
 ]
 
+###############
+# Compression #
+###############
+
+COMPRESSION_CONTENT_TYPES = ["application/json"]
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)  # in bytes
+# Compressed content of responses with an ETag is cached, as it's identical
+# for all requests with the same ETag.
+COMPRESSION_CACHE_TIMEOUT = 60 * 60
+
 ########
 # Apps #
 ########
@@ -253,13 +266,76 @@ DATABASES = {
     ),
 }
 
+# Read replica of the default database, read from by selectors decorated with
+# use_replica, see aria.core.replicas. Everything is read from the default
+# database if not set.
+if env.str("DATABASE_REPLICA_URL", default=""):
+    DATABASES["replica"] = env.db_url("DATABASE_REPLICA_URL")
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = ["aria.core.replicas.ReplicaRouter"]
+
+# Seconds the replica can be behind the default database before reads go to the
+# default database instead, checked at most every REPLICA_LAG_CHECK_INTERVAL
+# seconds.
+REPLICA_MAX_LAG = env.float("REPLICA_MAX_LAG", default=5.0)
+REPLICA_LAG_CHECK_INTERVAL = 10.0
+# Seconds reads of a client are pinned to the default database after it writes,
+# to read its own writes, see aria.core.middleware.ReplicaPinningMiddleware.
+REPLICA_PINNING_SECONDS = env.int("REPLICA_PINNING_SECONDS", default=15)
+
+for database in DATABASES.values():
+    # Seconds to keep database connections open for reuse by later requests, 0
+    # closing them at the end of each request. Only enabled for threaded workers
+    # serving the WSGI application, see aria.gunicorn_config. The ASGI application
+    # runs each request in a new thread, which would leave connections kept open
+    # behind, point DATABASE_URL to a pooler, such as pgbouncer, instead.
+    database["CONN_MAX_AGE"] = env.int("DATABASE_CONN_MAX_AGE", default=0)
+    # Check that a connection kept open is still usable before reusing it, rather
+    # than failing the request if the database closed it.
+    database["CONN_HEALTH_CHECKS"] = env.bool(
+        "DATABASE_CONN_HEALTH_CHECKS", default=True
+    )
+    # Set when DATABASE_URL points to a pooler in transaction mode, e.g. pgbouncer
+    # with "pool_mode = transaction". Server-side cursors, used by
+    # QuerySet.iterator(), are disabled, as consecutive transactions might run on
+    # different connections.
+    database["DISABLE_SERVER_SIDE_CURSORS"] = env.bool(
+        "DATABASE_POOLER_TRANSACTION_MODE", default=False
+    )
+
 LOG_SQL = env.bool("LOG_SQL", default=False)
 
 QUERY_COUNT_WARNING_THRESHOLD = 25
 QUERY_DURATION_WARNING_THRESHOLD = 300  # in ms
+# Number of times the same query can be made within a request before it's
+# logged as a possible N+1.
+QUERY_REPEAT_WARNING_THRESHOLD = 5
+
+# Whether selectors exceeding their query budget should raise an exception, or
+# just log a warning, see aria.core.decorators.query_budget.
+QUERY_BUDGET_RAISE = env.bool("QUERY_BUDGET_RAISE", default=False)
+
+# Share of requests (0.0 - 1.0) to measure query count, db time, cache hits and
+# render time for, see aria.core.middleware.RequestPerformanceMiddleware. Request
+# metrics are only recorded for measured requests.
+REQUEST_PERFORMANCE_SAMPLE_RATE = env.float(
+    "REQUEST_PERFORMANCE_SAMPLE_RATE", default=1.0
+)
+# Whether to add measurements to responses as a Server-Timing header. Off by
+# default outside of debug, as the header exposes query counts and timings, and is
+# stored and replayed by CDNs along with cacheable responses.
+REQUEST_PERFORMANCE_SERVER_TIMING = env.bool(
+    "REQUEST_PERFORMANCE_SERVER_TIMING", default=DEBUG
+)
 
-if DEBUG:
-    MIDDLEWARE = ["aria.core.middleware.QueryCountWarningMiddleware"] + MIDDLEWARE
+# Token Prometheus must send as a bearer token when scraping /metrics/. The
+# endpoint is disabled if not set. Set PROMETHEUS_MULTIPROC_DIR in the environment
+# when running multiple processes, see aria.core.metrics.metrics_render.
+METRICS_AUTH_TOKEN = env.str("METRICS_AUTH_TOKEN", default="")
+# Port Celery workers serve their metrics on, as tasks run in a separate service.
+# Not served if not set.
+CELERY_METRICS_PORT = env.int("CELERY_METRICS_PORT", default=None)
 
 ###########
 # Logging #
@@ -279,6 +355,7 @@ shared_log_processors: list[Processor] = [
 
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         *shared_log_processors,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -286,7 +363,6 @@ structlog.configure(
         structlog.processors.format_exc_info,
         structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
     ],
-    context_class=structlog.threadlocal.wrap_dict(dict),
     logger_factory=structlog.stdlib.LoggerFactory(),
     wrapper_class=structlog.stdlib.BoundLogger,
     cache_logger_on_first_use=True,
@@ -404,16 +480,17 @@ DEFAULT_FROM_EMAIL = env.str("DEFAULT_FROM_EMAIL", default="")
 ##########
 
 SENTRY_DSN = env.str("SENTRY_DSN", default=None)
+SENTRY_TRACES_SAMPLE_RATE = env.float("SENTRY_TRACES_SAMPLE_RATE", default=0.1)
 
 if SENTRY_DSN is not None:
     sentry_sdk.init(
         dsn=SENTRY_DSN,
         environment=ENVIRONMENT,
         integrations=[DjangoIntegration()],
-        # Set traces_sample_rate to 1.0 to capture 100%
-        # of transactions for performance monitoring.
-        # We recommend adjusting this value in production.
-        traces_sample_rate=1.0,
+        # Share of transactions captured for performance monitoring. Latency
+        # and query counts of all requests are available as metrics, see
+        # aria.core.metrics, so only a sample of traces is needed.
+        traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE,
         # If you wish to associate users to errors (assuming you are using
         # django.contrib.auth) you may enable sending PII data.
         send_default_pii=True,
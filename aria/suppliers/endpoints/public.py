@@ -1,5 +1,6 @@
 from django.http import HttpRequest
 
+from asgiref.sync import sync_to_async
 from ninja import Router
 
 from aria.suppliers.models import Supplier
@@ -11,10 +12,12 @@ router = Router(tags=["Suppliers"])
 @router.get(
     "/", response={200: list[SupplierListOutput]}, summary="Lists all active suppliers"
 )
-def supplier_list_api(request: HttpRequest) -> tuple[int, list[SupplierListOutput]]:
+async def supplier_list_api(
+    request: HttpRequest,
+) -> tuple[int, list[SupplierListOutput]]:
     """
     Endpoint for listing all active suppliers.
     """
-    suppliers = Supplier.objects.filter(is_active=True)
+    suppliers = await sync_to_async(list)(Supplier.objects.filter(is_active=True))
 
     return 200, [SupplierListOutput.from_orm(supplier) for supplier in suppliers]
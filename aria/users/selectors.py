@@ -1,5 +1,6 @@
 from typing import Any, Optional
 
+from aria.core.replicas import use_replica
 from aria.users.filters import UserFilter
 from aria.users.models import User
 from aria.users.records import UserProfileRecord, UserRecord
@@ -61,6 +62,7 @@ def user_record(*, user: User) -> UserRecord:
     )
 
 
+@use_replica
 def user_list(
     *, filters: Optional[UserListFilters] | dict[str, Any] = None
 ) -> list[UserRecord]:
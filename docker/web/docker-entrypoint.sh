@@ -1,8 +1,18 @@
 #!/bin/bash
 set -e
 
+# Metrics of all web and worker processes are aggregated through files written to
+# this directory, which must be emptied on restarts, see aria.core.metrics.
+if [ "$1" = 'start' ] || [ "$1" = 'gunicorn' ] || [ "$1" = 'celery' ]; then
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-multiproc}"
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
+# The application served and the worker class are selected in aria.gunicorn_config,
+# e.g. by GUNICORN_WORKER_CLASS.
 if [ "$1" = 'start' ]; then
-  exec bash -c "poetry run ./bin/build && poetry run gunicorn aria.wsgi:application ${*:2}"
+  exec bash -c "poetry run ./bin/build && poetry run gunicorn --config python:aria.gunicorn_config ${*:2}"
 fi
 
 if [ "$1" = 'python' ]; then
@@ -14,7 +24,7 @@ if [ "$1" == "celery" ]; then
 fi
 
 if [ "$1" = 'gunicorn' ]; then
-    exec poetry run gunicorn aria.wsgi:application ${*:2}
+    exec poetry run gunicorn --config python:aria.gunicorn_config ${*:2}
 fi
 
 if [ "$1" = 'migrate' ]; then